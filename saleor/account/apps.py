@@ -1,16 +1,50 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save
 
 
 class AccountAppConfig(AppConfig):
     name = "saleor.account"
 
     def ready(self):
-        from .models import User
-        from .signals import delete_avatar
+        from .models import Group, User
+        from .signals import (
+            delete_avatar,
+            invalidate_jwt_user_on_commit,
+            invalidate_jwt_users_on_commit,
+        )
 
         post_delete.connect(
             delete_avatar,
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+        post_save.connect(
+            invalidate_jwt_user_on_commit,
+            sender=User,
+            dispatch_uid="invalidate_jwt_user_on_user_save",
+        )
+        post_delete.connect(
+            invalidate_jwt_user_on_commit,
+            sender=User,
+            dispatch_uid="invalidate_jwt_user_on_user_delete",
+        )
+        post_save.connect(
+            invalidate_jwt_users_on_commit,
+            sender=Group,
+            dispatch_uid="invalidate_jwt_users_on_group_save",
+        )
+        post_delete.connect(
+            invalidate_jwt_users_on_commit,
+            sender=Group,
+            dispatch_uid="invalidate_jwt_users_on_group_delete",
+        )
+        for through, name in (
+            (User.groups.through, "user_groups"),
+            (User.user_permissions.through, "user_permissions"),
+            (Group.permissions.through, "group_permissions"),
+        ):
+            m2m_changed.connect(
+                invalidate_jwt_users_on_commit,
+                sender=through,
+                dispatch_uid=f"invalidate_jwt_users_on_{name}_change",
+            )
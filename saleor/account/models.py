@@ -254,6 +254,12 @@ class User(
             ),
         ]
 
+    # Permissions cache of the authentication backend
+    _effective_permissions_cache: set[str] | None
+    # Set for users restored from the JWT user cache, which have most of the fields
+    # deferred.
+    _load_deferred_fields_at_once = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._effective_permissions = None
@@ -263,6 +269,15 @@ class User(
         # lead to leaking sensitive data in logs.
         return str(self.uuid)
 
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Load all deferred fields at once, instead of querying each field when it's
+        # accessed.
+        if self._load_deferred_fields_at_once and fields is not None:
+            deferred_fields = self.get_deferred_fields()
+            if deferred_fields.intersection(fields):
+                fields = deferred_fields.union(fields)
+        super().refresh_from_db(using, fields, from_queryset)
+
     @property
     def effective_permissions(self) -> models.QuerySet[Permission]:
         if self._effective_permissions is None:
@@ -1,6 +1,18 @@
+from django.db import transaction
+
+from ..core.jwt_cache import invalidate_jwt_user, invalidate_jwt_users
 from ..core.tasks import delete_from_storage_task
 
 
 def delete_avatar(sender, instance, **kwargs):
     if avatar := instance.avatar:
         delete_from_storage_task.delay(avatar.name)
+
+
+def invalidate_jwt_user_on_commit(sender, instance, **kwargs):
+    user_pk = instance.pk
+    transaction.on_commit(lambda: invalidate_jwt_user(user_pk))
+
+
+def invalidate_jwt_users_on_commit(sender, **kwargs):
+    transaction.on_commit(invalidate_jwt_users)
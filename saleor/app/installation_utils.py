@@ -9,7 +9,7 @@ from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.files import File
 from django.core.files.storage import default_storage
-from django.db import DatabaseError
+from django.db import DatabaseError, transaction
 from django.urls import reverse
 from requests import HTTPError, Response
 
@@ -25,6 +25,7 @@ from ..thumbnail import ICON_MIME_TYPES
 from ..thumbnail.utils import get_filename_from_url
 from ..thumbnail.validators import validate_icon_image
 from ..webhook.models import Webhook, WebhookEvent
+from ..webhook.utils import invalidate_webhook_event_map
 from .error_codes import AppErrorCode
 from .manifest_validations import clean_manifest_data
 from .models import App, AppExtension, AppInstallation
@@ -296,6 +297,7 @@ def install_app(app_installation: AppInstallation, activate: bool = False):
                 WebhookEvent(webhook=db_webhook, event_type=event_type)
             )
     WebhookEvent.objects.bulk_create(webhook_events)
+    transaction.on_commit(invalidate_webhook_event_map)
 
     _, token = app.tokens.create(name="Default token")  # type: ignore[call-arg] # calling create on a related manager # noqa: E501
 
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0034_alter_appextension_mount"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="apptoken",
+            name="token_digest",
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
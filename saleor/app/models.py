@@ -4,6 +4,7 @@ from uuid import uuid4
 
 from django.contrib.auth.hashers import make_password
 from django.db import models
+from django.utils.crypto import salted_hmac
 from django.utils.text import Truncator
 from oauthlib.common import generate_token
 
@@ -129,6 +130,14 @@ class App(ModelWithMetadata):
         return perm_value in self.get_permissions()
 
 
+APP_TOKEN_DIGEST_SALT = "saleor.app.models.AppToken"
+
+
+def get_app_token_digest(raw_token: str) -> str:
+    """Return the keyed digest of the app token, used to find it in the database."""
+    return salted_hmac(APP_TOKEN_DIGEST_SALT, raw_token, algorithm="sha256").hexdigest()
+
+
 class AppTokenManager(models.Manager["AppToken"]):
     def create(self, *, app, name="", auth_token=None, **extra_fields):  # type: ignore[override]
         """Create an app token with the given name."""
@@ -145,12 +154,14 @@ class AppToken(models.Model):
     name = models.CharField(blank=True, default="", max_length=128)
     auth_token = models.CharField(unique=True, max_length=128)
     token_last_4 = models.CharField(max_length=4)
+    token_digest = models.CharField(max_length=64, unique=True, null=True, blank=True)
 
     objects = AppTokenManager()
 
     def set_auth_token(self, raw_token=None):
         self.auth_token = make_password(raw_token)
         self.token_last_4 = raw_token[-4:]
+        self.token_digest = get_app_token_digest(raw_token)
 
 
 class AppExtension(models.Model):
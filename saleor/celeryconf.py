@@ -42,5 +42,9 @@ app.autodiscover_tasks(
     ],
     related_name="saleor3_22",
 )
+app.autodiscover_tasks(
+    packages=["saleor.product.migrations.tasks"],
+    related_name="saleor3_23",
+)
 app.autodiscover_tasks(lambda: discover_plugins_modules(settings.PLUGINS))
 app.autodiscover_tasks(related_name="search_tasks")
@@ -2,6 +2,7 @@ import logging
 from collections.abc import Iterable
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional, cast
+from uuid import UUID
 
 from django.conf import settings
 from django.db import transaction
@@ -43,6 +44,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Checkout line fields updated with the prices recalculation.
+CHECKOUT_LINE_PRICE_FIELDS = [
+    "total_price_net_amount",
+    "total_price_gross_amount",
+    "tax_rate",
+    "undiscounted_unit_price_amount",
+    "prior_unit_price_amount",
+]
+
 
 def checkout_shipping_price(
     *,
@@ -390,6 +400,8 @@ def _fetch_checkout_prices_if_expired(
         checkout_info, database_connection_name
     )
 
+    lines_prices_before = _get_lines_prices(lines)
+
     try:
         recalculate_discounts(
             checkout_info,
@@ -480,19 +492,31 @@ def _fetch_checkout_prices_if_expired(
                     update_fields=checkout_update_fields,
                     using=settings.DATABASE_CONNECTION_DEFAULT_NAME,
                 )
-                checkout_lines_bulk_update(
-                    [line_info.line for line_info in lines],
-                    [
-                        "total_price_net_amount",
-                        "total_price_gross_amount",
-                        "tax_rate",
-                        "undiscounted_unit_price_amount",
-                        "prior_unit_price_amount",
-                    ],
-                )
+                # Save only the lines with changed prices, e.g. updating a single
+                # line of a big checkout does not change prices of the other lines,
+                # unless the checkout discount is propagated on them.
+                lines_prices = _get_lines_prices(lines)
+                if lines_to_update := [
+                    line_info.line
+                    for line_info in lines
+                    if lines_prices[line_info.line.pk]
+                    != lines_prices_before.get(line_info.line.pk)
+                ]:
+                    checkout_lines_bulk_update(
+                        lines_to_update, CHECKOUT_LINE_PRICE_FIELDS
+                    )
     return checkout_info, lines
 
 
+def _get_lines_prices(lines: Iterable["CheckoutLineInfo"]) -> dict[UUID, tuple]:
+    return {
+        line_info.line.pk: tuple(
+            getattr(line_info.line, field) for field in CHECKOUT_LINE_PRICE_FIELDS
+        )
+        for line_info in lines
+    }
+
+
 @allow_writer()
 def recalculate_discounts(
     checkout_info: "CheckoutInfo",
@@ -785,15 +809,15 @@ def _set_checkout_base_prices(
 ) -> None:
     currency = checkout_info.checkout.currency
     subtotal = zero_money(currency)
+    lines_total_prices = (
+        base_calculations.get_lines_total_prices_with_propagated_checkout_discount(
+            checkout_info, lines
+        )
+    )
 
     for line_info in lines:
         line = line_info.line
-        total_price = (
-            base_calculations.get_line_total_price_with_propagated_checkout_discount(
-                checkout_info, lines, line_info
-            )
-        )
-        line_total_price = quantize_price(total_price, currency)
+        line_total_price = quantize_price(lines_total_prices[line.pk], currency)
         subtotal += line_total_price
 
         line.total_price = TaxedMoney(net=line_total_price, gross=line_total_price)
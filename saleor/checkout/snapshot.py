@@ -0,0 +1,137 @@
+import dataclasses
+import hashlib
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from ..core.utils.cache import bump_cache_version, get_cache_version
+
+if TYPE_CHECKING:
+    from .fetch import CheckoutLineInfo
+    from .models import Checkout, CheckoutLine
+
+CHECKOUT_SNAPSHOT_CATALOGUE_VERSION_KEY = "checkout-snapshot-catalogue-version"
+
+# Plugin manager events that change the catalogue data stored in the snapshots.
+CHECKOUT_SNAPSHOT_INVALIDATING_EVENTS = frozenset(
+    {
+        "channel_updated",
+        "channel_deleted",
+        "channel_status_changed",
+        "collection_updated",
+        "collection_deleted",
+        "product_updated",
+        "product_deleted",
+        "product_variant_updated",
+        "product_variant_deleted",
+        "promotion_updated",
+        "promotion_deleted",
+        "promotion_started",
+        "promotion_ended",
+        "promotion_rule_created",
+        "promotion_rule_updated",
+        "promotion_rule_deleted",
+        "translations_updated",
+        "voucher_updated",
+        "voucher_deleted",
+        "voucher_codes_deleted",
+    }
+)
+
+
+def is_checkout_snapshot_cacheable(checkout: "Checkout") -> bool:
+    """Return True when the checkout lines info can be served from the cache.
+
+    Snapshots are used only while the checkout prices are valid; expired checkouts
+    are recalculated, which changes the lines and their discounts.
+    """
+    return (
+        settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED
+        and checkout.price_expiration > timezone.now()
+    )
+
+
+def get_checkout_snapshot_catalogue_version() -> int:
+    return get_cache_version(CHECKOUT_SNAPSHOT_CATALOGUE_VERSION_KEY)
+
+
+def invalidate_checkout_snapshots():
+    """Outdate all checkout snapshots after a change in the catalogue."""
+    bump_cache_version(CHECKOUT_SNAPSHOT_CATALOGUE_VERSION_KEY)
+
+
+def generate_checkout_snapshot_cache_key(
+    checkout: "Checkout", lines: Iterable["CheckoutLine"], catalogue_version: int
+) -> str:
+    """Generate the cache key of the checkout lines snapshot.
+
+    The key changes with every save of the checkout done by mutations, as they update
+    `last_change`, with prices recalculation, and with any change of the lines.
+    """
+    version = [
+        checkout.last_change.isoformat(),
+        checkout.price_expiration.isoformat(),
+        checkout.discount_expiration.isoformat(),
+        checkout.channel_id,
+        checkout.language_code,
+        checkout.voucher_code,
+        catalogue_version,
+    ]
+    version.extend(
+        (line.pk, line.variant_id, line.quantity, line.is_gift, line.price_override)
+        for line in lines
+    )
+    hashed_version = hashlib.sha256(repr(version).encode("utf-8")).hexdigest()
+    return f"checkout-lines-snapshot-{checkout.pk}-{hashed_version}"
+
+
+def get_checkout_lines_snapshots(
+    cache_keys: dict[str, str], lines_by_checkout: dict[str, list["CheckoutLine"]]
+) -> dict[str, list["CheckoutLineInfo"]]:
+    """Return cached lines info of checkouts, by checkout token.
+
+    Cached lines are replaced with the given ones, so only the catalogue data like
+    variants, products, channel listings and discounts come from the snapshot.
+    """
+    snapshots = cache.get_many(cache_keys.values())
+    lines_info_by_checkout = {}
+    for token, cache_key in cache_keys.items():
+        snapshot = snapshots.get(cache_key)
+        if snapshot is None:
+            continue
+        line_ids, lines_info = snapshot
+        lines = lines_by_checkout[token]
+        if line_ids != [line.pk for line in lines]:
+            continue
+        for line_info, line in zip(lines_info, lines, strict=True):
+            line_info.line = line
+        lines_info_by_checkout[token] = lines_info
+    return lines_info_by_checkout
+
+
+def set_checkout_lines_snapshots(
+    checkouts: Iterable["Checkout"],
+    cache_keys: dict[str, str],
+    lines_info_by_checkout: dict[str, list["CheckoutLineInfo"]],
+):
+    now = timezone.now()
+    for checkout in checkouts:
+        cache_key = cache_keys.get(checkout.pk)
+        lines_info = lines_info_by_checkout.get(checkout.pk)
+        if not cache_key or not lines_info:
+            continue
+        timeout = min(
+            settings.CHECKOUT_SNAPSHOT_CACHE_TIMEOUT,
+            (checkout.price_expiration - now).total_seconds(),
+        )
+        if timeout <= 0:
+            continue
+        # Lines are not stored, they are always taken from the database.
+        snapshot = (
+            [line_info.line.pk for line_info in lines_info],
+            [dataclasses.replace(line_info, line=None) for line_info in lines_info],
+        )
+        cache.set(cache_key, snapshot, timeout=timeout)
@@ -16,6 +16,7 @@ from ..celeryconf import app
 from ..channel.models import Channel
 from ..checkout import CheckoutAuthorizeStatus
 from ..core.db.connection import allow_writer
+from ..core.purge import BasePurger, run_purge
 from ..core.utils import get_domain
 from ..payment.models import TransactionItem
 from ..plugins.manager import get_plugins_manager
@@ -32,15 +33,8 @@ task_logger: logging.Logger = get_task_logger(__name__)
 AUTOMATIC_COMPLETION_BATCH_SIZE = 20
 
 
-@app.task
-@allow_writer()
-def delete_expired_checkouts(
-    batch_size: int = 2000,
-    batch_count: int = 5,
-    invocation_count: int = 1,
-    invocation_limit: int = 500,
-) -> tuple[int, bool]:
-    """Delete inactive checkouts from the database.
+class ExpiredCheckoutsPurger(BasePurger):
+    """Select inactive checkouts.
 
     Inactivity is based on the "Checkout.last_change" datetime column.
 
@@ -52,84 +46,90 @@ def delete_expired_checkouts(
     - All anonymous and users checkouts after 6h of inactivity
       if there are no lines associated, refer to ``settings.EMPTY_CHECKOUTS_TIMEDELTA``.
 
-    :param batch_size: The maximum row count that can be deleted per ``DELETE FROM``
-        SQL statement. Around 13.5 KB of memory will be utilized by the Celery
-        worker per row, thus 2000 will be using around 27 MB.
-    :param batch_count: How many batches can be executed in a single task.
-        This limits how long can the task run as there may be lots of checkouts
-        to delete.
-    :param invocation_count: How many times the task re-triggered itself up.
-    :param invocation_limit: The maximum times the task can re-trigger itself up
-        in order to limit how long it may run.
-
-    :return: A tuple containing row count deleted (int)
-             and whether there is more to delete (bool).
+    Checkouts with funds in transactions are never deleted.
     """
-    now = timezone.now()
 
-    expired_anonymous_checkouts = (
-        Q(last_change__lt=now - settings.ANONYMOUS_CHECKOUTS_TIMEDELTA)
-        & Q(email__isnull=True)
-        & Q(user__isnull=True)
-    )
-    expired_user_checkout = Q(
-        last_change__lt=now - settings.USER_CHECKOUTS_TIMEDELTA
-    ) & (Q(email__isnull=False) | Q(user__isnull=False))
-    empty_checkouts = Q(last_change__lt=now - settings.EMPTY_CHECKOUTS_TIMEDELTA) & ~Q(
-        Exists(
-            # Type ignore reason: Subquery can be used inside Exists()
-            # https://github.com/typeddjango/django-stubs/issues/985
-            Subquery(  # type: ignore[arg-type]
-                CheckoutLine.objects.filter(checkout_id=OuterRef("pk"))
+    name = "checkouts"
+    model = Checkout
+    # Around 13.5 KB of memory is used by the Celery worker per deleted checkout,
+    # thus 2000 checkouts use around 27 MB.
+    initial_batch_size = 2000
+    max_batch_size = 5000
+
+    def __init__(self):
+        self.now = timezone.now()
+
+    def get_queryset(self) -> QuerySet[Checkout]:
+        now = self.now
+        expired_anonymous_checkouts = (
+            Q(last_change__lt=now - settings.ANONYMOUS_CHECKOUTS_TIMEDELTA)
+            & Q(email__isnull=True)
+            & Q(user__isnull=True)
+        )
+        expired_user_checkout = Q(
+            last_change__lt=now - settings.USER_CHECKOUTS_TIMEDELTA
+        ) & (Q(email__isnull=False) | Q(user__isnull=False))
+        empty_checkouts = Q(
+            last_change__lt=now - settings.EMPTY_CHECKOUTS_TIMEDELTA
+        ) & ~Q(
+            Exists(
+                # Type ignore reason: Subquery can be used inside Exists()
+                # https://github.com/typeddjango/django-stubs/issues/985
+                Subquery(  # type: ignore[arg-type]
+                    CheckoutLine.objects.filter(checkout_id=OuterRef("pk"))
+                )
             )
         )
-    )
 
-    with_transactions = TransactionItem.objects.filter(
-        Q(checkout_id=OuterRef("pk"))
-        & (
-            Q(authorized_value__gt=Decimal(0))
-            | Q(authorize_pending_value__gt=Decimal(0))
-            | Q(charged_value__gt=Decimal(0))
-            | Q(charge_pending_value__gt=Decimal(0))
-            | Q(refund_pending_value__gt=Decimal(0))
-            | Q(cancel_pending_value__gt=Decimal(0))
+        with_transactions = TransactionItem.objects.filter(
+            Q(checkout_id=OuterRef("pk"))
+            & (
+                Q(authorized_value__gt=Decimal(0))
+                | Q(authorize_pending_value__gt=Decimal(0))
+                | Q(charged_value__gt=Decimal(0))
+                | Q(charge_pending_value__gt=Decimal(0))
+                | Q(refund_pending_value__gt=Decimal(0))
+                | Q(cancel_pending_value__gt=Decimal(0))
+            )
         )
-    )
 
-    qs: QuerySet[Checkout] = Checkout.objects.filter(
-        (empty_checkouts | expired_anonymous_checkouts | expired_user_checkout)
-        & ~Q(Exists(with_transactions))
-    )
-    qs = qs.only("pk").order_by()[:batch_size]
+        # Checkouts are selected from the writer database, as the replica could
+        # miss a recent activity.
+        return Checkout.objects.filter(
+            (empty_checkouts | expired_anonymous_checkouts | expired_user_checkout)
+            & ~Q(Exists(with_transactions))
+        )
+
+    def delete_batch(self, pks: list) -> int:
+        return delete_checkouts(pks)
+
+
+@app.task
+@allow_writer()
+def delete_expired_checkouts(**_legacy_kwargs) -> tuple[int, bool]:
+    """Delete inactive checkouts from the database.
 
-    total_deleted: int = 0
-    has_more: bool = True
-    for _batch_number in range(batch_count):
-        checkout_ids = list(qs.values_list("pk", flat=True))
-        deleted_count = delete_checkouts(checkout_ids)
-        total_deleted += deleted_count
+    The task runs for up to ``settings.PURGE_TASK_TIME_LIMIT`` and re-enqueues itself
+    when there are still checkouts to delete; it resumes from the saved progress.
 
-        # Stop deleting inactive checkouts if there was no match.
-        if deleted_count < batch_size:
-            has_more = False
-            break
+    Keyword arguments are ignored; they are accepted for tasks queued with
+    ``batch_size``, ``batch_count``, ``invocation_count`` and ``invocation_limit``
+    before the upgrade. TODO: remove in the next release.
 
-    if total_deleted:
-        task_logger.debug("Deleted %d checkouts.", total_deleted)
+    :return: A tuple containing row count deleted (int)
+             and whether there is more to delete (bool).
+    """
+    result = run_purge(
+        ExpiredCheckoutsPurger(), time_limit=settings.PURGE_TASK_TIME_LIMIT
+    )
+    if result.deleted_count:
+        task_logger.debug("Deleted %d checkouts.", result.deleted_count)
 
+    has_more = not result.finished
     if has_more:
-        if invocation_count < invocation_limit:
-            # Continue deleting checkouts as there may be still more to delete.
-            delete_expired_checkouts.delay(
-                batch_size=batch_size,
-                batch_count=batch_count,
-                invocation_count=invocation_count + 1,
-                invocation_limit=invocation_limit,
-            )
-        else:
-            task_logger.warning("Invocation limit reached, aborting task")
-    return total_deleted, has_more
+        # Continue deleting checkouts as there may be still more to delete.
+        delete_expired_checkouts.delay()
+    return result.deleted_count, has_more
 
 
 @app.task
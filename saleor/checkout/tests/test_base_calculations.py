@@ -11,6 +11,8 @@ from ..base_calculations import (
     calculate_base_line_total_price,
     calculate_base_line_unit_price,
     checkout_total,
+    get_line_total_price_with_propagated_checkout_discount,
+    get_lines_total_prices_with_propagated_checkout_discount,
 )
 from ..fetch import fetch_checkout_info, fetch_checkout_lines
 
@@ -850,3 +852,58 @@ def test_checkout_total_gift_promotion(
         net * checkout.lines.first().quantity + shipping_channel_listings.price
     )
     assert total == expected_price
+
+
+def test_get_lines_total_prices_with_propagated_checkout_discount(
+    checkout_with_items, voucher
+):
+    # given
+    checkout = checkout_with_items
+    checkout.voucher_code = voucher.code
+    checkout.discount = Money("10.00", checkout.currency)
+    checkout.save(update_fields=["voucher_code", "discount_amount"])
+
+    lines, _ = fetch_checkout_lines(checkout)
+    manager = get_plugins_manager(allow_replica=False)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    lines_total_prices = get_lines_total_prices_with_propagated_checkout_discount(
+        checkout_info, lines
+    )
+
+    # then
+    assert lines_total_prices == {
+        line_info.line.pk: get_line_total_price_with_propagated_checkout_discount(
+            checkout_info, lines, line_info
+        )
+        for line_info in lines
+    }
+    assert (
+        sum(lines_total_prices.values(), Money(0, checkout.currency))
+        == sum(
+            (calculate_base_line_total_price(line_info) for line_info in lines),
+            Money(0, checkout.currency),
+        )
+        - checkout.discount
+    )
+
+
+def test_get_lines_total_prices_with_propagated_checkout_discount_no_discount(
+    checkout_with_items,
+):
+    # given
+    lines, _ = fetch_checkout_lines(checkout_with_items)
+    manager = get_plugins_manager(allow_replica=False)
+    checkout_info = fetch_checkout_info(checkout_with_items, lines, manager)
+
+    # when
+    lines_total_prices = get_lines_total_prices_with_propagated_checkout_discount(
+        checkout_info, lines
+    )
+
+    # then
+    assert lines_total_prices == {
+        line_info.line.pk: calculate_base_line_total_price(line_info)
+        for line_info in lines
+    }
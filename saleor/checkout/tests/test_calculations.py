@@ -570,6 +570,49 @@ def test_set_checkout_base_prices_no_charge_taxes_with_order_promotion(
     assert checkout.total_gross_amount == line_total
 
 
+@patch("saleor.checkout.utils.checkout_lines_bulk_update")
+def test_fetch_checkout_data_saves_only_lines_with_changed_prices(
+    mocked_checkout_lines_bulk_update, checkout_with_items, plugins_manager
+):
+    # given
+    checkout = checkout_with_items
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, plugins_manager)
+    fetch_checkout_data(checkout_info, plugins_manager, lines, force_update=True)
+    mocked_checkout_lines_bulk_update.reset_mock()
+
+    updated_line = lines[0].line
+    updated_line.quantity += 1
+    updated_line.save(update_fields=["quantity"])
+
+    # when
+    fetch_checkout_data(checkout_info, plugins_manager, lines, force_update=True)
+
+    # then
+    mocked_checkout_lines_bulk_update.assert_called_once()
+    assert mocked_checkout_lines_bulk_update.call_args.args[0] == [updated_line]
+
+
+@patch("saleor.checkout.utils.checkout_lines_bulk_update")
+def test_fetch_checkout_data_skips_saving_lines_with_unchanged_prices(
+    mocked_checkout_lines_bulk_update, checkout_with_items, plugins_manager
+):
+    # given
+    checkout = checkout_with_items
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, plugins_manager)
+    fetch_checkout_data(checkout_info, plugins_manager, lines, force_update=True)
+    mocked_checkout_lines_bulk_update.reset_mock()
+
+    # when
+    fetch_checkout_data(checkout_info, plugins_manager, lines, force_update=True)
+
+    # then
+    mocked_checkout_lines_bulk_update.assert_not_called()
+    checkout.refresh_from_db()
+    assert checkout.price_expiration > timezone.now()
+
+
 @freeze_time("2020-12-12 12:00:00")
 def test_fetch_checkout_data_webhooks_success(
     plugins_manager,
@@ -0,0 +1,139 @@
+import datetime
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from ..fetch import fetch_checkout_lines
+from ..snapshot import (
+    CHECKOUT_SNAPSHOT_CATALOGUE_VERSION_KEY,
+    generate_checkout_snapshot_cache_key,
+    get_checkout_lines_snapshots,
+    get_checkout_snapshot_catalogue_version,
+    invalidate_checkout_snapshots,
+    is_checkout_snapshot_cacheable,
+    set_checkout_lines_snapshots,
+)
+
+
+def test_is_checkout_snapshot_cacheable(checkout, settings):
+    # given
+    settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED = True
+    checkout.price_expiration = timezone.now() + datetime.timedelta(minutes=5)
+
+    # when & then
+    assert is_checkout_snapshot_cacheable(checkout)
+
+
+def test_is_checkout_snapshot_cacheable_expired_prices(checkout, settings):
+    # given
+    settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED = True
+    checkout.price_expiration = timezone.now() - datetime.timedelta(minutes=5)
+
+    # when & then
+    assert not is_checkout_snapshot_cacheable(checkout)
+
+
+def test_is_checkout_snapshot_cacheable_disabled(checkout, settings):
+    # given
+    settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED = False
+    checkout.price_expiration = timezone.now() + datetime.timedelta(minutes=5)
+
+    # when & then
+    assert not is_checkout_snapshot_cacheable(checkout)
+
+
+def test_generate_checkout_snapshot_cache_key_changes_with_lines(
+    checkout_with_items,
+):
+    # given
+    lines = list(checkout_with_items.lines.all())
+    cache_key = generate_checkout_snapshot_cache_key(checkout_with_items, lines, 1)
+
+    # when
+    lines[0].quantity += 1
+
+    # then
+    assert cache_key != generate_checkout_snapshot_cache_key(
+        checkout_with_items, lines, 1
+    )
+    assert cache_key != generate_checkout_snapshot_cache_key(
+        checkout_with_items, lines[1:], 1
+    )
+
+
+def test_generate_checkout_snapshot_cache_key_changes_with_checkout_save(
+    checkout_with_items,
+):
+    # given
+    lines = list(checkout_with_items.lines.all())
+    cache_key = generate_checkout_snapshot_cache_key(checkout_with_items, lines, 1)
+
+    # when
+    checkout_with_items.save(update_fields=["last_change"])
+
+    # then
+    assert cache_key != generate_checkout_snapshot_cache_key(
+        checkout_with_items, lines, 1
+    )
+
+
+def test_invalidate_checkout_snapshots():
+    # given
+    version = get_checkout_snapshot_catalogue_version()
+
+    # when
+    invalidate_checkout_snapshots()
+
+    # then
+    assert get_checkout_snapshot_catalogue_version() == version + 1
+
+
+def test_invalidate_checkout_snapshots_missing_version():
+    # given
+    version = get_checkout_snapshot_catalogue_version()
+    cache.delete(CHECKOUT_SNAPSHOT_CATALOGUE_VERSION_KEY)
+
+    # when
+    invalidate_checkout_snapshots()
+
+    # then
+    assert get_checkout_snapshot_catalogue_version() > version + 1
+
+
+def test_get_checkout_lines_snapshots_uses_given_lines(checkout_with_items):
+    # given
+    checkout = checkout_with_items
+    checkout.price_expiration = timezone.now() + datetime.timedelta(minutes=5)
+    lines_info, _ = fetch_checkout_lines(checkout)
+    lines = [line_info.line for line_info in lines_info]
+    cache_keys = {checkout.pk: generate_checkout_snapshot_cache_key(checkout, lines, 1)}
+    set_checkout_lines_snapshots([checkout], cache_keys, {checkout.pk: lines_info})
+
+    # when
+    snapshots = get_checkout_lines_snapshots(cache_keys, {checkout.pk: lines})
+
+    # then
+    cached_lines_info = snapshots[checkout.pk]
+    assert [line_info.line for line_info in cached_lines_info] == lines
+    assert all(
+        cached.line is line
+        for cached, line in zip(cached_lines_info, lines, strict=True)
+    )
+    assert [line_info.variant for line_info in cached_lines_info] == [
+        line_info.variant for line_info in lines_info
+    ]
+
+
+def test_set_checkout_lines_snapshots_skips_expired_prices(checkout_with_items):
+    # given
+    checkout = checkout_with_items
+    checkout.price_expiration = timezone.now() - datetime.timedelta(minutes=5)
+    lines_info, _ = fetch_checkout_lines(checkout)
+    lines = [line_info.line for line_info in lines_info]
+    cache_keys = {checkout.pk: generate_checkout_snapshot_cache_key(checkout, lines, 1)}
+
+    # when
+    set_checkout_lines_snapshots([checkout], cache_keys, {checkout.pk: lines_info})
+
+    # then
+    assert get_checkout_lines_snapshots(cache_keys, {checkout.pk: lines}) == {}
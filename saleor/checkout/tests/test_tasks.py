@@ -10,12 +10,14 @@ from django.utils import timezone
 from freezegun import freeze_time
 
 from ...channel.models import Channel
+from ...core.purge import reset_purge_progress
 from ...order import OrderEvents
 from ...order.models import Order
 from ...product.models import ProductChannelListing, ProductVariantChannelListing
 from .. import CheckoutAuthorizeStatus
 from ..models import Checkout, CheckoutLine
 from ..tasks import (
+    ExpiredCheckoutsPurger,
     automatic_checkout_completion_task,
     delete_expired_checkouts,
     task_logger,
@@ -23,6 +25,12 @@ from ..tasks import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_expired_checkouts_purge_progress():
+    yield
+    reset_purge_progress(ExpiredCheckoutsPurger.name)
+
+
 def test_delete_expired_anonymous_checkouts(checkouts_list, variant, customer_user):
     # given
     now = timezone.now()
@@ -280,6 +288,22 @@ def test_delete_empty_checkouts(checkouts_list, customer_user, variant):
     assert Checkout.objects.count() == checkout_count - 2
 
 
+def test_delete_expired_checkouts_ignores_legacy_kwargs(checkouts_list):
+    # given
+    checkout = checkouts_list[0]
+    checkout.last_change = timezone.now() - datetime.timedelta(days=40)
+    checkout.save(update_fields=["last_change"])
+
+    # when
+    delete_expired_checkouts(
+        batch_size=2000, batch_count=5, invocation_count=1, invocation_limit=500
+    )
+
+    # then
+    with pytest.raises(Checkout.DoesNotExist):
+        checkout.refresh_from_db()
+
+
 def test_delete_expired_checkouts(checkouts_list, customer_user, variant):
     # given
     now = timezone.now()
@@ -480,25 +504,29 @@ def test_delete_expired_checkouts_no_checkouts_to_delete(checkout):
     assert Checkout.objects.count() == checkout_count
 
 
+@mock.patch.object(ExpiredCheckoutsPurger, "min_batch_size", 1)
+@mock.patch.object(ExpiredCheckoutsPurger, "initial_batch_size", 2)
 @mock.patch("saleor.checkout.tasks.delete_expired_checkouts.delay")
-def test_delete_checkouts_until_done(mocked_task: mock.MagicMock, channel_USD):
+def test_delete_checkouts_until_done(
+    mocked_task: mock.MagicMock, channel_USD, settings
+):
     """Ensure the task deletes all inactive checkouts from the database.
 
     Given the settings:
-    - Max 2 inactive checkouts to delete per single ``DELETE FROM`` SQL statement
-    - A maximum of 3 ``DELETE FROM`` SQL statements may be run per task (totalling
-      to a max 6 inactivate checkout/task).
+    - 2 inactive checkouts deleted by the first ``DELETE FROM`` SQL statement
+    - Every task stops after a single statement, as the time limit is 0
 
     Database data:
     - 7 inactive checkouts
 
     The expected flow is:
-    1. Deletes 2 checkouts three times (three SQL statement expected)
-    2. Triggers a new task due to having still inactive checkouts left to be
-       deleted (1 checkout left).
+    1. Deletes 2 checkouts and triggers a new task.
+    2. Resumes from the saved progress, deletes 4 checkouts, as the batch size
+       is doubled after a fast delete, and triggers a new task.
+    3. Deletes the last checkout and doesn't trigger any task.
     """
-
-    # Create 7 empty checkouts in DB
+    # given
+    settings.PURGE_TASK_TIME_LIMIT = 0
     Checkout.objects.bulk_create(
         [
             Checkout(
@@ -511,87 +539,33 @@ def test_delete_checkouts_until_done(mocked_task: mock.MagicMock, channel_USD):
     )
     Checkout.objects.update(last_change=timezone.now() - datetime.timedelta(hours=7))
 
-    task_params = {
-        "batch_size": 2,
-        "batch_count": 3,
-        "invocation_limit": 10,
-    }
-    mocked_task.assert_not_called()
+    # when
+    deleted_count, has_more = delete_expired_checkouts()
 
-    # Delete inactive checkouts.
-    deleted_count, has_more = delete_expired_checkouts(
-        **task_params, invocation_count=1
-    )
-    assert deleted_count == 6
+    # then
+    assert deleted_count == 2
     assert has_more is True
-    assert Checkout.objects.count() == 1, (
-        "Should have deleted 6 checkouts thus only 1 should be left"
-    )
-
-    # Should have triggered a new task to delete more checkouts
-    mocked_task.assert_called_once_with(**task_params, invocation_count=2)
+    assert Checkout.objects.count() == 5
+    mocked_task.assert_called_once_with()
     mocked_task.reset_mock()
 
-    # Ensure we delete the remaining, and we do not trigger anymore task.
-    deleted_count, has_more = delete_expired_checkouts(
-        **task_params, invocation_count=2
-    )
-    assert deleted_count == 1
-    assert has_more is False
-    assert Checkout.objects.count() == 0, (
-        "Should have deleted the last remaining checkout (one)"
-    )
-
-    # Shouldn't have triggered a new task as nothing is left to be deleted.
-    mocked_task.assert_not_called()
-
-
-@mock.patch("saleor.checkout.tasks.delete_expired_checkouts.delay")
-def test_aborts_deleting_checkouts_when_invocation_count_exhausted(
-    mocked_task: mock.MagicMock, channel_USD
-):
-    """Ensure the Celery task stops triggering tasks when the invocation limit is reached."""
-
-    # Create 3 empty checkouts in DB
-    Checkout.objects.bulk_create(
-        [
-            Checkout(
-                currency=channel_USD.currency_code,
-                channel=channel_USD,
-                token=UUID(int=checkout_id),
-            )
-            for checkout_id in range(3)
-        ]
-    )
-    Checkout.objects.update(last_change=timezone.now() - datetime.timedelta(hours=7))
-
-    mocked_task.assert_not_called()
-    task_params = {
-        "batch_size": 1,
-        "batch_count": 1,
-        "invocation_limit": 2,
-    }
+    # when
+    deleted_count, has_more = delete_expired_checkouts()
 
-    # Invocation #1, should delete 1 checkout
-    deleted_count, has_more = delete_expired_checkouts(
-        **task_params, invocation_count=1
-    )
-    assert deleted_count == 1
+    # then
+    assert deleted_count == 4
     assert has_more is True
-
-    # Should have triggered a new task to delete more checkouts
-    mocked_task.assert_called_once_with(**task_params, invocation_count=2)
+    assert Checkout.objects.count() == 1
+    mocked_task.assert_called_once_with()
     mocked_task.reset_mock()
 
-    # Invocation #2, should delete 1 checkout and should stop there (has_more=True
-    # & no more task.delay()).
-    deleted_count, has_more = delete_expired_checkouts(
-        **task_params, invocation_count=2
-    )
-    assert deleted_count == 1
-    assert has_more is True
+    # when
+    deleted_count, has_more = delete_expired_checkouts()
 
-    # Should have stopped there
+    # then
+    assert deleted_count == 1
+    assert has_more is False
+    assert Checkout.objects.count() == 0
     mocked_task.assert_not_called()
 
 
@@ -17,6 +17,7 @@ class CoreAppConfig(AppConfig):
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
         self.validate_jwt_manager()
+        self.load_persisted_queries_manifest()
 
     def validate_jwt_manager(self) -> None:
         jwt_manager_path = getattr(settings, "JWT_MANAGER_PATH", None)
@@ -35,3 +36,8 @@ class CoreAppConfig(AppConfig):
         if validate_method is None:
             return
         validate_method()
+
+    def load_persisted_queries_manifest(self) -> None:
+        from ..graphql.persisted_queries import load_persisted_queries_manifest
+
+        load_persisted_queries_manifest()
@@ -17,6 +17,7 @@ from .jwt import (
     is_saleor_token,
     jwt_decode,
 )
+from .jwt_cache import get_user_from_payload_cached, set_token_permissions
 
 
 # Moved from `django.contrib.auth.backends.ModelBackend`
@@ -134,7 +135,10 @@ def load_user_from_request(request):
         )
     permissions = payload.get(PERMISSIONS_FIELD, None)
 
-    user = UserByEmailLoader(request).load(payload["email"]).get()
+    if settings.JWT_USER_CACHE_ENABLED:
+        user = get_user_from_payload_cached(payload)
+    else:
+        user = UserByEmailLoader(request).load(payload["email"]).get()
     user_jwt_token = payload.get("token")
     if not user_jwt_token:
         raise jwt.InvalidTokenError(
@@ -150,10 +154,13 @@ def load_user_from_request(request):
         )
 
     if permissions is not None:
-        token_permissions = get_permissions_from_names(permissions)
-        token_codenames = [perm.codename for perm in token_permissions]
-        user.effective_permissions = get_permissions_from_codenames(token_codenames)
-        user.is_staff = True if user.effective_permissions else False
+        if settings.JWT_USER_CACHE_ENABLED:
+            set_token_permissions(user, permissions)
+        else:
+            token_permissions = get_permissions_from_names(permissions)
+            token_codenames = [perm.codename for perm in token_permissions]
+            user.effective_permissions = get_permissions_from_codenames(token_codenames)
+            user.is_staff = True if user.effective_permissions else False
 
     if payload.get("is_staff"):
         user.is_staff = True
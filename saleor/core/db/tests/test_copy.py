@@ -0,0 +1,34 @@
+import pytest
+
+from ....discount.models import OrderDiscount
+from ....order.models import OrderEvent
+from ..copy import copy_insert
+
+
+def test_copy_insert(order):
+    # given
+    discounts = [
+        OrderDiscount(order=order, value=10, reason="first"),
+        OrderDiscount(order=order, value=20, reason="second"),
+    ]
+
+    # when
+    copy_insert(OrderDiscount, discounts)
+
+    # then
+    saved_discounts = OrderDiscount.objects.filter(order=order).order_by("value")
+    assert [(d.pk, d.reason) for d in saved_discounts] == [
+        (discounts[0].pk, "first"),
+        (discounts[1].pk, "second"),
+    ]
+    assert all(discount.created_at for discount in saved_discounts)
+    assert not discounts[0]._state.adding
+
+
+def test_copy_insert_model_with_generated_primary_key(order):
+    # when
+    with pytest.raises(ValueError, match="Can't insert"):
+        copy_insert(OrderEvent, [OrderEvent(order=order)])
+
+    # then
+    assert not OrderEvent.objects.filter(order=order).exists()
@@ -14,6 +14,7 @@ from ..permission.enums import (
     get_permissions_from_names,
 )
 from ..permission.models import Permission
+from .jwt_cache import get_user_from_payload_cached, set_token_permissions
 from .jwt_manager import get_jwt_manager
 
 JWT_ACCESS_TYPE = "access"
@@ -113,8 +114,10 @@ def create_refresh_token(
 
 
 def get_user_from_payload(payload: dict[str, Any], request=None) -> User | None:
-    # TODO: dataloader
-    user = User.objects.filter(email=payload["email"], is_active=True).first()
+    if settings.JWT_USER_CACHE_ENABLED:
+        user = get_user_from_payload_cached(payload)
+    else:
+        user = User.objects.filter(email=payload["email"], is_active=True).first()
     user_jwt_token = payload.get("token")
     if not user_jwt_token or not user:
         raise jwt.InvalidTokenError(
@@ -148,7 +151,9 @@ def get_user_from_access_payload(payload: dict, request=None) -> User | None:
     permissions = payload.get(PERMISSIONS_FIELD, None)
     user = get_user_from_payload(payload, request)
     if user:
-        if permissions is not None:
+        if permissions is not None and settings.JWT_USER_CACHE_ENABLED:
+            set_token_permissions(user, permissions)
+        elif permissions is not None:
             token_permissions = get_permissions_from_names(permissions)
             token_codenames = [perm.codename for perm in token_permissions]
             user.effective_permissions = get_permissions_from_codenames(token_codenames)
@@ -0,0 +1,187 @@
+import binascii
+from collections.abc import Iterable
+from typing import Any
+
+import graphene
+from django.conf import settings
+from django.core.cache import cache
+
+from ..account.models import User
+from ..permission.enums import (
+    get_permissions_enum_dict,
+    get_permissions_from_codenames,
+    split_permission_codename,
+)
+from .db.connection import allow_writer
+from .utils.cache import bump_cache_version, get_cache_version
+
+JWT_USER_CACHE_VERSION_KEY = "jwt-user-cache-version"
+JWT_USER_CACHE_KEY_PREFIX = "jwt-user"
+
+# Fields of the user stored in the cache. Has to include the fields checked when
+# authenticating the user and checking its permissions.
+CACHED_USER_FIELDS = (
+    "id",
+    "email",
+    "jwt_token_key",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+)
+
+
+def get_jwt_user_cache_key(user_pk: int) -> str:
+    return f"{JWT_USER_CACHE_KEY_PREFIX}:{user_pk}"
+
+
+def get_jwt_user_version_key(user_pk: int) -> str:
+    return f"{JWT_USER_CACHE_KEY_PREFIX}-version:{user_pk}"
+
+
+def invalidate_jwt_user(user_pk: int):
+    """Outdate the cached user, so the next request fetches it from the database."""
+    invalidate_jwt_users_by_pks([user_pk])
+
+
+def invalidate_jwt_users_by_pks(user_pks: Iterable[int]):
+    """Outdate the cached users, e.g. after a queryset update that sends no signals.
+
+    The version of each user is bumped instead of deleting the cached entry, so a
+    request that fetched the user before the change can't cache it again.
+    """
+    if not settings.JWT_USER_CACHE_ENABLED:
+        return
+    for user_pk in user_pks:
+        bump_cache_version(
+            get_jwt_user_version_key(user_pk), timeout=settings.JWT_USER_CACHE_TIMEOUT
+        )
+
+
+def invalidate_jwt_users():
+    """Invalidate all cached users, e.g. after permission groups change.
+
+    Should be called after the transaction that changes the data is committed.
+    """
+    if not settings.JWT_USER_CACHE_ENABLED:
+        return
+    bump_cache_version(JWT_USER_CACHE_VERSION_KEY)
+
+
+def _get_user_pk_from_payload(payload: dict) -> int | None:
+    global_id = payload.get("user_id")
+    if not global_id:
+        return None
+    try:
+        type_, id_ = graphene.Node.from_global_id(global_id)
+        return int(id_) if type_ == "User" else None
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+def _fetch_user_data_with_permissions(
+    user_pk: int,
+) -> tuple[dict[str, Any] | None, frozenset[str]]:
+    # The user is read from the writer, as the replica could still return the data
+    # from before the change that invalidated the cache.
+    with allow_writer():
+        user = (
+            User.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+            .only(*CACHED_USER_FIELDS)
+            .filter(pk=user_pk)
+            .first()
+        )
+        if user is None:
+            return None, frozenset()
+        user_data = {field: getattr(user, field) for field in CACHED_USER_FIELDS}
+        if not user.is_active:
+            return user_data, frozenset()
+        permissions = (
+            user.effective_permissions.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+            .values_list("content_type__app_label", "codename")
+            .order_by()
+        )
+        effective_permissions = frozenset(f"{ct}.{name}" for ct, name in permissions)
+    return user_data, effective_permissions
+
+
+def _get_user_from_data(user_data: dict[str, Any]) -> User:
+    """Return the user with the cached fields; other fields are loaded on access.
+
+    Deferred fields are loaded from the replica, like users authenticated without
+    the cache.
+    """
+    field_names = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in user_data
+    ]
+    user = User.from_db(
+        settings.DATABASE_CONNECTION_REPLICA_NAME,
+        field_names,
+        [user_data[field_name] for field_name in field_names],
+    )
+    user._load_deferred_fields_at_once = True
+    return user
+
+
+def get_user_from_payload_cached(payload: dict) -> User | None:
+    """Return the active user with the email from the token payload.
+
+    Only the fields needed to authenticate the user are cached, together with its
+    effective permissions, which are set as the permission cache of the
+    authentication backend, so authenticating requests of the same user doesn't
+    query the database. Other fields of the user are loaded when accessed.
+    """
+    email = payload["email"]
+    user_pk = _get_user_pk_from_payload(payload)
+    if user_pk is None:
+        return User.objects.filter(email=email, is_active=True).first()
+
+    key = get_jwt_user_cache_key(user_pk)
+    user_version_key = get_jwt_user_version_key(user_pk)
+    cached_values = cache.get_many([JWT_USER_CACHE_VERSION_KEY, user_version_key, key])
+    global_version = cached_values.get(JWT_USER_CACHE_VERSION_KEY)
+    if global_version is None:
+        global_version = get_cache_version(JWT_USER_CACHE_VERSION_KEY)
+    user_version = cached_values.get(user_version_key)
+    if user_version is None:
+        user_version = get_cache_version(
+            user_version_key, timeout=settings.JWT_USER_CACHE_TIMEOUT
+        )
+    version = (global_version, user_version)
+    cached_user = cached_values.get(key)
+    if cached_user is None or cached_user[0] != version:
+        user_data, permissions = _fetch_user_data_with_permissions(user_pk)
+        # Stored with the versions read before fetching the user, so the entry is
+        # outdated if the user changed in the meantime.
+        cache.set(
+            key,
+            (version, user_data, permissions),
+            timeout=settings.JWT_USER_CACHE_TIMEOUT,
+        )
+    else:
+        _, user_data, permissions = cached_user
+
+    if user_data is None or not user_data["is_active"] or user_data["email"] != email:
+        return None
+    user = _get_user_from_data(user_data)
+    user._effective_permissions_cache = set(permissions)
+    return user
+
+
+def set_token_permissions(user: User, permission_names: list[str]):
+    """Limit permissions of the user to the ones granted by the token.
+
+    Permission names are resolved from the permission enums instead of the database.
+    """
+    permission_enums = get_permissions_enum_dict()
+    permissions = {
+        permission_enums[name].value
+        for name in permission_names
+        if name in permission_enums
+    }
+    user.effective_permissions = get_permissions_from_codenames(
+        split_permission_codename(permissions)
+    )
+    user._effective_permissions_cache = permissions
+    user.is_staff = bool(permissions)
@@ -0,0 +1,75 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from ....graphql.core.enums import ErrorPolicy
+from ....graphql.order.bulk_mutations.order_bulk_import import (
+    DEFAULT_CHUNK_SIZE,
+    import_orders,
+)
+from ....order import StockUpdatePolicy
+from ...db.connection import allow_writer
+
+
+class Command(BaseCommand):
+    help = (
+        "Import orders from an NDJSON file with one orderBulkCreate input per line. "
+        "Orders are validated and saved in chunks, each in a separate transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path", help="Path of the NDJSON file, or `-` to read standard input."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Number of orders saved in a single transaction.",
+        )
+        parser.add_argument(
+            "--error-policy",
+            choices=[choice for choice, _ in ErrorPolicy.CHOICES],
+            default=ErrorPolicy.REJECT_FAILED_ROWS,
+            help="Policy of error handling, applied to each chunk.",
+        )
+        parser.add_argument(
+            "--stock-update-policy",
+            choices=[choice for choice, _ in StockUpdatePolicy.CHOICES],
+            default=StockUpdatePolicy.UPDATE,
+            help="Determine how stocks are updated while importing orders.",
+        )
+
+    def handle(self, *args, **options):
+        if options["path"] == "-":
+            self.import_orders(sys.stdin, options)
+        else:
+            with open(options["path"], encoding="utf-8") as lines:
+                self.import_orders(lines, options)
+
+    def import_orders(self, lines, options):
+        created_count = failed_count = 0
+        with allow_writer():
+            for result in import_orders(
+                lines,
+                chunk_size=options["chunk_size"],
+                error_policy=options["error_policy"],
+                stock_update_policy=options["stock_update_policy"],
+            ):
+                failed_lines = {line_number for line_number, _ in result.errors}
+                created_count += result.created_count
+                failed_count += len(failed_lines)
+                self.stdout.write(
+                    f"Lines {result.first_line}-{result.last_line}: "
+                    f"{result.created_count} orders created, "
+                    f"{len(failed_lines)} with errors."
+                )
+                for line_number, error in result.errors:
+                    path = f" ({error.path})" if error.path else ""
+                    code = f" [{error.code.value}]" if error.code else ""
+                    self.stderr.write(
+                        f"Line {line_number}{path}: {error.message}{code}"
+                    )
+        self.stdout.write(
+            f"Imported {created_count} orders, {failed_count} orders with errors."
+        )
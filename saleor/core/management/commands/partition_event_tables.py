@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...db.connection import allow_writer
+from ...partitioning import partition_event_tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert event payload, delivery and delivery attempt tables into tables "
+        "partitioned by creation day. Existing rows are kept in the legacy partitions "
+        "and are dropped once they are older than EVENT_PAYLOAD_DELETE_PERIOD. "
+        "The tables are scanned first without blocking writes; the command must "
+        "finish before midnight UTC, as rows created later are rejected until then."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.EVENT_PARTITIONS_PREMAKE_DAYS,
+            help="Number of future daily partitions to create.",
+        )
+
+    def handle(self, *args, **options):
+        with allow_writer():
+            tables = partition_event_tables(options["days"])
+        if not tables:
+            self.stdout.write("Event tables are already partitioned.")
+            return
+        self.stdout.write(
+            self.style.SUCCESS(f"Partitioned tables: {', '.join(tables)}.")
+        )
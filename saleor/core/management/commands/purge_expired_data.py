@@ -0,0 +1,62 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ....checkout.tasks import ExpiredCheckoutsPurger
+from ....order.tasks import ExpiredOrdersPurger
+from ...db.connection import allow_writer
+from ...purge import reset_purge_progress, run_purge
+from ...tasks import EventPayloadsPurger
+
+PURGERS = {
+    purger.name: purger
+    for purger in (ExpiredCheckoutsPurger, ExpiredOrdersPurger, EventPayloadsPurger)
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired checkouts, orders and event payloads. "
+        "Deletion resumes from the progress saved by previous runs and tasks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "purgers",
+            nargs="*",
+            help=f"Names of data to delete: {', '.join(PURGERS)}; all by default.",
+        )
+        parser.add_argument(
+            "--time-limit",
+            type=float,
+            default=sys.maxsize,
+            help="Maximum number of seconds spent on each purge.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of rows deleted in the first batch.",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Discard the saved progress and start from the beginning.",
+        )
+
+    def handle(self, *args, **options):
+        names = options["purgers"] or list(PURGERS)
+        if unknown_names := set(names) - set(PURGERS):
+            raise CommandError(f"Unknown purges: {', '.join(sorted(unknown_names))}.")
+        for name in names:
+            if options["reset"]:
+                reset_purge_progress(name)
+            with allow_writer():
+                result = run_purge(
+                    PURGERS[name](),
+                    time_limit=options["time_limit"],
+                    batch_size=options["batch_size"],
+                )
+            status = "finished" if result.finished else "time limit reached"
+            self.stdout.write(
+                f"Deleted {result.deleted_count} rows of {name} ({status})."
+            )
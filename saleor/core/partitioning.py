@@ -0,0 +1,331 @@
+"""Range partitioning of the event tables by the `created_at` column.
+
+Partitioning is optional and is enabled by the `partition_event_tables` command.
+Partitioned tables have one partition per day, named after the first day it stores,
+and the `legacy` partition with all rows created before the conversion.
+
+Partitioned tables have no primary key nor foreign keys between each other, as
+PostgreSQL requires them to include the partition column. Every partition has its
+own primary key on `id`, and ids of all partitions come from a single sequence.
+Related rows are still deleted by the ORM, and expired partitions are dropped as a
+whole by the retention task.
+
+There is no DEFAULT partition, so rows can only be inserted into the partitions
+created in advance by `create_event_partitions_task`. If the task doesn't run for
+`EVENT_PARTITIONS_PREMAKE_DAYS`, inserts of event payloads and deliveries fail, and
+so does sending every webhook.
+"""
+
+import datetime
+import logging
+import re
+
+from django.db import connection, transaction
+from django.db.models import ForeignKey, Model
+from django.utils import timezone
+
+from .models import EventDelivery, EventDeliveryAttempt, EventPayload
+
+logger = logging.getLogger(__name__)
+
+# Tables are ordered from the referencing ones, so deleting partitions in this order
+# never leaves rows referencing already dropped ones for longer than needed.
+PARTITIONED_EVENT_MODELS: list[type[Model]] = [
+    EventDeliveryAttempt,
+    EventDelivery,
+    EventPayload,
+]
+
+PARTITION_INTERVAL = datetime.timedelta(days=1)
+LEGACY_PARTITION_SUFFIX = "legacy"
+
+_PARTITION_UPPER_BOUND_RE = re.compile(r"TO \('([^']+)'\)")
+
+
+def _quote(name: str) -> str:
+    return connection.ops.quote_name(name)
+
+
+def get_partition_name(table: str, start: datetime.datetime) -> str:
+    return f"{table}_p{start:%Y%m%d}"
+
+
+def get_partitioned_tables() -> set[str]:
+    """Return names of the event tables that are partitioned."""
+    tables = [model._meta.db_table for model in PARTITIONED_EVENT_MODELS]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname
+            FROM pg_partitioned_table p
+            JOIN pg_class c ON c.oid = p.partrelid
+            WHERE c.relname = ANY(%s) AND pg_table_is_visible(c.oid)
+            """,
+            [tables],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def get_partitions(table: str) -> dict[str, datetime.datetime | None]:
+    """Return partitions of the table with their exclusive upper bounds."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)
+            """,
+            [table],
+        )
+        partitions = {}
+        for name, bound in cursor.fetchall():
+            match = _PARTITION_UPPER_BOUND_RE.search(bound)
+            partitions[name] = (
+                datetime.datetime.fromisoformat(match.group(1)) if match else None
+            )
+        return partitions
+
+
+def _get_day_start(value: datetime.datetime) -> datetime.datetime:
+    return value.astimezone(datetime.UTC).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def create_partitions(table: str, start: datetime.datetime, count: int) -> list[str]:
+    """Create daily partitions starting from the day of `start`.
+
+    Existing partitions are skipped. Return names of the created partitions.
+    """
+    existing_partitions = get_partitions(table)
+    day_start = _get_day_start(start)
+    created = []
+    with connection.cursor() as cursor:
+        for _ in range(count):
+            name = get_partition_name(table, day_start)
+            day_end = day_start + PARTITION_INTERVAL
+            if name not in existing_partitions:
+                cursor.execute(
+                    f"CREATE TABLE {_quote(name)} PARTITION OF {_quote(table)} "
+                    "FOR VALUES FROM (%s) TO (%s)",
+                    [day_start, day_end],
+                )
+                cursor.execute(f"ALTER TABLE {_quote(name)} ADD PRIMARY KEY (id)")
+                created.append(name)
+            day_start = day_end
+    return created
+
+
+def get_expired_partitions(table: str, cutoff: datetime.datetime) -> list[str]:
+    """Return partitions with rows created only before the cutoff."""
+    return sorted(
+        name
+        for name, upper_bound in get_partitions(table).items()
+        if upper_bound is not None and upper_bound <= cutoff
+    )
+
+
+def get_partition_payload_files(partition: str) -> list[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT payload_file FROM {_quote(partition)} "
+            "WHERE payload_file IS NOT NULL AND payload_file != ''"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _is_detach_pending(partition: str) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT pg_inherits.inhdetachpending
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE child.relname = %s AND pg_table_is_visible(child.oid)
+            """,
+            [partition],
+        )
+        row = cursor.fetchone()
+        return bool(row and row[0])
+
+
+def drop_partition(table: str, partition: str):
+    """Detach the partition from the table and drop it.
+
+    Dropping an attached partition locks the parent table exclusively and blocks
+    inserts of all events. Outside of a transaction, the partition is detached
+    concurrently, which doesn't block them; a detach interrupted in the previous
+    run is finalized. Inside of a transaction, where concurrent detach isn't
+    allowed, the partition is detached with the exclusive lock.
+    """
+    with connection.cursor() as cursor:
+        if connection.in_atomic_block:
+            detach_mode = ""
+        elif _is_detach_pending(partition):
+            detach_mode = " FINALIZE"
+        else:
+            detach_mode = " CONCURRENTLY"
+        cursor.execute(
+            f"ALTER TABLE {_quote(table)} "
+            f"DETACH PARTITION {_quote(partition)}{detach_mode}"
+        )
+        cursor.execute(f"DROP TABLE {_quote(partition)}")
+
+
+def _get_foreign_key_constraints(model: type[Model]) -> list[tuple[str, str]]:
+    """Return names and tables of constraints referencing the model table."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT conname, conrelid::regclass::text
+            FROM pg_constraint
+            WHERE contype = 'f' AND confrelid = %s::regclass
+            """,
+            [model._meta.db_table],
+        )
+        return cursor.fetchall()
+
+
+def _get_cutover_constraint_name(table: str) -> str:
+    return f"{table}_created_at_cutover_check"
+
+
+def _add_cutover_constraints(models: list[type[Model]], cutover: datetime.datetime):
+    """Add validated constraints proving that rows are created before the cutover.
+
+    With these constraints, attaching the tables as legacy partitions doesn't scan
+    them under the ACCESS EXCLUSIVE lock. The constraints are added as NOT VALID,
+    which only locks the table briefly, and validated one by one outside of any
+    transaction, which takes the SHARE UPDATE EXCLUSIVE lock that doesn't block
+    reads and writes.
+    """
+    with connection.cursor() as cursor:
+        for model in models:
+            table = model._meta.db_table
+            constraint = _quote(_get_cutover_constraint_name(table))
+            cursor.execute(
+                f"ALTER TABLE {_quote(table)} DROP CONSTRAINT IF EXISTS {constraint}"
+            )
+            cursor.execute(
+                f"ALTER TABLE {_quote(table)} ADD CONSTRAINT {constraint} "
+                "CHECK (created_at < %s) NOT VALID",
+                [cutover],
+            )
+        for model in models:
+            table = model._meta.db_table
+            constraint = _quote(_get_cutover_constraint_name(table))
+            cursor.execute(
+                f"ALTER TABLE {_quote(table)} VALIDATE CONSTRAINT {constraint}"
+            )
+
+
+def _partition_table(model: type[Model], cutover: datetime.datetime, count: int):
+    table = model._meta.db_table
+    legacy_table = f"{table}_{LEGACY_PARTITION_SUFFIX}"
+    cutover_constraint = _quote(_get_cutover_constraint_name(table))
+    sequence = f"{table}_id_seq"
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT GREATEST(MAX(id), 0) + 1 FROM {_quote(table)}",
+        )
+        (next_id,) = cursor.fetchone()
+        cursor.execute(
+            "SELECT pg_get_serial_sequence(%s, 'id')",
+            [table],
+        )
+        (current_sequence,) = cursor.fetchone()
+        if current_sequence:
+            cursor.execute(f"SELECT last_value + 1 FROM {current_sequence}")
+            next_id = max(next_id, cursor.fetchone()[0])
+
+        cursor.execute(f"ALTER TABLE {_quote(table)} RENAME TO {_quote(legacy_table)}")
+        cursor.execute(
+            f"ALTER TABLE {_quote(legacy_table)} "
+            "ALTER COLUMN id DROP IDENTITY IF EXISTS, ALTER COLUMN id DROP DEFAULT"
+        )
+        if current_sequence:
+            cursor.execute(f"DROP SEQUENCE IF EXISTS {current_sequence}")
+        cursor.execute(
+            f"CREATE TABLE {_quote(table)} "
+            f"(LIKE {_quote(legacy_table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        cursor.execute(
+            f"ALTER TABLE {_quote(table)} DROP CONSTRAINT {cutover_constraint}"
+        )
+        cursor.execute(f"CREATE SEQUENCE {_quote(sequence)} START WITH {next_id:d}")
+        cursor.execute(
+            f"ALTER TABLE {_quote(table)} "
+            f"ALTER COLUMN id SET DEFAULT nextval('{sequence}'::regclass)"
+        )
+        cursor.execute(f"ALTER SEQUENCE {_quote(sequence)} OWNED BY {_quote(table)}.id")
+        cursor.execute(
+            f"ALTER TABLE {_quote(table)} ATTACH PARTITION {_quote(legacy_table)} "
+            "FOR VALUES FROM (MINVALUE) TO (%s)",
+            [cutover],
+        )
+        # The partition bound now guarantees what the constraint checked.
+        cursor.execute(
+            f"ALTER TABLE {_quote(legacy_table)} DROP CONSTRAINT {cutover_constraint}"
+        )
+
+        for field in model._meta.concrete_fields:
+            if not isinstance(field, ForeignKey):
+                continue
+            column = field.column
+            # Existing indexes of the legacy partition are attached to the new ones.
+            cursor.execute(
+                f"CREATE INDEX {_quote(f'{table}_{column}_idx')} "
+                f"ON {_quote(table)} ({_quote(column)})"
+            )
+            related_model = field.related_model
+            if related_model in PARTITIONED_EVENT_MODELS:
+                continue
+            related_table = related_model._meta.db_table  # type: ignore[union-attr]
+            cursor.execute(
+                f"ALTER TABLE {_quote(table)} "
+                f"ADD FOREIGN KEY ({_quote(column)}) "
+                f"REFERENCES {_quote(related_table)} (id) "
+                "DEFERRABLE INITIALLY DEFERRED"
+            )
+
+    create_partitions(table, cutover, count)
+
+
+def partition_event_tables(count: int) -> list[str]:
+    """Convert the event tables into partitioned ones.
+
+    Existing rows are kept in the legacy partition of each table, which stores rows
+    created before the next day. Return names of the converted tables.
+
+    The tables are scanned before the conversion to validate that all rows belong
+    to the legacy partitions, without blocking reads and writes. Only the
+    conversion itself, which doesn't scan nor copy rows, locks the tables
+    exclusively. Until it finishes, rows created on or after the next day are
+    rejected, so the command must finish before midnight UTC.
+    """
+    cutover = _get_day_start(timezone.now()) + PARTITION_INTERVAL
+    partitioned_tables = get_partitioned_tables()
+    models = [
+        model
+        for model in PARTITIONED_EVENT_MODELS
+        if model._meta.db_table not in partitioned_tables
+    ]
+    if not models:
+        return []
+    _add_cutover_constraints(models, cutover)
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            # Tables can't be altered while deferred constraint checks are pending.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            for model in models:
+                for constraint, table in _get_foreign_key_constraints(model):
+                    if table in {m._meta.db_table for m in PARTITIONED_EVENT_MODELS}:
+                        cursor.execute(
+                            f"ALTER TABLE {table} DROP CONSTRAINT {_quote(constraint)}"
+                        )
+        for model in models:
+            _partition_table(model, cutover, count)
+    return [model._meta.db_table for model in models]
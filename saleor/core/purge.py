@@ -0,0 +1,156 @@
+import dataclasses
+import logging
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model, QuerySet
+
+from .telemetry import (
+    DEFAULT_DURATION_BUCKETS,
+    MetricType,
+    Scope,
+    Unit,
+    meter,
+    saleor_attributes,
+)
+
+logger = logging.getLogger(__name__)
+
+PURGE_PROGRESS_KEY_PREFIX = "purge-progress"
+
+METRIC_PURGE_DELETED_COUNT = meter.create_metric(
+    "saleor.purge.deleted_count",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.EVENT,
+    description="Number of expired rows deleted by purges.",
+)
+
+METRIC_PURGE_BATCH_DURATION = meter.create_metric(
+    "saleor.purge.batch_duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of deleting a single batch of expired rows.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+
+@dataclasses.dataclass
+class PurgeProgress:
+    # Primary key of the last row processed in the current pass.
+    cursor: Any = None
+    batch_size: int | None = None
+
+
+@dataclasses.dataclass
+class PurgeResult:
+    deleted_count: int
+    finished: bool
+
+
+class BasePurger:
+    """Define rows to delete and how to delete them.
+
+    Rows are walked in primary key order, so every batch is selected from a range
+    of the primary key index instead of scanning the whole table.
+    """
+
+    name: str
+    model: type[Model]
+    initial_batch_size = 1000
+    min_batch_size = 100
+    max_batch_size = 10000
+
+    def get_queryset(self) -> QuerySet:
+        raise NotImplementedError(
+            "subclasses of BasePurger must provide a get_queryset() method"
+        )
+
+    def delete_batch(self, pks: list) -> int:
+        """Delete the rows with given primary keys and return the deleted count."""
+        _, deleted_per_model = self.model._default_manager.filter(pk__in=pks).delete()
+        return deleted_per_model.get(self.model._meta.label, 0)
+
+    def get_next_batch_size(self, batch_size: int, duration: float) -> int:
+        """Adjust the batch size to the duration of the last delete."""
+        target_duration = settings.PURGE_BATCH_TARGET_DURATION
+        if duration < target_duration / 2:
+            batch_size *= 2
+        elif duration > target_duration:
+            batch_size //= 2
+        return max(self.min_batch_size, min(batch_size, self.max_batch_size))
+
+
+def _get_progress_key(name: str) -> str:
+    return f"{PURGE_PROGRESS_KEY_PREFIX}-{name}"
+
+
+def get_purge_progress(name: str) -> PurgeProgress:
+    return cache.get(_get_progress_key(name)) or PurgeProgress()
+
+
+def save_purge_progress(name: str, progress: PurgeProgress):
+    cache.set(_get_progress_key(name), progress, timeout=None)
+
+
+def reset_purge_progress(name: str):
+    cache.delete(_get_progress_key(name))
+
+
+def run_purge(
+    purger: BasePurger, *, time_limit: float, batch_size: int | None = None
+) -> PurgeResult:
+    """Delete rows selected by the purger until done or the time limit is reached.
+
+    The progress is saved after every batch, so the next run resumes from the last
+    processed primary key. Once all rows are processed, the progress is reset and
+    the next run starts a new pass from the beginning of the table.
+    """
+    progress = get_purge_progress(purger.name)
+    batch_size = batch_size or progress.batch_size or purger.initial_batch_size
+    deadline = time.monotonic() + time_limit
+    attributes = {saleor_attributes.SALEOR_PURGE_NAME: purger.name}
+    deleted_count = 0
+    while True:
+        qs = purger.get_queryset()
+        if progress.cursor is not None:
+            qs = qs.filter(pk__gt=progress.cursor)
+        pks = list(qs.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            break
+
+        started_at = time.monotonic()
+        batch_deleted_count = purger.delete_batch(pks)
+        duration = time.monotonic() - started_at
+        meter.record(
+            METRIC_PURGE_BATCH_DURATION, duration, Unit.SECOND, attributes=attributes
+        )
+        meter.record(
+            METRIC_PURGE_DELETED_COUNT,
+            batch_deleted_count,
+            Unit.EVENT,
+            attributes=attributes,
+        )
+        deleted_count += batch_deleted_count
+
+        if len(pks) < batch_size:
+            break
+        progress.cursor = pks[-1]
+        progress.batch_size = batch_size = purger.get_next_batch_size(
+            batch_size, duration
+        )
+        save_purge_progress(purger.name, progress)
+        if time.monotonic() >= deadline:
+            logger.debug(
+                "Purge %s deleted %d rows, time limit reached.",
+                purger.name,
+                deleted_count,
+            )
+            return PurgeResult(deleted_count=deleted_count, finished=False)
+
+    reset_purge_progress(purger.name)
+    logger.debug("Purge %s deleted %d rows, finished.", purger.name, deleted_count)
+    return PurgeResult(deleted_count=deleted_count, finished=True)
@@ -12,6 +12,16 @@ from ..celeryconf import app
 from ..core.db.connection import allow_writer
 from . import private_storage
 from .models import EventDelivery, EventPayload
+from .partitioning import (
+    PARTITION_INTERVAL,
+    PARTITIONED_EVENT_MODELS,
+    create_partitions,
+    drop_partition,
+    get_expired_partitions,
+    get_partition_payload_files,
+    get_partitioned_tables,
+)
+from .purge import BasePurger, run_purge
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
@@ -62,33 +72,99 @@ def delete_from_storage_task(path):
     default_storage.delete(path)
 
 
+class EventPayloadsPurger(BasePurger):
+    """Select event payloads without deliveries created in the retention period.
+
+    Deleting a payload deletes its deliveries and their attempts.
+    """
+
+    name = "event-payloads"
+    model = EventPayload
+    initial_batch_size = BATCH_SIZE
+
+    def __init__(self):
+        self.delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
+
+    def get_queryset(self):
+        valid_deliveries = EventDelivery.objects.using(
+            settings.DATABASE_CONNECTION_REPLICA_NAME
+        ).filter(created_at__gt=self.delete_period)
+        return EventPayload.objects.using(
+            settings.DATABASE_CONNECTION_REPLICA_NAME
+        ).filter(
+            ~Exists(valid_deliveries.filter(payload_id=OuterRef("id"))),
+            created_at__lte=self.delete_period,
+        )
+
+    def delete_batch(self, pks: list) -> int:
+        files_to_delete = [
+            path
+            for path in EventPayload.objects.using(
+                settings.DATABASE_CONNECTION_REPLICA_NAME
+            )
+            .filter(pk__in=pks)
+            .values_list("payload_file", flat=True)
+            if path
+        ]
+        with allow_writer():
+            deleted_count = super().delete_batch(pks)
+        if files_to_delete:
+            delete_files_from_private_storage_task.delay(files_to_delete)
+        return deleted_count
+
+
+def drop_expired_event_partitions():
+    """Drop partitions of event tables with rows older than the retention period.
+
+    Payload partitions are kept one partition longer, as deliveries can be created
+    shortly after their payloads.
+    """
+    partitioned_tables = get_partitioned_tables()
+    if not partitioned_tables:
+        return
+    cutoff = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    for model in PARTITIONED_EVENT_MODELS:
+        table = model._meta.db_table
+        if table not in partitioned_tables:
+            continue
+        is_payload = model is EventPayload
+        table_cutoff = cutoff - PARTITION_INTERVAL if is_payload else cutoff
+        for partition in get_expired_partitions(table, table_cutoff):
+            if is_payload:
+                files_to_delete = get_partition_payload_files(partition)
+                for start in range(0, len(files_to_delete), BATCH_SIZE):
+                    delete_files_from_private_storage_task.delay(
+                        files_to_delete[start : start + BATCH_SIZE]
+                    )
+            drop_partition(table, partition)
+            task_logger.info("Dropped expired partition %s.", partition)
+
+
+@app.task
+@allow_writer()
+def create_event_partitions_task():
+    for table in get_partitioned_tables():
+        created = create_partitions(
+            table, timezone.now(), settings.EVENT_PARTITIONS_PREMAKE_DAYS
+        )
+        if created:
+            task_logger.info("Created partitions: %s.", ", ".join(created))
+
+
 @app.task
 def delete_event_payloads_task(expiration_date=None):
-    expiration_date = (
-        expiration_date
-        or timezone.now() + settings.EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT
-    )
-    delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
-    valid_deliveries = EventDelivery.objects.filter(created_at__gt=delete_period)
-    payloads_to_delete = (
-        EventPayload.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(~Exists(valid_deliveries.filter(payload_id=OuterRef("id"))))
-        .order_by("-pk")
-    )
-    ids = list(payloads_to_delete.values_list("pk", flat=True)[:BATCH_SIZE])
-    if ids:
+    if expiration_date is None:
+        # Only the scheduled invocation drops partitions; re-enqueued ones continue
+        # deleting remaining rows.
+        with allow_writer():
+            drop_expired_event_partitions()
+        expiration_date = timezone.now() + settings.EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT
+    result = run_purge(EventPayloadsPurger(), time_limit=settings.PURGE_TASK_TIME_LIMIT)
+    if not result.finished:
         if expiration_date > timezone.now():
-            qs = EventPayload.objects.filter(pk__in=ids)
-            files_to_delete = [
-                event_payload.payload_file.name
-                for event_payload in qs.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-                if event_payload.payload_file
-            ]
-            with allow_writer():
-                qs.delete()
-            delete_files_from_private_storage_task.delay(files_to_delete)
             delete_event_payloads_task.delay(expiration_date)
         else:
+            # The progress is saved, so the next scheduled run resumes from it.
             task_logger.error("Task invocation time limit reached, aborting task")
 
 
@@ -14,6 +14,10 @@ GRAPHQL_OPERATION_IDENTIFIER: Final = "graphql.operation.identifier"
 GRAPHQL_PARENT_TYPE: Final = "graphql.parent_type"
 GRAPHQL_RESOLVER_ROW_COUNT: Final = "graphql.resolver.row_count"
 
+# Cache
+SALEOR_CACHE_NAME: Final = "saleor.cache.name"
+SALEOR_CACHE_HIT: Final = "saleor.cache.hit"
+
 # Http
 SALEOR_SOURCE_SERVICE_NAME: Final = "saleor.source.service.name"
 
@@ -26,6 +30,16 @@ SALEOR_APP_NAME: Final = "saleor.app.name"
 SALEOR_WEBHOOK_EXECUTION_MODE: Final = "saleor.webhook.execution_mode"
 SALEOR_WEBHOOK_EVENT_TYPE: Final = "saleor.webhook.event_type"
 SALEOR_WEBHOOK_PAYLOAD_SIZE: Final = "saleor.webhook.payload.size"
+SALEOR_WEBHOOK_CONNECTION_REUSED: Final = "saleor.webhook.connection_reused"
+
+# Observability
+SALEOR_OBSERVABILITY_CODEC: Final = "saleor.observability.buffer.codec"
+SALEOR_OBSERVABILITY_CODEC_OPERATION: Final = (
+    "saleor.observability.buffer.codec_operation"
+)
 
 # Circuit Breaker
 SALEOR_CIRCUIT_BREAKER_STATE: Final = "saleor.circuit_breaker.state"
+
+# Purge
+SALEOR_PURGE_NAME: Final = "saleor.purge.name"
@@ -0,0 +1,204 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from jwt import InvalidTokenError
+
+from ...account.models import User
+from ...permission.models import Permission
+from .. import jwt_cache
+from ..auth_backend import JSONWebTokenBackend
+from ..jwt import create_access_token, create_access_token_for_app
+from ..jwt_cache import (
+    get_jwt_user_cache_key,
+    invalidate_jwt_user,
+    invalidate_jwt_users,
+    invalidate_jwt_users_by_pks,
+)
+
+
+@pytest.fixture
+def jwt_user_cache(settings):
+    settings.JWT_USER_CACHE_ENABLED = True
+    invalidate_jwt_users()
+
+
+def test_authenticate_uses_cached_user(
+    jwt_user_cache, rf, staff_user, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    staff_user.user_permissions.add(permission_manage_orders)
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+
+    # when
+    with django_assert_num_queries(0):
+        user = backend.authenticate(request)
+        has_perm = user.has_perm("order.manage_orders")
+
+    # then
+    assert user == staff_user
+    assert has_perm
+
+
+def test_permission_group_change_invalidates_cached_user(
+    jwt_user_cache,
+    rf,
+    staff_user,
+    permission_group_manage_orders,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    permission_group_manage_orders.user_set.remove(staff_user)
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    assert not backend.authenticate(request).has_perm("order.manage_orders")
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        permission_group_manage_orders.user_set.add(staff_user)
+
+    # then
+    user = backend.authenticate(request)
+    assert user.has_perm("order.manage_orders")
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [("is_active", False), ("jwt_token_key", "New key"), ("email", "new@example.com")],
+)
+def test_user_change_invalidates_cached_user(
+    field, value, jwt_user_cache, rf, staff_user, django_capture_on_commit_callbacks
+):
+    # given
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        setattr(staff_user, field, value)
+        staff_user.save(update_fields=[field])
+
+    # then
+    with pytest.raises(InvalidTokenError):
+        backend.authenticate(request)
+
+
+def test_authenticate_with_app_token_uses_token_permissions(
+    jwt_user_cache, rf, staff_user, app, django_assert_num_queries
+):
+    # given
+    staff_user.user_permissions.set(
+        Permission.objects.filter(codename__in=["manage_checkouts", "manage_orders"])
+    )
+    app.permissions.set(
+        Permission.objects.filter(codename__in=["manage_apps", "manage_checkouts"])
+    )
+    access_token = create_access_token_for_app(app, staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+
+    # when
+    with django_assert_num_queries(0):
+        user = backend.authenticate(request)
+        has_perms = (
+            user.has_perm("checkout.manage_checkouts"),
+            user.has_perm("order.manage_orders"),
+        )
+
+    # then
+    assert user == staff_user
+    assert user.is_staff
+    assert has_perms == (True, False)
+    assert set(user.effective_permissions) == set(
+        Permission.objects.filter(codename="manage_checkouts")
+    )
+
+
+def test_cached_user_contains_only_authentication_fields(
+    jwt_user_cache, rf, staff_user, django_assert_num_queries
+):
+    # given
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+    user = backend.authenticate(request)
+
+    # when
+    with django_assert_num_queries(1):
+        full_name = (user.first_name, user.last_name)
+
+    # then
+    _, user_data, _ = cache.get(get_jwt_user_cache_key(staff_user.pk))
+    assert set(user_data) == {
+        "id",
+        "email",
+        "jwt_token_key",
+        "is_active",
+        "is_staff",
+        "is_superuser",
+    }
+    assert full_name == (staff_user.first_name, staff_user.last_name)
+
+
+def test_invalidate_jwt_users_by_pks(jwt_user_cache, rf, staff_user):
+    # given
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    backend.authenticate(request)
+    User.objects.filter(pk=staff_user.pk).update(is_active=False)
+
+    # when
+    invalidate_jwt_users_by_pks([staff_user.pk])
+
+    # then
+    with pytest.raises(InvalidTokenError):
+        backend.authenticate(request)
+
+
+def test_user_changed_while_fetched_is_not_cached(jwt_user_cache, rf, staff_user):
+    # given
+    access_token = create_access_token(staff_user)
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    backend = JSONWebTokenBackend()
+    fetch_user_data = jwt_cache._fetch_user_data_with_permissions
+
+    def fetch_user_data_before_change(user_pk):
+        result = fetch_user_data(user_pk)
+        User.objects.filter(pk=user_pk).update(is_active=False)
+        invalidate_jwt_user(user_pk)
+        return result
+
+    with patch.object(
+        jwt_cache,
+        "_fetch_user_data_with_permissions",
+        side_effect=fetch_user_data_before_change,
+    ):
+        backend.authenticate(request)
+
+    # when & then
+    with pytest.raises(InvalidTokenError):
+        backend.authenticate(request)
+
+
+def test_deferred_fields_of_not_cached_user_are_loaded_on_access(
+    staff_user, django_assert_num_queries
+):
+    # given
+    user = User.objects.only("id", "email").get(pk=staff_user.pk)
+
+    # when
+    with django_assert_num_queries(1):
+        first_name = user.first_name
+
+    # then
+    assert first_name == staff_user.first_name
+    assert "last_name" in user.get_deferred_fields()
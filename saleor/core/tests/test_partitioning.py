@@ -0,0 +1,211 @@
+import datetime
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ...webhook.event_types import WebhookEventAsyncType
+from ..models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ..partitioning import (
+    drop_partition,
+    get_partition_name,
+    get_partitioned_tables,
+    get_partitions,
+    partition_event_tables,
+)
+from ..purge import reset_purge_progress
+from ..tasks import (
+    EventPayloadsPurger,
+    create_event_partitions_task,
+    delete_event_payloads_task,
+)
+
+EVENT_TABLES = {
+    "core_eventpayload",
+    "core_eventdelivery",
+    "core_eventdeliveryattempt",
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_event_payloads_purge_progress():
+    yield
+    reset_purge_progress(EventPayloadsPurger.name)
+
+
+@pytest.fixture
+def event_delivery_attempt(webhook):
+    payload = EventPayload.objects.create_with_payload_file(payload="payload")
+    delivery = EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY, payload=payload, webhook=webhook
+    )
+    return EventDeliveryAttempt.objects.create(delivery=delivery)
+
+
+def _get_tomorrow():
+    return (timezone.now() + datetime.timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def test_partition_event_tables(event_delivery_attempt, webhook):
+    # given
+    tomorrow = _get_tomorrow()
+
+    # when
+    tables = partition_event_tables(2)
+
+    # then
+    assert set(tables) == EVENT_TABLES
+    assert get_partitioned_tables() == EVENT_TABLES
+    assert set(get_partitions("core_eventpayload")) == {
+        "core_eventpayload_legacy",
+        get_partition_name("core_eventpayload", tomorrow),
+        get_partition_name("core_eventpayload", tomorrow + datetime.timedelta(days=1)),
+    }
+    attempt = EventDeliveryAttempt.objects.get(pk=event_delivery_attempt.pk)
+    assert attempt.delivery.payload.get_payload() == "payload"
+
+    with freeze_time(tomorrow + datetime.timedelta(hours=1)):
+        payload = EventPayload.objects.create(payload="new")
+        delivery = EventDelivery.objects.create(
+            event_type=WebhookEventAsyncType.ANY, payload=payload, webhook=webhook
+        )
+    assert payload.pk > event_delivery_attempt.delivery.payload_id
+    assert delivery.pk > event_delivery_attempt.delivery_id
+    assert EventPayload.objects.count() == 2
+
+
+def test_partition_event_tables_drops_cutover_constraints(event_delivery_attempt):
+    # when
+    partition_event_tables(1)
+
+    # then
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conname LIKE %s",
+            ["%_created_at_cutover_check"],
+        )
+        assert cursor.fetchall() == []
+
+
+def test_partition_event_tables_already_partitioned(event_delivery_attempt):
+    # given
+    partition_event_tables(1)
+
+    # when
+    tables = partition_event_tables(1)
+
+    # then
+    assert tables == []
+
+
+def test_create_event_partitions_task(settings):
+    # given
+    settings.EVENT_PARTITIONS_PREMAKE_DAYS = 2
+    partition_event_tables(1)
+    tomorrow = _get_tomorrow()
+
+    # when
+    with freeze_time(tomorrow + datetime.timedelta(days=1)):
+        create_event_partitions_task()
+
+    # then
+    assert set(get_partitions("core_eventdelivery")) == {
+        "core_eventdelivery_legacy",
+        get_partition_name("core_eventdelivery", tomorrow),
+        get_partition_name("core_eventdelivery", tomorrow + datetime.timedelta(days=1)),
+        get_partition_name("core_eventdelivery", tomorrow + datetime.timedelta(days=2)),
+    }
+
+
+# Rows are not purged, so only dropping partitions can delete them and their files.
+@mock.patch("saleor.core.tasks.run_purge")
+@mock.patch("saleor.core.tasks.delete_files_from_private_storage_task.delay")
+def test_delete_event_payloads_task_drops_expired_partitions(
+    mocked_delete_files, mocked_run_purge, event_delivery_attempt, settings
+):
+    # given
+    partition_event_tables(1)
+    tomorrow = _get_tomorrow()
+    payload_file = event_delivery_attempt.delivery.payload.payload_file.name
+
+    # when
+    with freeze_time(
+        tomorrow + settings.EVENT_PAYLOAD_DELETE_PERIOD + datetime.timedelta(hours=1)
+    ):
+        delete_event_payloads_task()
+
+    # then
+    assert "core_eventdelivery_legacy" not in get_partitions("core_eventdelivery")
+    assert "core_eventdeliveryattempt_legacy" not in get_partitions(
+        "core_eventdeliveryattempt"
+    )
+    # payload partitions are kept one day longer
+    assert "core_eventpayload_legacy" in get_partitions("core_eventpayload")
+    assert not EventDelivery.objects.exists()
+    assert EventPayload.objects.exists()
+    mocked_delete_files.assert_not_called()
+
+    # when
+    with freeze_time(
+        tomorrow + settings.EVENT_PAYLOAD_DELETE_PERIOD + datetime.timedelta(days=1)
+    ):
+        delete_event_payloads_task()
+
+    # then
+    assert "core_eventpayload_legacy" not in get_partitions("core_eventpayload")
+    assert not EventPayload.objects.exists()
+    mocked_delete_files.assert_called_once_with([payload_file])
+
+
+def test_delete_event_payloads_task_without_partitioning(event_delivery_attempt):
+    # when
+    delete_event_payloads_task()
+
+    # then
+    assert get_partitioned_tables() == set()
+    assert EventPayload.objects.exists()
+
+
+@mock.patch("saleor.core.partitioning._is_detach_pending", return_value=False)
+@mock.patch("saleor.core.partitioning.connection")
+def test_drop_partition_detaches_concurrently_outside_transaction(
+    mocked_connection, _mocked_is_detach_pending
+):
+    # given
+    mocked_connection.in_atomic_block = False
+    mocked_connection.ops.quote_name = lambda name: f'"{name}"'
+    cursor = mocked_connection.cursor.return_value.__enter__.return_value
+
+    # when
+    drop_partition("core_eventdelivery", "core_eventdelivery_legacy")
+
+    # then
+    assert [call.args[0] for call in cursor.execute.call_args_list] == [
+        'ALTER TABLE "core_eventdelivery" '
+        'DETACH PARTITION "core_eventdelivery_legacy" CONCURRENTLY',
+        'DROP TABLE "core_eventdelivery_legacy"',
+    ]
+
+
+@mock.patch("saleor.core.partitioning._is_detach_pending", return_value=True)
+@mock.patch("saleor.core.partitioning.connection")
+def test_drop_partition_finalizes_interrupted_detach(
+    mocked_connection, _mocked_is_detach_pending
+):
+    # given
+    mocked_connection.in_atomic_block = False
+    mocked_connection.ops.quote_name = lambda name: f'"{name}"'
+    cursor = mocked_connection.cursor.return_value.__enter__.return_value
+
+    # when
+    drop_partition("core_eventdelivery", "core_eventdelivery_legacy")
+
+    # then
+    assert cursor.execute.call_args_list[0].args[0] == (
+        'ALTER TABLE "core_eventdelivery" '
+        'DETACH PARTITION "core_eventdelivery_legacy" FINALIZE'
+    )
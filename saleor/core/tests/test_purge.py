@@ -0,0 +1,111 @@
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+
+from ..models import EventPayload
+from ..purge import (
+    BasePurger,
+    get_purge_progress,
+    reset_purge_progress,
+    run_purge,
+)
+
+
+class EventPayloadsTestPurger(BasePurger):
+    name = "test-event-payloads"
+    model = EventPayload
+    initial_batch_size = 2
+    min_batch_size = 1
+    max_batch_size = 3
+
+    def get_queryset(self):
+        return EventPayload.objects.all()
+
+
+@pytest.fixture
+def event_payloads():
+    yield EventPayload.objects.bulk_create(
+        [EventPayload(payload=f"payload-{i}") for i in range(5)]
+    )
+    reset_purge_progress(EventPayloadsTestPurger.name)
+
+
+@pytest.mark.parametrize(
+    ("duration", "expected_batch_size"),
+    [(0.1, 3), (0.3, 2), (1.0, 1)],
+)
+def test_get_next_batch_size(duration, expected_batch_size, settings):
+    # given
+    settings.PURGE_BATCH_TARGET_DURATION = 0.5
+
+    # when
+    batch_size = EventPayloadsTestPurger().get_next_batch_size(2, duration)
+
+    # then
+    assert batch_size == expected_batch_size
+
+
+def test_run_purge(event_payloads):
+    # when
+    result = run_purge(EventPayloadsTestPurger(), time_limit=60)
+
+    # then
+    assert result.deleted_count == 5
+    assert result.finished is True
+    assert not EventPayload.objects.exists()
+    assert get_purge_progress(EventPayloadsTestPurger.name).cursor is None
+
+
+def test_run_purge_saves_progress_when_time_limit_reached(event_payloads):
+    # when
+    result = run_purge(EventPayloadsTestPurger(), time_limit=0)
+
+    # then
+    assert result.deleted_count == 2
+    assert result.finished is False
+    progress = get_purge_progress(EventPayloadsTestPurger.name)
+    assert progress.cursor == event_payloads[1].pk
+    assert progress.batch_size == 3
+
+
+def test_run_purge_resumes_from_saved_progress(event_payloads):
+    # given
+    run_purge(EventPayloadsTestPurger(), time_limit=0)
+    # rows before the cursor are skipped until the next pass
+    EventPayload.objects.create(pk=event_payloads[0].pk, payload="payload")
+
+    # when
+    result = run_purge(EventPayloadsTestPurger(), time_limit=60)
+
+    # then
+    assert result.deleted_count == 3
+    assert result.finished is True
+    assert list(EventPayload.objects.values_list("pk", flat=True)) == [
+        event_payloads[0].pk
+    ]
+
+
+@mock.patch("saleor.core.purge.meter.record")
+def test_run_purge_records_metrics(mocked_record, event_payloads):
+    # when
+    run_purge(EventPayloadsTestPurger(), time_limit=60)
+
+    # then
+    deleted_counts = [
+        call.args[1]
+        for call in mocked_record.call_args_list
+        if call.args[0] == "saleor.purge.deleted_count"
+    ]
+    assert deleted_counts == [2, 3]
+
+
+def test_purge_expired_data_command(event_payloads, settings):
+    # given
+    settings.EVENT_PAYLOAD_DELETE_PERIOD = -settings.EVENT_PAYLOAD_DELETE_PERIOD
+
+    # when
+    call_command("purge_expired_data", "event-payloads")
+
+    # then
+    assert not EventPayload.objects.exists()
@@ -1,5 +1,6 @@
 import datetime
 
+import pytest
 from django.core.files.storage import default_storage
 from django.utils import timezone
 from freezegun import freeze_time
@@ -7,13 +8,21 @@ from freezegun import freeze_time
 from ...webhook.event_types import WebhookEventAsyncType
 from .. import private_storage
 from ..models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ..purge import reset_purge_progress
 from ..tasks import (
+    EventPayloadsPurger,
     delete_event_payloads_task,
     delete_files_from_storage_task,
     delete_from_storage_task,
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_event_payloads_purge_progress():
+    yield
+    reset_purge_progress(EventPayloadsPurger.name)
+
+
 def test_delete_from_storage_task(product_with_image, media_root):
     # given
     path = product_with_image.media.first().image.name
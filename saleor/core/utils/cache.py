@@ -1,20 +1,178 @@
 import collections
+import time
+from collections.abc import Hashable, Iterator, MutableMapping
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any
 
+from django.core.cache import cache
 
-class CacheDict(collections.OrderedDict):
-    def __init__(self, capacity: int):
+from ..telemetry import MetricType, Scope, Unit, meter, saleor_attributes
+
+METRIC_CACHE_LOOKUP_COUNT = meter.create_metric(
+    "saleor.cache.lookup_count",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of lookups in in-process caches.",
+)
+
+METRIC_CACHE_EVICTION_COUNT = meter.create_metric(
+    "saleor.cache.eviction_count",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.EVENT,
+    description="Number of entries evicted from in-process caches.",
+)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    capacity: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CacheDict(MutableMapping):
+    """Thread-safe, bounded LRU mapping.
+
+    Entries can optionally expire after `timeout` seconds; the timeout can be also
+    set per entry with `set()`. When `name` is provided, hits, misses and evictions
+    are reported as metrics with the `saleor.cache.name` attribute.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        timeout: float | None = None,
+        name: str | None = None,
+    ):
         self.capacity = capacity
-        super().__init__()
+        self.timeout = timeout
+        self.name = name
+        self._data: collections.OrderedDict[Hashable, tuple[Any, float | None]] = (
+            collections.OrderedDict()
+        )
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def __getitem__(self, key):
-        value = super().__getitem__(key)
-        super().move_to_end(key)
-        return value
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] is not None:
+                if entry[1] <= time.monotonic():
+                    del self._data[key]
+                    entry = None
+            if entry is None:
+                self._misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._hits += 1
+        self._record_lookup(hit=entry is not None)
+        if entry is None:
+            raise KeyError(key)
+        return entry[0]
 
     def __setitem__(self, key, value):
-        super().__setitem__(key, value)
-        super().move_to_end(key)
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False
+            expires_at = entry[1]
+            return expires_at is None or expires_at > time.monotonic()
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def set(self, key, value, timeout: float | None = None):
+        """Store the value, optionally overriding the default timeout."""
+        if timeout is None:
+            timeout = self.timeout
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        evicted = 0
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+                evicted += 1
+            self._evictions += evicted
+        if evicted and self.name:
+            meter.record(
+                METRIC_CACHE_EVICTION_COUNT,
+                evicted,
+                Unit.EVENT,
+                attributes={saleor_attributes.SALEOR_CACHE_NAME: self.name},
+            )
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+                capacity=self.capacity,
+            )
+
+    def _record_lookup(self, *, hit: bool):
+        if self.name:
+            meter.record(
+                METRIC_CACHE_LOOKUP_COUNT,
+                1,
+                Unit.REQUEST,
+                attributes={
+                    saleor_attributes.SALEOR_CACHE_NAME: self.name,
+                    saleor_attributes.SALEOR_CACHE_HIT: hit,
+                },
+            )
+
+
+def get_cache_version(key: str, timeout: int | None = None) -> int:
+    """Return the version stored in the cache backend under the key.
+
+    A missing version is seeded with the current time in nanoseconds instead of a
+    constant, so a version key evicted from the cache never brings back entries
+    cached under its earlier values.
+    """
+    version = cache.get(key)
+    if version is None:
+        seed = time.time_ns()
+        cache.add(key, seed, timeout=timeout)
+        version = cache.get(key, seed)
+    return version
+
 
-        while len(self) > self.capacity:
-            surplus = next(iter(self))
-            super().__delitem__(surplus)
+def bump_cache_version(key: str, timeout: int | None = None):
+    """Change the version stored under the key, outdating entries of all processes."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=timeout)
@@ -1,4 +1,16 @@
-from ..cache import CacheDict
+from threading import Thread
+from unittest.mock import patch
+
+from django.core.cache import cache as default_cache
+from freezegun import freeze_time
+
+from ..cache import (
+    METRIC_CACHE_EVICTION_COUNT,
+    METRIC_CACHE_LOOKUP_COUNT,
+    CacheDict,
+    bump_cache_version,
+    get_cache_version,
+)
 
 
 def test_capacity():
@@ -42,3 +54,142 @@ def test_eviction_order():
     assert 1 in cache
     assert 2 not in cache
     assert 3 in cache
+
+
+def test_get_missing_key():
+    # given
+    cache = CacheDict(2)
+
+    # when
+    value = cache.get(1)
+
+    # then
+    assert value is None
+    assert cache.stats.misses == 1
+
+
+def test_stats():
+    # given
+    cache = CacheDict(2)
+    cache[1] = "a"
+    cache[2] = "b"
+
+    # when
+    cache.get(1)
+    cache.get(3)
+    cache[3] = "c"
+
+    # then
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.evictions == 1
+    assert stats.size == 2
+    assert stats.capacity == 2
+    assert stats.hit_ratio == 0.5
+
+
+def test_timeout():
+    # given
+    cache = CacheDict(2, timeout=10)
+
+    # when
+    with freeze_time("2024-01-01 12:00:00") as frozen_time:
+        cache[1] = "a"
+        frozen_time.tick(11)
+
+        # then
+        assert 1 not in cache
+        assert cache.get(1) is None
+
+
+def test_timeout_per_entry():
+    # given
+    cache = CacheDict(2)
+
+    # when
+    with freeze_time("2024-01-01 12:00:00") as frozen_time:
+        cache.set(1, "a", timeout=10)
+        cache[2] = "b"
+        frozen_time.tick(11)
+
+        # then
+        assert 1 not in cache
+        assert cache[2] == "b"
+
+
+def test_concurrent_access():
+    # given
+    cache = CacheDict(10)
+
+    def worker(offset):
+        for i in range(1000):
+            cache[offset + i] = i
+            cache.get(offset + i - 1)
+
+    # when
+    threads = [Thread(target=worker, args=(i * 1000,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert len(cache) == 10
+    assert cache.stats.evictions == 4000 - 10
+
+
+@patch("saleor.core.utils.cache.meter.record")
+def test_metrics_recorded_for_named_cache(record_mock):
+    # given
+    cache = CacheDict(1, name="test")
+    cache[1] = "a"
+
+    # when
+    cache.get(1)
+    cache[2] = "b"
+
+    # then
+    recorded_metrics = [call.args[0] for call in record_mock.call_args_list]
+    assert recorded_metrics == [METRIC_CACHE_LOOKUP_COUNT, METRIC_CACHE_EVICTION_COUNT]
+
+
+def test_bump_cache_version():
+    # given
+    key = "test-cache-version"
+    version = get_cache_version(key)
+
+    # when
+    bump_cache_version(key)
+
+    # then
+    assert get_cache_version(key) == version + 1
+
+
+def test_evicted_cache_version_is_not_reused():
+    # given
+    key = "test-evicted-cache-version"
+    version = get_cache_version(key)
+    bump_cache_version(key)
+    bumped_version = get_cache_version(key)
+
+    # when
+    default_cache.delete(key)
+
+    # then
+    new_version = get_cache_version(key)
+    assert new_version not in {version, bumped_version}
+    assert new_version > bumped_version
+
+
+def test_bump_missing_cache_version():
+    # given
+    key = "test-missing-cache-version"
+    version = get_cache_version(key)
+    default_cache.delete(key)
+
+    # when
+    bump_cache_version(key)
+
+    # then
+    assert get_cache_version(key) > version + 1
@@ -1,8 +1,10 @@
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ....account import models
 from ....account.error_codes import AccountErrorCode
+from ....core.jwt_cache import invalidate_jwt_users_by_pks
 from ....permission.enums import AccountPermissions
 from ...core import ResolveInfo
 from ...core.doc_category import DOC_CATEGORY_USERS
@@ -56,4 +58,7 @@ class UserBulkSetActive(BaseBulkMutation):
     def bulk_action(  # type: ignore[override]
         cls, _info: ResolveInfo, queryset, /, *, is_active
     ):
+        user_pks = list(queryset.values_list("pk", flat=True))
         queryset.update(is_active=is_active)
+        # The update doesn't send signals which invalidate the cached users.
+        transaction.on_commit(lambda: invalidate_jwt_users_by_pks(user_pks))
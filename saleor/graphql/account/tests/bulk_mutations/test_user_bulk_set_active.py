@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import graphene
 
 from .....account.models import User
@@ -58,6 +60,36 @@ def test_staff_bulk_set_not_active(
     assert not any(user.is_active for user in users)
 
 
+@patch(
+    "saleor.graphql.account.bulk_mutations.user_bulk_set_active"
+    ".invalidate_jwt_users_by_pks"
+)
+def test_staff_bulk_set_not_active_invalidates_cached_users(
+    mocked_invalidate_jwt_users_by_pks,
+    staff_api_client,
+    user_list,
+    permission_manage_users,
+):
+    # given
+    variables = {
+        "ids": [graphene.Node.to_global_id("User", user.id) for user in user_list],
+        "is_active": False,
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        USER_CHANGE_ACTIVE_STATUS_MUTATION,
+        variables,
+        permissions=[permission_manage_users],
+    )
+
+    # then
+    get_graphql_content(response)
+    mocked_invalidate_jwt_users_by_pks.assert_called_once()
+    (user_pks,) = mocked_invalidate_jwt_users_by_pks.call_args.args
+    assert set(user_pks) == {user.pk for user in user_list}
+
+
 def test_change_active_status_for_superuser(
     staff_api_client, superuser, permission_manage_users
 ):
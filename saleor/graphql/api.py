@@ -1,6 +1,7 @@
 from functools import partial
 
 import graphql
+from django.conf import settings
 from django.urls import reverse
 from django.utils.functional import SimpleLazyObject
 from graphql import (
@@ -219,4 +220,23 @@ class SaleorGraphQLBackend(GraphQLCoreBackend):
         )
 
 
-backend = GraphQLCachedBackend(SaleorGraphQLBackend(), cache_map=CacheDict(1000))
+class SaleorGraphQLCachedBackend(GraphQLCachedBackend):
+    def document_from_string(
+        self,
+        schema: GraphQLSchema,
+        request_string: str,
+    ) -> GraphQLDocument:
+        # Single lookup instead of `in` followed by `[]`, so a concurrent eviction
+        # cannot remove the entry in between and every lookup is counted in stats.
+        key = self.get_key_for_schema_and_document_string(schema, request_string)
+        document = self.cache_map.get(key)
+        if document is None:
+            document = self.backend.document_from_string(schema, request_string)
+            self.cache_map[key] = document
+        return document
+
+
+backend = SaleorGraphQLCachedBackend(
+    SaleorGraphQLBackend(),
+    cache_map=CacheDict(settings.GRAPHQL_DOCUMENT_CACHE_SIZE, name="graphql_document"),
+)
@@ -2,10 +2,12 @@ import hashlib
 from collections import defaultdict
 from dataclasses import dataclass
 
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
 from django.core.cache import cache
 
-from ....app.models import App, AppToken
+from ....app.models import App, AppToken, get_app_token_digest
+from ....core.db.connection import allow_writer
 from ...core.dataloaders import DataLoader
 
 # Cache timeout for the app token loader
@@ -49,59 +51,94 @@ class TokenInfo:
 class AppByTokenLoader(DataLoader[str, App]):
     context_key = "app_by_token"
 
-    def get_and_cache_app_id(
-        self, token_info: TokenInfo, token_id: int, auth_token: str, app_id: int
-    ):
-        """Check if the token is valid and return the app ID."""
-        cached_data = cache.get(token_info.cache_key)
-        if cached_data:
-            cached_app_id, cached_token_id = cached_data
-            if token_id == cached_token_id:
-                return cached_app_id
-        elif check_password(token_info.raw_token, auth_token):
-            cache_data = (app_id, token_id)
-            cache.set(token_info.cache_key, cache_data, CACHE_TIMEOUT)
-            return app_id
-        return None
-
-    def remove_not_valid_tokens_from_cache(
-        self, last_4s_to_raw_token_map, tokens_found
-    ):
-        """Remove tokens from the cache that are not valid."""
-        for token_infos in last_4s_to_raw_token_map.values():
-            for token_info in token_infos:
-                if token_info.raw_token not in tokens_found:
-                    cache.delete(token_info.cache_key)
+    def get_app_ids_by_digest(self, token_infos: list[TokenInfo]) -> dict[str, int]:
+        """Return app IDs of tokens found by their digests."""
+        digest_to_raw_token = {
+            get_app_token_digest(token_info.raw_token): token_info.raw_token
+            for token_info in token_infos
+        }
+        tokens = (
+            AppToken.objects.using(self.database_connection_name)
+            .filter(token_digest__in=digest_to_raw_token.keys())
+            .values_list("token_digest", "app_id")
+        )
+        return {
+            digest_to_raw_token[token_digest]: app_id for token_digest, app_id in tokens
+        }
 
-    def batch_load(self, keys):
-        last_4s_to_raw_token_map = defaultdict(list)
+    def get_app_ids_by_password(self, token_infos: list[TokenInfo]) -> dict[str, int]:
+        """Return app IDs of tokens that match the password hashes of app tokens.
 
-        for raw_token in keys:
-            token_info = TokenInfo(raw_token=raw_token)
+        Matching tokens are cached, so the password hash is checked only once per
+        token. When authentication by digest is enabled, digests of the matching
+        tokens are stored, so next requests find them by the digest.
+        """
+        last_4s_to_raw_token_map = defaultdict(list)
+        for token_info in token_infos:
             last_4s_to_raw_token_map[token_info.last_4].append(token_info)
+        cached_data = cache.get_many(
+            [token_info.cache_key for token_info in token_infos]
+        )
 
-        # Fetch tokens for keys that are not in the cache and check if they are valid
-        authed_apps = {}
         tokens = (
             AppToken.objects.using(self.database_connection_name)
             .filter(token_last_4__in=last_4s_to_raw_token_map.keys())
             .values_list("auth_token", "token_last_4", "app_id", "id")
         )
-        tokens_found = set()
+        authed_apps = {}
+        data_to_cache = {}
+        digests_to_store = {}
         for auth_token, token_last_4, app_id, token_id in tokens:
             for token_info in last_4s_to_raw_token_map[token_last_4]:
-                if token_info.raw_token in tokens_found:
+                if token_info.raw_token in authed_apps:
                     # Skip if we already checked this token
                     continue
-                app_id = self.get_and_cache_app_id(
-                    token_info, token_id, auth_token, app_id
-                )
-                if app_id:
+                if cached := cached_data.get(token_info.cache_key):
+                    cached_app_id, cached_token_id = cached
+                    if token_id != cached_token_id:
+                        continue
+                    authed_apps[token_info.raw_token] = cached_app_id
+                elif check_password(token_info.raw_token, auth_token):
                     authed_apps[token_info.raw_token] = app_id
-                    tokens_found.add(token_info.raw_token)
+                    data_to_cache[token_info.cache_key] = (app_id, token_id)
+                else:
+                    continue
+                if settings.APP_TOKEN_DIGEST_ENABLED:
+                    digests_to_store[token_id] = get_app_token_digest(
+                        token_info.raw_token
+                    )
 
+        if data_to_cache:
+            cache.set_many(data_to_cache, CACHE_TIMEOUT)
         # Remove the cache for tokens that are not valid
-        self.remove_not_valid_tokens_from_cache(last_4s_to_raw_token_map, tokens_found)
+        not_valid_cache_keys = [
+            token_info.cache_key
+            for token_info in token_infos
+            if token_info.raw_token not in authed_apps
+        ]
+        if not_valid_cache_keys:
+            cache.delete_many(not_valid_cache_keys)
+        if digests_to_store:
+            self.store_token_digests(digests_to_store)
+        return authed_apps
+
+    def store_token_digests(self, digests: dict[int, str]):
+        with allow_writer():
+            for token_id, token_digest in digests.items():
+                AppToken.objects.filter(id=token_id).update(token_digest=token_digest)
+
+    def batch_load(self, keys):
+        token_infos = [TokenInfo(raw_token=raw_token) for raw_token in set(keys)]
+
+        authed_apps = {}
+        if settings.APP_TOKEN_DIGEST_ENABLED:
+            authed_apps = self.get_app_ids_by_digest(token_infos)
+        if not_authed_token_infos := [
+            token_info
+            for token_info in token_infos
+            if token_info.raw_token not in authed_apps
+        ]:
+            authed_apps.update(self.get_app_ids_by_password(not_authed_token_infos))
 
         apps = (
             App.objects.using(self.database_connection_name)
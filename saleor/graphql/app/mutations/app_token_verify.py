@@ -1,4 +1,5 @@
 import graphene
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
 from django.db.models import Exists, OuterRef, Q
 
@@ -29,8 +30,18 @@ class AppTokenVerify(BaseMutation):
         apps = models.App.objects.filter(
             is_active=True, removed_at__isnull=True
         ).values("pk")
-        tokens = models.AppToken.objects.filter(
-            Q(token_last_4=token[-4:]), Exists(apps.filter(pk=OuterRef("app_id")))
-        ).values_list("auth_token", flat=True)
+        app_tokens = models.AppToken.objects.filter(
+            Exists(apps.filter(pk=OuterRef("app_id")))
+        )
+        if (
+            settings.APP_TOKEN_DIGEST_ENABLED
+            and app_tokens.filter(
+                token_digest=models.get_app_token_digest(token)
+            ).exists()
+        ):
+            return AppTokenVerify(valid=True)
+        tokens = app_tokens.filter(Q(token_last_4=token[-4:])).values_list(
+            "auth_token", flat=True
+        )
         valid = any(check_password(token, auth_token) for auth_token in tokens)
         return AppTokenVerify(valid=valid)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from ....tests.utils import get_graphql_content
 
 APP_TOKEN_VERIFY_MUTATION = """
@@ -75,3 +77,22 @@ def test_app_token_verify_removed_app(removed_app, api_client):
     app_data = content["data"]["appTokenVerify"]
     assert app_data["valid"] is False
     assert not app_data["errors"]
+
+
+@patch("saleor.graphql.app.mutations.app_token_verify.check_password")
+def test_app_token_verify_valid_token_by_digest(
+    mocked_check_password, app, api_client, settings
+):
+    # given
+    settings.APP_TOKEN_DIGEST_ENABLED = True
+    _, token = app.tokens.create()
+    query = APP_TOKEN_VERIFY_MUTATION
+    variables = {"token": token}
+
+    # when
+    response = api_client.post_graphql(query, variables=variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["appTokenVerify"]["valid"]
+    mocked_check_password.assert_not_called()
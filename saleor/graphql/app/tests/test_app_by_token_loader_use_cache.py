@@ -2,9 +2,13 @@ from unittest.mock import patch
 
 from django.utils import timezone
 
-from ....app.models import App, AppToken
+from ....app.models import App, AppToken, get_app_token_digest
 from ...context import SaleorContext
-from ..dataloaders.app import AppByTokenLoader, create_app_cache_key_from_token
+from ..dataloaders.app import (
+    CACHE_TIMEOUT,
+    AppByTokenLoader,
+    create_app_cache_key_from_token,
+)
 
 
 @patch("saleor.graphql.app.dataloaders.app.cache")
@@ -256,8 +260,12 @@ def test_app_by_token_loader_one_of_tokens_in_cache(
     cached_app_id2, cached_token_id2 = mocked_cache.get(expected_cache_key2)
     assert token2.id == cached_token_id2
     assert fetched_app2.id == app.id == cached_app_id2
-    # Check that the cache was set once during given test section and second time inside dataloader
-    assert mocked_cache.set.call_count == 2
+    # Check that the cache was set once during given test section and the second
+    # token was cached inside dataloader
+    assert mocked_cache.set.call_count == 1
+    mocked_cache.set_many.assert_called_once_with(
+        {expected_cache_key2: (app.id, token2.id)}, CACHE_TIMEOUT
+    )
 
 
 @patch("saleor.graphql.app.dataloaders.app.cache")
@@ -297,5 +305,67 @@ def test_app_by_token_loader_tokens_with_same_last_4(
     cached_app_id2, cached_token_id2 = mocked_cache.get(expected_cache_key2)
     assert token2.id == cached_token_id2
     assert fetched_app2.id == app2.id == cached_app_id2
-    # Check that the cache was set once during given test section and second time inside dataloader
-    assert mocked_cache.set.call_count == 2
+    # Check that both tokens were cached at once inside dataloader
+    mocked_cache.set_many.assert_called_once_with(
+        {
+            expected_cache_key: (app.id, token.id),
+            expected_cache_key2: (app2.id, token2.id),
+        },
+        CACHE_TIMEOUT,
+    )
+
+
+@patch("saleor.graphql.app.dataloaders.app.check_password")
+def test_app_by_token_loader_finds_token_by_digest(
+    mocked_check_password, app, settings
+):
+    # given
+    settings.APP_TOKEN_DIGEST_ENABLED = True
+    raw_token = "test_token"
+    app.tokens.create(name="test_token", auth_token=raw_token)
+
+    # when
+    context = SaleorContext()
+    loaded_apps = AppByTokenLoader(context).batch_load([raw_token])
+
+    # then
+    assert loaded_apps[0].id == app.id
+    mocked_check_password.assert_not_called()
+
+
+@patch("saleor.graphql.app.dataloaders.app.cache")
+def test_app_by_token_loader_stores_digest_of_token_without_digest(
+    mocked_cache, app, settings, setup_mock_for_cache
+):
+    # given
+    setup_mock_for_cache({}, mocked_cache)
+    settings.APP_TOKEN_DIGEST_ENABLED = True
+    raw_token = "test_token"
+    token, _ = app.tokens.create(name="test_token", auth_token=raw_token)
+    AppToken.objects.filter(id=token.id).update(token_digest=None)
+
+    # when
+    context = SaleorContext()
+    loaded_apps = AppByTokenLoader(context).batch_load([raw_token])
+
+    # then
+    assert loaded_apps[0].id == app.id
+    token.refresh_from_db()
+    assert token.token_digest == get_app_token_digest(raw_token)
+
+
+def test_app_by_token_loader_digest_disabled(app, settings):
+    # given
+    settings.APP_TOKEN_DIGEST_ENABLED = False
+    raw_token = "test_token"
+    token, _ = app.tokens.create(name="test_token", auth_token=raw_token)
+    AppToken.objects.filter(id=token.id).update(token_digest=None)
+
+    # when
+    context = SaleorContext()
+    loaded_apps = AppByTokenLoader(context).batch_load([raw_token])
+
+    # then
+    assert loaded_apps[0].id == app.id
+    token.refresh_from_db()
+    assert token.token_digest is None
@@ -4,6 +4,13 @@ from collections.abc import Sequence
 from promise import Promise
 
 from ....checkout.fetch import CheckoutInfo, CheckoutLineInfo
+from ....checkout.snapshot import (
+    generate_checkout_snapshot_cache_key,
+    get_checkout_lines_snapshots,
+    get_checkout_snapshot_catalogue_version,
+    is_checkout_snapshot_cacheable,
+    set_checkout_lines_snapshots,
+)
 from ....core.db.connection import allow_writer_in_context
 from ....discount import VoucherType
 from ....discount.utils.voucher import attach_voucher_to_line_info
@@ -216,158 +223,193 @@ class CheckoutLinesInfoByCheckoutTokenLoader(
     def batch_load(self, keys):
         def with_checkout_lines(results):
             checkouts, checkout_lines = results
+            # Checkouts of unknown tokens are skipped, they have no lines info.
+            lines_by_checkout = {
+                checkout.pk: lines
+                for checkout, lines in zip(checkouts, checkout_lines, strict=False)
+                if checkout is not None
+            }
+            checkouts = [checkout for checkout in checkouts if checkout is not None]
+            cache_keys = {}
+            if cacheable_checkouts := [
+                checkout
+                for checkout in checkouts
+                if is_checkout_snapshot_cacheable(checkout)
+            ]:
+                catalogue_version = get_checkout_snapshot_catalogue_version()
+                cache_keys = {
+                    checkout.pk: generate_checkout_snapshot_cache_key(
+                        checkout, lines_by_checkout[checkout.pk], catalogue_version
+                    )
+                    for checkout in cacheable_checkouts
+                }
+            cached_lines_info = (
+                get_checkout_lines_snapshots(cache_keys, lines_by_checkout)
+                if cache_keys
+                else {}
+            )
 
-            variants_pks = set()
-            lines_pks = set()
-            for lines in checkout_lines:
-                for line in lines:
-                    lines_pks.add(line.id)
-                    variants_pks.add(line.variant_id)
-            lines_pks = list(lines_pks)
-            variants_pks = list(variants_pks)
-            if not variants_pks:
-                return [[] for _ in keys]
-
-            channel_pks = [checkout.channel_id for checkout in checkouts]
+            def with_lines_info(lines_info_map):
+                set_checkout_lines_snapshots(checkouts, cache_keys, lines_info_map)
+                lines_info_map.update(cached_lines_info)
+                return [lines_info_map.get(key, []) for key in keys]
 
-            @allow_writer_in_context(self.context)
-            def with_variants_products_collections(results):
-                (
-                    variants,
-                    products,
-                    product_types,
-                    collections,
-                    tax_classes,
-                    channel_listings,
-                    voucher_infos,
-                    channels,
-                    checkout_lines_discounts,
-                    variant_promotion_rules_info,
-                ) = results
-                variants_map = dict(zip(variants_pks, variants, strict=False))
-                products_map = dict(zip(variants_pks, products, strict=False))
-                product_types_map = dict(zip(variants_pks, product_types, strict=False))
-                collections_map = dict(zip(variants_pks, collections, strict=False))
-                tax_class_map = dict(zip(variants_pks, tax_classes, strict=False))
-                channel_listings_map = dict(
-                    zip(variant_ids_channel_ids, channel_listings, strict=False)
-                )
-                channels = dict(zip(channel_pks, channels, strict=False))
-                checkout_lines_discounts = dict(
-                    zip(lines_pks, checkout_lines_discounts, strict=False)
-                )
-                rules_info_map = dict(
-                    zip(lines_pks, variant_promotion_rules_info, strict=False)
-                )
+            not_cached = [
+                checkout
+                for checkout in checkouts
+                if checkout.pk not in cached_lines_info
+            ]
+            return self.load_lines_info(
+                not_cached, [lines_by_checkout[checkout.pk] for checkout in not_cached]
+            ).then(with_lines_info)
 
-                lines_info_map = defaultdict(list)
-                voucher_infos_map = {
-                    voucher_info.voucher_code: voucher_info
-                    for voucher_info in voucher_infos
-                    if voucher_info is not None and voucher_info.voucher_code
-                }
-                for checkout, lines in zip(checkouts, checkout_lines, strict=False):
-                    lines_info_map[checkout.pk].extend(
-                        [
-                            CheckoutLineInfo(
-                                line=line,
-                                variant=variants_map[line.variant_id],
-                                channel_listing=channel_listings_map[
-                                    (line.variant_id, checkout.channel_id)
-                                ],
-                                product=products_map[line.variant_id],
-                                product_type=product_types_map[line.variant_id],
-                                collections=sorted(
-                                    collections_map[line.variant_id],
-                                    key=(
-                                        lambda collection: (
-                                            collection.slug if collection else ""
-                                        )
-                                    ),
-                                ),
-                                discounts=checkout_lines_discounts[line.id],
-                                tax_class=tax_class_map[line.variant_id],
-                                channel=channels[checkout.channel_id],
-                                rules_info=rules_info_map[line.id],
-                                voucher=None,
-                                voucher_code=None,
-                            )
-                            for line in lines
-                        ]
-                    )
+        checkouts = CheckoutByTokenLoader(self.context).load_many(keys)
+        checkout_lines = CheckoutLinesByCheckoutTokenLoader(self.context).load_many(
+            keys
+        )
+        return Promise.all([checkouts, checkout_lines]).then(with_checkout_lines)
 
-                for checkout in checkouts:
-                    if not checkout.voucher_code:
-                        continue
-                    voucher_info = voucher_infos_map.get(checkout.voucher_code)
-                    if not voucher_info:
-                        continue
-                    voucher = voucher_info.voucher
-                    if (
-                        voucher.type == VoucherType.SPECIFIC_PRODUCT
-                        or voucher.apply_once_per_order
-                    ):
-                        attach_voucher_to_line_info(
-                            voucher_info=voucher_info,
-                            lines_info=lines_info_map[checkout.pk],
-                        )
-                return [lines_info_map[key] for key in keys]
-
-            checkout_lines_discounts = CheckoutLineDiscountsByCheckoutLineIdLoader(
-                self.context
-            ).load_many(lines_pks)
-            variant_promotion_rules_info = (
-                VariantPromotionRuleInfoByCheckoutLineIdLoader(self.context).load_many(
-                    lines_pks
-                )
-            )
-            variants = ProductVariantByIdLoader(self.context).load_many(variants_pks)
-            products = ProductByVariantIdLoader(self.context).load_many(variants_pks)
-            product_types = ProductTypeByVariantIdLoader(self.context).load_many(
-                variants_pks
+    def load_lines_info(self, checkouts, checkout_lines):
+        """Return a promise of the checkouts lines info mapped by checkout token."""
+        variants_pks = set()
+        lines_pks = set()
+        for lines in checkout_lines:
+            for line in lines:
+                lines_pks.add(line.id)
+                variants_pks.add(line.variant_id)
+        lines_pks = list(lines_pks)
+        variants_pks = list(variants_pks)
+        if not variants_pks:
+            return Promise.resolve({checkout.pk: [] for checkout in checkouts})
+
+        channel_pks = [checkout.channel_id for checkout in checkouts]
+
+        @allow_writer_in_context(self.context)
+        def with_variants_products_collections(results):
+            (
+                variants,
+                products,
+                product_types,
+                collections,
+                tax_classes,
+                channel_listings,
+                voucher_infos,
+                channels,
+                checkout_lines_discounts,
+                variant_promotion_rules_info,
+            ) = results
+            variants_map = dict(zip(variants_pks, variants, strict=False))
+            products_map = dict(zip(variants_pks, products, strict=False))
+            product_types_map = dict(zip(variants_pks, product_types, strict=False))
+            collections_map = dict(zip(variants_pks, collections, strict=False))
+            tax_class_map = dict(zip(variants_pks, tax_classes, strict=False))
+            channel_listings_map = dict(
+                zip(variant_ids_channel_ids, channel_listings, strict=False)
             )
-            collections = CollectionsByVariantIdLoader(self.context).load_many(
-                variants_pks
+            channels = dict(zip(channel_pks, channels, strict=False))
+            checkout_lines_discounts = dict(
+                zip(lines_pks, checkout_lines_discounts, strict=False)
             )
-            tax_classes = TaxClassByVariantIdLoader(self.context).load_many(
-                variants_pks
+            rules_info_map = dict(
+                zip(lines_pks, variant_promotion_rules_info, strict=False)
             )
 
-            voucher_codes = {
-                checkout.voucher_code for checkout in checkouts if checkout.voucher_code
+            lines_info_map = defaultdict(list)
+            voucher_infos_map = {
+                voucher_info.voucher_code: voucher_info
+                for voucher_info in voucher_infos
+                if voucher_info is not None and voucher_info.voucher_code
             }
-            voucher_infos = VoucherInfoByVoucherCodeLoader(self.context).load_many(
-                voucher_codes
-            )
-
-            variant_ids_channel_ids = []
-            for channel_id, lines in zip(channel_pks, checkout_lines, strict=False):
-                variant_ids_channel_ids.extend(
-                    [(line.variant_id, channel_id) for line in lines]
+            for checkout, lines in zip(checkouts, checkout_lines, strict=False):
+                lines_info_map[checkout.pk].extend(
+                    [
+                        CheckoutLineInfo(
+                            line=line,
+                            variant=variants_map[line.variant_id],
+                            channel_listing=channel_listings_map[
+                                (line.variant_id, checkout.channel_id)
+                            ],
+                            product=products_map[line.variant_id],
+                            product_type=product_types_map[line.variant_id],
+                            collections=sorted(
+                                collections_map[line.variant_id],
+                                key=(
+                                    lambda collection: (
+                                        collection.slug if collection else ""
+                                    )
+                                ),
+                            ),
+                            discounts=checkout_lines_discounts[line.id],
+                            tax_class=tax_class_map[line.variant_id],
+                            channel=channels[checkout.channel_id],
+                            rules_info=rules_info_map[line.id],
+                            voucher=None,
+                            voucher_code=None,
+                        )
+                        for line in lines
+                    ]
                 )
 
-            channel_listings = VariantChannelListingByVariantIdAndChannelIdLoader(
-                self.context
-            ).load_many(variant_ids_channel_ids)
-
-            channels = ChannelByIdLoader(self.context).load_many(channel_pks)
-            return Promise.all(
-                [
-                    variants,
-                    products,
-                    product_types,
-                    collections,
-                    tax_classes,
-                    channel_listings,
-                    voucher_infos,
-                    channels,
-                    checkout_lines_discounts,
-                    variant_promotion_rules_info,
-                ]
-            ).then(with_variants_products_collections)
+            for checkout in checkouts:
+                if not checkout.voucher_code:
+                    continue
+                voucher_info = voucher_infos_map.get(checkout.voucher_code)
+                if not voucher_info:
+                    continue
+                voucher = voucher_info.voucher
+                if (
+                    voucher.type == VoucherType.SPECIFIC_PRODUCT
+                    or voucher.apply_once_per_order
+                ):
+                    attach_voucher_to_line_info(
+                        voucher_info=voucher_info,
+                        lines_info=lines_info_map[checkout.pk],
+                    )
+            return {checkout.pk: lines_info_map[checkout.pk] for checkout in checkouts}
 
-        checkouts = CheckoutByTokenLoader(self.context).load_many(keys)
-        checkout_lines = CheckoutLinesByCheckoutTokenLoader(self.context).load_many(
-            keys
+        checkout_lines_discounts = CheckoutLineDiscountsByCheckoutLineIdLoader(
+            self.context
+        ).load_many(lines_pks)
+        variant_promotion_rules_info = VariantPromotionRuleInfoByCheckoutLineIdLoader(
+            self.context
+        ).load_many(lines_pks)
+        variants = ProductVariantByIdLoader(self.context).load_many(variants_pks)
+        products = ProductByVariantIdLoader(self.context).load_many(variants_pks)
+        product_types = ProductTypeByVariantIdLoader(self.context).load_many(
+            variants_pks
         )
-        return Promise.all([checkouts, checkout_lines]).then(with_checkout_lines)
+        collections = CollectionsByVariantIdLoader(self.context).load_many(variants_pks)
+        tax_classes = TaxClassByVariantIdLoader(self.context).load_many(variants_pks)
+
+        voucher_codes = {
+            checkout.voucher_code for checkout in checkouts if checkout.voucher_code
+        }
+        voucher_infos = VoucherInfoByVoucherCodeLoader(self.context).load_many(
+            voucher_codes
+        )
+
+        variant_ids_channel_ids = []
+        for channel_id, lines in zip(channel_pks, checkout_lines, strict=False):
+            variant_ids_channel_ids.extend(
+                [(line.variant_id, channel_id) for line in lines]
+            )
+
+        channel_listings = VariantChannelListingByVariantIdAndChannelIdLoader(
+            self.context
+        ).load_many(variant_ids_channel_ids)
+
+        channels = ChannelByIdLoader(self.context).load_many(channel_pks)
+        return Promise.all(
+            [
+                variants,
+                products,
+                product_types,
+                collections,
+                tax_classes,
+                channel_listings,
+                voucher_infos,
+                channels,
+                checkout_lines_discounts,
+                variant_promotion_rules_info,
+            ]
+        ).then(with_variants_products_collections)
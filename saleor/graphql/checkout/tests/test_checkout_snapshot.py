@@ -0,0 +1,118 @@
+import datetime
+import uuid
+from unittest.mock import patch
+
+import graphene
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ....checkout.snapshot import invalidate_checkout_snapshots
+from ....plugins.manager import get_plugins_manager
+from ...context import SaleorContext
+from ...tests.utils import get_graphql_content
+from ..dataloaders import CheckoutLinesInfoByCheckoutTokenLoader
+
+QUERY_CHECKOUT_LINES = """
+query getCheckout($id: ID) {
+  checkout(id: $id) {
+    totalPrice {
+      gross {
+        amount
+      }
+    }
+    lines {
+      quantity
+      variant {
+        id
+      }
+      totalPrice {
+        gross {
+          amount
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _query_checkout(api_client, checkout):
+    variables = {"id": graphene.Node.to_global_id("Checkout", checkout.pk)}
+    with CaptureQueriesContext(connection) as queries:
+        content = get_graphql_content(
+            api_client.post_graphql(QUERY_CHECKOUT_LINES, variables)
+        )
+    return content["data"]["checkout"], len(queries)
+
+
+def test_checkout_query_uses_lines_snapshot(api_client, checkout_with_items, settings):
+    # given
+    settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED = True
+    checkout = checkout_with_items
+    checkout.price_expiration = timezone.now() + datetime.timedelta(minutes=5)
+    checkout.save(update_fields=["price_expiration"])
+    data, queries_count = _query_checkout(api_client, checkout)
+
+    # when
+    cached_data, cached_queries_count = _query_checkout(api_client, checkout)
+
+    # then
+    assert cached_data == data
+    assert cached_queries_count < queries_count
+
+
+def test_checkout_query_lines_snapshot_outdated_by_line_change(
+    api_client, checkout_with_items, settings
+):
+    # given
+    settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED = True
+    checkout = checkout_with_items
+    checkout.price_expiration = timezone.now() + datetime.timedelta(minutes=5)
+    checkout.save(update_fields=["price_expiration"])
+    _query_checkout(api_client, checkout)
+
+    # when
+    line = checkout.lines.first()
+    line.delete()
+    data, _ = _query_checkout(api_client, checkout)
+
+    # then
+    assert len(data["lines"]) == checkout.lines.count()
+
+
+@patch(
+    "saleor.plugins.manager.invalidate_checkout_snapshots",
+    wraps=invalidate_checkout_snapshots,
+)
+def test_product_updated_outdates_lines_snapshots(
+    mocked_invalidate_checkout_snapshots, product, settings
+):
+    # given
+    settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED = True
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    manager.product_updated(product)
+
+    # then
+    mocked_invalidate_checkout_snapshots.assert_called_once_with()
+
+
+def test_checkout_lines_info_loader_with_unknown_token(checkout_with_items, settings):
+    # given
+    settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED = True
+    checkout = checkout_with_items
+    checkout.price_expiration = timezone.now() + datetime.timedelta(minutes=5)
+    checkout.save(update_fields=["price_expiration"])
+    unknown_token = uuid.uuid4()
+
+    # when
+    loader = CheckoutLinesInfoByCheckoutTokenLoader(SaleorContext())
+    lines_info, unknown_lines_info = loader.batch_load(
+        [checkout.token, unknown_token]
+    ).get()
+
+    # then
+    assert [line_info.line for line_info in lines_info] == list(checkout.lines.all())
+    assert unknown_lines_info == []
@@ -17,7 +17,8 @@ from graphql_relay.utils import base64, unbase64
 from ...channel.exceptions import ChannelNotDefined, NoDefaultChannel
 from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core.context import ChannelContext, ChannelQsContext
-from ..core.enums import OrderDirection
+from ..core.descriptions import ADDED_IN_323, PREVIEW_FEATURE
+from ..core.enums import OrderDirection, TotalCountMode
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
 from .context import SyncWebhookControlContext
@@ -244,6 +245,33 @@ def _get_id_coercion(qs: QuerySet) -> Callable[[str], Any]:
     return qs.model.id.field.to_python if hasattr(qs.model, "id") else int
 
 
+def get_estimated_count(qs: QuerySet) -> int:
+    """Return the number of rows the query planner expects the queryset to return."""
+    plan = json.loads(qs.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_queryset_total_count(
+    qs: QuerySet, mode: str, exact_count_limit: int = 0
+) -> tuple[int, bool]:
+    """Return the total count of the queryset and whether it is exact.
+
+    In the estimate mode, the planner estimate is returned unless it's below
+    `GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD`. When `exact_count_limit` is set, at most
+    that many rows are counted; larger result sets fall back to the estimate.
+    """
+    if mode == TotalCountMode.ESTIMATE.value:
+        estimated_count = get_estimated_count(qs)
+        if estimated_count >= settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD:
+            return estimated_count, False
+    if not exact_count_limit:
+        return qs.count(), True
+    count = qs[: exact_count_limit + 1].count()
+    if count <= exact_count_limit:
+        return count, True
+    return max(get_estimated_count(qs), count), False
+
+
 def connection_from_queryset_slice(
     qs: QuerySet,
     args: ConnectionArguments | None = None,
@@ -293,9 +321,18 @@ def connection_from_queryset_slice(
     )
 
     if "total_count" in connection_type._meta.fields:
-
-        def get_total_count():
-            return qs.count()
+        exact_count_limit = getattr(connection_type, "exact_total_count_limit", None)
+        if exact_count_limit is None:
+            exact_count_limit = settings.GRAPHQL_TOTAL_COUNT_EXACT_LIMIT
+        total_counts: dict[str, tuple[int, bool]] = {}
+
+        def get_total_count(mode=None):
+            mode = mode or settings.GRAPHQL_TOTAL_COUNT_DEFAULT_MODE
+            if mode not in total_counts:
+                total_counts[mode] = get_queryset_total_count(
+                    qs, mode, exact_count_limit
+                )
+            return total_counts[mode]
 
         return connection_type(
             edges=edges,
@@ -710,10 +747,34 @@ class CountableConnection(NonNullConnection):
     class Meta:
         abstract = True
 
-    total_count = graphene.Int(description="A total count of items in the collection.")
+    total_count = graphene.Int(
+        description="A total count of items in the collection.",
+        mode=graphene.Argument(
+            TotalCountMode,
+            description=(
+                "Whether to count the items exactly or use an estimate. Uses the "
+                "server default when not provided." + ADDED_IN_323 + PREVIEW_FEATURE
+            ),
+        ),
+    )
+    total_count_is_exact = graphene.Boolean(
+        description=(
+            "Whether `totalCount` requested with the same `mode` is an exact number."
+            + ADDED_IN_323
+            + PREVIEW_FEATURE
+        ),
+        mode=graphene.Argument(
+            TotalCountMode,
+            description="The mode used to request `totalCount`.",
+        ),
+    )
+
+    # Max number of items counted exactly in `totalCount` of this connection;
+    # `None` falls back to `GRAPHQL_TOTAL_COUNT_EXACT_LIMIT`.
+    exact_total_count_limit: int | None = None
 
     @staticmethod
-    def resolve_total_count(root, _info):
+    def _get_total_count(root, mode) -> tuple[int, bool] | None:
         try:
             if isinstance(root, dict):
                 total_count = root["total_count"]
@@ -723,6 +784,19 @@ class CountableConnection(NonNullConnection):
             return None
 
         if callable(total_count):
-            return total_count()
+            return total_count(mode)
+
+        if total_count is None:
+            return None
 
-        return total_count
+        return total_count, True
+
+    @staticmethod
+    def resolve_total_count(root, _info, mode=None):
+        result = CountableConnection._get_total_count(root, mode)
+        return result[0] if result else None
+
+    @staticmethod
+    def resolve_total_count_is_exact(root, _info, mode=None):
+        result = CountableConnection._get_total_count(root, mode)
+        return result[1] if result else None
@@ -74,6 +74,23 @@ class ReportingPeriod(graphene.Enum):
     THIS_MONTH = "THIS_MONTH"
 
 
+class TotalCountMode(graphene.Enum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+    @property
+    def description(self):
+        # pylint: disable=no-member
+        if self == TotalCountMode.EXACT:
+            return "Count all matching items."
+        if self == TotalCountMode.ESTIMATE:
+            return (
+                "Use the row estimate of the query planner. Small result sets are "
+                "still counted exactly."
+            )
+        raise ValueError(f"Unsupported enum value: {self.value}")
+
+
 def to_enum(enum_cls, *, type_name=None, **options) -> graphene.Enum:
     """Create a Graphene enum from a class containing a set of options.
 
@@ -1,11 +1,17 @@
 import base64
 import math
+from unittest.mock import patch
 
 import graphene
 import pytest
+from django.test import override_settings
 
 from ....tests.models import Book
-from ..connection import CountableConnection, create_connection_slice
+from ..connection import (
+    CountableConnection,
+    create_connection_slice,
+    get_estimated_count,
+)
 from ..fields import ConnectionField
 
 
@@ -353,3 +359,110 @@ def test_query_with_pagination_and_inline_fragments(books):
     assert not result.errors
     content = result.data
     assert len(content["books"]["edges"]) == page_size
+
+
+QUERY_TOTAL_COUNT = """
+    query BooksTotalCount($mode: TotalCountMode) {
+        books(first: 1) {
+            totalCount(mode: $mode)
+            totalCountIsExact(mode: $mode)
+        }
+    }
+"""
+
+
+def test_total_count_exact(books):
+    # when
+    result = schema.execute(QUERY_TOTAL_COUNT, variables={"mode": "EXACT"})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["books"]["totalCountIsExact"] is True
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD=1000)
+@patch("saleor.graphql.core.connection.get_estimated_count")
+def test_total_count_estimate(get_estimated_count_mock, books):
+    # given
+    get_estimated_count_mock.return_value = 5000
+
+    # when
+    result = schema.execute(QUERY_TOTAL_COUNT, variables={"mode": "ESTIMATE"})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == 5000
+    assert result.data["books"]["totalCountIsExact"] is False
+    get_estimated_count_mock.assert_called_once()
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD=1000)
+@patch("saleor.graphql.core.connection.get_estimated_count")
+def test_total_count_estimate_below_threshold_is_exact(get_estimated_count_mock, books):
+    # given
+    get_estimated_count_mock.return_value = 30
+
+    # when
+    result = schema.execute(QUERY_TOTAL_COUNT, variables={"mode": "ESTIMATE"})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["books"]["totalCountIsExact"] is True
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_DEFAULT_MODE="estimate")
+@patch("saleor.graphql.core.connection.get_estimated_count")
+def test_total_count_uses_default_mode(get_estimated_count_mock, books):
+    # given
+    get_estimated_count_mock.return_value = 20000
+
+    # when
+    result = schema.execute(QUERY_TOTAL_COUNT)
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == 20000
+    assert result.data["books"]["totalCountIsExact"] is False
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_EXACT_LIMIT=10)
+@patch("saleor.graphql.core.connection.get_estimated_count")
+def test_total_count_exact_limit_exceeded(get_estimated_count_mock, books):
+    # given
+    get_estimated_count_mock.return_value = 20
+
+    # when
+    result = schema.execute(QUERY_TOTAL_COUNT, variables={"mode": "EXACT"})
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == 20
+    assert result.data["books"]["totalCountIsExact"] is False
+
+
+@override_settings(GRAPHQL_TOTAL_COUNT_EXACT_LIMIT=10)
+def test_total_count_exact_limit_overridden_by_connection(books):
+    # given
+    BookTypeCountableConnection.exact_total_count_limit = 100
+
+    # when
+    try:
+        result = schema.execute(QUERY_TOTAL_COUNT, variables={"mode": "EXACT"})
+    finally:
+        BookTypeCountableConnection.exact_total_count_limit = None
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == len(books)
+    assert result.data["books"]["totalCountIsExact"] is True
+
+
+def test_get_estimated_count(books):
+    # when
+    estimated_count = get_estimated_count(Book.objects.all())
+
+    # then
+    assert isinstance(estimated_count, int)
+    assert estimated_count >= 0
@@ -1,9 +1,19 @@
+from unittest.mock import patch
+
 import graphene
 import pytest
 from django.test import override_settings
+from graphql import validate
 
+from ...api import backend, schema
 from ...query_cost_map import COST_MAP
 from ..const import DEFAULT_NESTED_LIST_LIMIT
+from ..validators.query_cost import (
+    QueryCostCache,
+    QueryCostError,
+    get_multiplier_variable_names,
+    validate_query_cost,
+)
 
 
 @override_settings(GRAPHQL_QUERY_MAX_COMPLEXITY=1)
@@ -548,3 +558,94 @@ def test_query_with_not_required_limit_argument_not_provided(
     assert (
         query_cost == 100 * 1 + 100 * DEFAULT_NESTED_LIST_LIMIT
     )  # 100 attributes + 100 product types (limit value) per attribute
+
+
+def test_get_multiplier_variable_names():
+    # given
+    document = backend.document_from_string(schema, PRODUCTS_QUERY_WITH_FRAGMENT)
+
+    # when
+    variable_names = get_multiplier_variable_names(
+        document.document_ast, {"first", "last"}
+    )
+
+    # then
+    assert variable_names == ("first",)
+
+
+def test_validate_query_cost_uses_cache():
+    # given
+    cache = QueryCostCache(COST_MAP)
+    document = backend.document_from_string(schema, PRODUCTS_QUERY)
+    variables = {"channel": "main", "first": 5}
+    expected_cost, _ = validate_query_cost(schema, document, variables, COST_MAP, 50000)
+
+    # when
+    with patch(
+        "saleor.graphql.core.validators.query_cost.validate", wraps=validate
+    ) as validate_mock:
+        first_cost, first_errors = validate_query_cost(
+            schema, document, variables, COST_MAP, 50000, cache=cache
+        )
+        second_cost, second_errors = validate_query_cost(
+            schema, document, variables, COST_MAP, 50000, cache=cache
+        )
+
+    # then
+    assert first_cost == second_cost == expected_cost
+    assert first_errors is None
+    assert second_errors is None
+    validate_mock.assert_called_once()
+
+
+def test_validate_query_cost_cache_recalculates_for_different_multipliers():
+    # given
+    cache = QueryCostCache(COST_MAP)
+    document = backend.document_from_string(schema, PRODUCTS_QUERY)
+    validate_query_cost(
+        schema, document, {"channel": "main", "first": 5}, COST_MAP, 50000, cache=cache
+    )
+
+    # when
+    cost, errors = validate_query_cost(
+        schema,
+        document,
+        {"channel": "other", "first": 10},
+        COST_MAP,
+        50000,
+        cache=cache,
+    )
+
+    # then
+    expected_cost, _ = validate_query_cost(
+        schema, document, {"channel": "other", "first": 10}, COST_MAP, 50000
+    )
+    assert cost == expected_cost
+    assert (
+        cost
+        != cache.get(
+            cache.get_key(document.document_string, document.document_ast, {"first": 5})
+        )[-1]
+    )
+    assert errors is None
+
+
+def test_validate_query_cost_cache_returns_cost_exceeded_error():
+    # given
+    cache = QueryCostCache(COST_MAP)
+    document = backend.document_from_string(schema, PRODUCTS_QUERY)
+    variables = {"channel": "main", "first": 5}
+    validate_query_cost(schema, document, variables, COST_MAP, 50000, cache=cache)
+
+    # when
+    cost, errors = validate_query_cost(
+        schema, document, variables, COST_MAP, 10, cache=cache
+    )
+
+    # then
+    assert cost > 10
+    assert len(errors) == 1
+    assert isinstance(errors[0], QueryCostError)
+    assert str(errors[0]) == (
+        f"The query exceeds the maximum cost of 10. Actual cost is {cost}"
+    )
@@ -13,17 +13,22 @@ from graphql import (
 )
 from graphql.execution.values import get_argument_values
 from graphql.language.ast import (
+    Document,
     Field,
     FragmentDefinition,
     FragmentSpread,
     InlineFragment,
     OperationDefinition,
+    SelectionSet,
+    Variable,
 )
 from graphql.type import GraphQLField
 from graphql.validation import validate
 from graphql.validation.rules.base import ValidationRule
 from graphql.validation.validation import ValidationContext
 
+from ....core.utils.cache import CacheDict
+
 CostAwareNode = (
     Field | FragmentDefinition | FragmentSpread | InlineFragment | OperationDefinition
 )
@@ -53,6 +58,7 @@ class CostValidator(ValidationRule):
         self.default_cost = default_cost
         self.default_complexity = default_complexity
         self.cost = 0
+        self.operation_costs: list[int] = []
         self.operation_multipliers: list[Any] = []
 
     def __call__(self, context: ValidationContext):
@@ -191,6 +197,7 @@ class CostValidator(ValidationRule):
             )
 
     def leave_operation_definition(self, node, key, parent, path, ancestors):  # pylint: disable=unused-argument
+        self.operation_costs.append(self.cost)
         if self.cost > self.maximum_cost:
             self.context.report_error(self.get_cost_exceeded_error())
 
@@ -236,15 +243,7 @@ class CostValidator(ValidationRule):
         return [m for m in multipliers if m > 0]
 
     def get_cost_exceeded_error(self) -> "QueryCostError":
-        return QueryCostError(
-            cost_analysis_message(self.maximum_cost, self.cost),
-            extensions={
-                "cost": {
-                    "requestedQueryCost": self.cost,
-                    "maximumAvailable": self.maximum_cost,
-                }
-            },
-        )
+        return cost_exceeded_error(self.maximum_cost, self.cost)
 
     def enter(
         self,
@@ -306,10 +305,93 @@ def cost_analysis_message(maximum_cost: int, cost: int) -> str:
     )
 
 
+def cost_exceeded_error(maximum_cost: int, cost: int) -> "QueryCostError":
+    return QueryCostError(
+        cost_analysis_message(maximum_cost, cost),
+        extensions={
+            "cost": {
+                "requestedQueryCost": cost,
+                "maximumAvailable": maximum_cost,
+            }
+        },
+    )
+
+
 class QueryCostError(GraphQLError):
     pass
 
 
+class QueryCostCache:
+    """Bounded cache of computed query costs.
+
+    The cost of a document depends only on the document itself and on the values
+    of the variables passed to the multiplier arguments (e.g. `first`, `last`), so
+    the entries are keyed by the document string and those variable values.
+    Costs of documents that failed validation for other reasons than exceeding
+    the maximum cost are not stored.
+    """
+
+    def __init__(self, cost_map: dict[str, dict[str, Any]], capacity: int = 1000):
+        self.cost_map = cost_map
+        self.multiplier_arguments = get_multiplier_arguments(cost_map)
+        self._variable_names = CacheDict(
+            capacity, name="graphql_query_cost_variable_names"
+        )
+        self._costs = CacheDict(capacity, name="graphql_query_cost")
+
+    def get_key(self, document_string: str, document_ast: Document, variables):
+        variable_names = self._variable_names.get(document_string)
+        if variable_names is None:
+            variable_names = get_multiplier_variable_names(
+                document_ast, self.multiplier_arguments
+            )
+            self._variable_names[document_string] = variable_names
+        variables = variables if isinstance(variables, dict) else {}
+        return document_string, tuple(
+            repr(variables.get(name)) for name in variable_names
+        )
+
+    def get(self, key) -> list[int] | None:
+        return self._costs.get(key)
+
+    def set(self, key, operation_costs: list[int]):
+        self._costs[key] = operation_costs
+
+
+def get_multiplier_arguments(cost_map: dict[str, dict[str, Any]]) -> set[str]:
+    """Return names of all field arguments used as multipliers in the cost map."""
+    return {
+        multiplier.split(".")[0]
+        for type_fields in cost_map.values()
+        for field_cost in type_fields.values()
+        for multiplier in field_cost.get("multipliers", [])
+    }
+
+
+def get_multiplier_variable_names(
+    document_ast: Document, multiplier_arguments: set[str]
+) -> tuple[str, ...]:
+    """Return names of variables passed to the multiplier arguments."""
+    variable_names: set[str] = set()
+
+    def collect(selection_set: SelectionSet | None):
+        if not selection_set:
+            return
+        for selection in selection_set.selections:
+            if isinstance(selection, Field):
+                for argument in selection.arguments or []:
+                    if argument.name.value in multiplier_arguments and isinstance(
+                        argument.value, Variable
+                    ):
+                        variable_names.add(argument.value.name.value)
+            collect(getattr(selection, "selection_set", None))
+
+    for definition in document_ast.definitions:
+        if isinstance(definition, OperationDefinition | FragmentDefinition):
+            collect(definition.selection_set)
+    return tuple(sorted(variable_names))
+
+
 def cost_validator(
     maximum_cost: int,
     *,
@@ -333,7 +415,21 @@ def validate_query_cost(
     variables,
     cost_map,
     maximum_cost,
+    cache: QueryCostCache | None = None,
 ):
+    cache_key = None
+    if cache is not None and cache.cost_map is cost_map:
+        cache_key = cache.get_key(query.document_string, query.document_ast, variables)
+        operation_costs = cache.get(cache_key)
+        if operation_costs is not None:
+            cost = operation_costs[-1] if operation_costs else 0
+            errors = [
+                cost_exceeded_error(maximum_cost, operation_cost)
+                for operation_cost in operation_costs
+                if operation_cost > maximum_cost
+            ]
+            return cost, errors or None
+
     validator = cost_validator(
         maximum_cost,
         variables=variables,
@@ -344,6 +440,8 @@ def validate_query_cost(
         query.document_ast,
         [validator],  # type: ignore[list-item] # cost validator is an instance that pretends to be a class # noqa: E501
     )
+    if cache_key is not None and all(isinstance(e, QueryCostError) for e in error):
+        cache.set(cache_key, validator.operation_costs)  # type: ignore[union-attr]
     if error:
         return validator.cost, error
     return validator.cost, None
@@ -22,6 +22,7 @@ from ....account.utils import update_user_orders_count
 from ....app.models import App
 from ....channel.models import Channel
 from ....core import JobStatus
+from ....core.db.copy import copy_insert
 from ....core.prices import quantize_price
 from ....core.tracing import traced_atomic_transaction
 from ....core.utils.url import validate_storefront_url
@@ -1043,7 +1044,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         order_input: dict[str, Any],
         order_data: OrderBulkCreateData,
         object_storage: dict[str, Any],
-        info: ResolveInfo,
+        info: ResolveInfo | None,
     ):
         """Get all instances of objects needed to create an order."""
         user = cls.get_instance_with_errors(
@@ -2086,7 +2087,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         cls,
         order_input,
         object_storage: dict[str, Any],
-        info: ResolveInfo,
+        info: ResolveInfo | None,
         user_orders_count: dict[int, int],
     ) -> OrderBulkCreateData:
         order_data = OrderBulkCreateData()
@@ -2343,7 +2344,24 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         return orders_data
 
     @classmethod
-    def save_data(cls, orders_data: list[OrderBulkCreateData], stocks: list[Stock]):
+    def insert_instances(cls, model, instances: list, use_copy: bool):
+        if use_copy:
+            copy_insert(model, instances)
+        else:
+            model.objects.bulk_create(instances)
+
+    @classmethod
+    def save_data(
+        cls,
+        orders_data: list[OrderBulkCreateData],
+        stocks: list[Stock],
+        use_copy: bool = False,
+    ):
+        """Save the created orders and their related objects.
+
+        With `use_copy`, orders, order lines and discounts, which have primary keys
+        generated by the application, are inserted with `COPY`.
+        """
         for order_data in orders_data:
             order_data.set_quantity_fulfilled()
             order_data.set_fulfillment_order()
@@ -2360,7 +2378,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         Address.objects.bulk_create(addresses)
 
         orders = [order_data.order for order_data in orders_data if order_data.order]
-        Order.objects.bulk_create(orders)
+        cls.insert_instances(Order, orders, use_copy)
 
         order_lines: list[OrderLine] = sum(
             [
@@ -2370,7 +2388,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             ],
             [],
         )
-        OrderLine.objects.bulk_create(order_lines)
+        cls.insert_instances(OrderLine, order_lines, use_copy)
 
         order_line_discounts: list[OrderLineDiscount] = sum(
             [
@@ -2380,7 +2398,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             ],
             [],
         )
-        OrderLineDiscount.objects.bulk_create(order_line_discounts)
+        cls.insert_instances(OrderLineDiscount, order_line_discounts, use_copy)
 
         notes = [
             note
@@ -2446,7 +2464,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             ],
             [],
         )
-        OrderDiscount.objects.bulk_create(discounts)
+        cls.insert_instances(OrderDiscount, discounts, use_copy)
 
         for order_data in orders_data:
             order_data.link_gift_cards()
@@ -2466,6 +2484,38 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
 
         return orders_data
 
+    @classmethod
+    def process_orders(
+        cls,
+        orders_input: list[dict[str, Any]],
+        info: ResolveInfo | None,
+        user_orders_count: dict[int, int],
+        error_policy: str,
+        stock_update_policy: str,
+        use_copy: bool = False,
+    ) -> list[OrderBulkCreateData]:
+        """Validate the input and save orders according to the policies.
+
+        Should be called inside a transaction.
+        """
+        # Create dictionary, which stores already resolved objects:
+        #   - key for instances: "{model_name}.{key_name}.{key_value}"
+        #   - key for shipping prices: "shipping_price.{shipping_method_id}"
+        object_storage: dict[str, Any] = cls.get_all_instances(orders_input)
+        orders_data = [
+            cls.create_single_order(
+                order_input, object_storage, info, user_orders_count
+            )
+            for order_input in orders_input
+        ]
+
+        stocks: list[Stock] = []
+        cls.handle_error_policy(orders_data, error_policy)
+        if stock_update_policy != StockUpdatePolicy.SKIP:
+            stocks = cls.handle_stocks(orders_data, stock_update_policy)
+        cls.save_data(orders_data, stocks, use_copy=use_copy)
+        return orders_data
+
     @classmethod
     def perform_mutation(cls, _root, info: ResolveInfo, /, **data):
         orders_input = data["orders"]
@@ -2477,30 +2527,17 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             result = OrderBulkCreateResult(order=None, error=error)
             return OrderBulkCreate(count=0, results=result)
 
-        orders_data: list[OrderBulkCreateData] = []
         user_orders_count: dict[int, int] = defaultdict(int)
         with traced_atomic_transaction():
-            # Create dictionary, which stores already resolved objects:
-            #   - key for instances: "{model_name}.{key_name}.{key_value}"
-            #   - key for shipping prices: "shipping_price.{shipping_method_id}"
-            object_storage: dict[str, Any] = cls.get_all_instances(orders_input)
-            for order_input in orders_input:
-                orders_data.append(
-                    cls.create_single_order(
-                        order_input, object_storage, info, user_orders_count
-                    )
-                )
-
-            error_policy = data.get("error_policy") or ErrorPolicy.REJECT_EVERYTHING
-            stock_update_policy = (
-                data.get("stock_update_policy") or StockUpdatePolicy.UPDATE
+            orders_data = cls.process_orders(
+                orders_input,
+                info,
+                user_orders_count,
+                error_policy=data.get("error_policy") or ErrorPolicy.REJECT_EVERYTHING,
+                stock_update_policy=(
+                    data.get("stock_update_policy") or StockUpdatePolicy.UPDATE
+                ),
             )
-            stocks: list[Stock] = []
-
-            cls.handle_error_policy(orders_data, error_policy)
-            if stock_update_policy != StockUpdatePolicy.SKIP:
-                stocks = cls.handle_stocks(orders_data, stock_update_policy)
-            cls.save_data(orders_data, stocks)
 
             manager = get_plugin_manager_promise(info.context).get()
             if created_orders := [
@@ -0,0 +1,137 @@
+"""Import of orders in chunks, reusing the validation of `orderBulkCreate`.
+
+Orders are read from NDJSON, one `OrderBulkCreateInput` object per line, in the same
+format as the mutation variables. Every chunk is validated and saved in a separate
+transaction, so orders from already imported chunks are kept when a later chunk
+fails.
+"""
+
+import json
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from itertools import islice
+from typing import Any, cast
+
+from django.db import transaction
+from graphql.execution.values import coerce_value, is_valid_value
+
+from ....account.utils import update_user_orders_count
+from ....core.tracing import traced_atomic_transaction
+from ....core.utils.events import call_event
+from ....order import StockUpdatePolicy
+from ....order.error_codes import OrderBulkCreateErrorCode
+from ....plugins.manager import get_plugins_manager
+from ...core.enums import ErrorPolicy
+from .order_bulk_create import OrderBulkCreate, OrderBulkError
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+@dataclass
+class ParsedOrderInput:
+    line_number: int
+    order_input: dict[str, Any] | None
+    errors: list[OrderBulkError] = dataclass_field(default_factory=list)
+
+
+@dataclass
+class OrderBulkImportChunkResult:
+    first_line: int
+    last_line: int
+    created_count: int
+    # errors with numbers of input lines of the orders they refer to
+    errors: list[tuple[int, OrderBulkError]]
+
+
+def parse_order_inputs(lines: Iterable[str]) -> Iterator[ParsedOrderInput]:
+    """Parse NDJSON lines into inputs of `orderBulkCreate`; skip empty lines."""
+    from ...api import schema
+
+    input_type = schema.get_type("OrderBulkCreateInput")
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            error = OrderBulkError(
+                message=f"Invalid JSON: {e}.", code=OrderBulkCreateErrorCode.INVALID
+            )
+            yield ParsedOrderInput(line_number, None, [error])
+            continue
+        if messages := is_valid_value(value, input_type):
+            errors = [
+                OrderBulkError(message=message, code=OrderBulkCreateErrorCode.INVALID)
+                for message in messages
+            ]
+            yield ParsedOrderInput(line_number, None, errors)
+            continue
+        order_input = cast(dict[str, Any], coerce_value(input_type, value))
+        yield ParsedOrderInput(line_number, order_input)
+
+
+def import_orders_chunk(
+    parsed_inputs: list[ParsedOrderInput],
+    error_policy: str,
+    stock_update_policy: str,
+) -> OrderBulkImportChunkResult:
+    """Validate and save orders of the chunk in a single transaction.
+
+    Largest tables are filled with `COPY`. The error policy applies to the chunk; with
+    `REJECT_EVERYTHING`, any invalid line rejects all orders of the chunk.
+    """
+    errors = [
+        (parsed.line_number, error)
+        for parsed in parsed_inputs
+        for error in parsed.errors
+    ]
+    result = OrderBulkImportChunkResult(
+        first_line=parsed_inputs[0].line_number,
+        last_line=parsed_inputs[-1].line_number,
+        created_count=0,
+        errors=errors,
+    )
+    valid_inputs = [
+        (parsed.line_number, parsed.order_input)
+        for parsed in parsed_inputs
+        if parsed.order_input is not None
+    ]
+    if not valid_inputs or (errors and error_policy == ErrorPolicy.REJECT_EVERYTHING):
+        return result
+
+    user_orders_count: dict[int, int] = defaultdict(int)
+    with traced_atomic_transaction():
+        orders_data = OrderBulkCreate.process_orders(
+            [order_input for _, order_input in valid_inputs],
+            None,
+            user_orders_count,
+            error_policy=error_policy,
+            stock_update_policy=stock_update_policy,
+            use_copy=True,
+        )
+        if created_orders := [
+            order_data.order for order_data in orders_data if order_data.order
+        ]:
+            manager = get_plugins_manager(allow_replica=False)
+            call_event(manager.order_bulk_created, created_orders)
+        transaction.on_commit(lambda: update_user_orders_count(user_orders_count))
+
+    result.created_count = len(created_orders)
+    for (line_number, _), order_data in zip(valid_inputs, orders_data, strict=True):
+        errors.extend((line_number, error) for error in order_data.errors)
+    errors.sort(key=lambda line_error: line_error[0])
+    return result
+
+
+def import_orders(
+    lines: Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    error_policy: str = ErrorPolicy.REJECT_FAILED_ROWS,
+    stock_update_policy: str = StockUpdatePolicy.UPDATE,
+) -> Iterator[OrderBulkImportChunkResult]:
+    """Import orders from NDJSON lines; yield the result of each imported chunk."""
+    parsed_inputs = parse_order_inputs(lines)
+    while chunk := list(islice(parsed_inputs, chunk_size)):
+        yield import_orders_chunk(chunk, error_policy, stock_update_policy)
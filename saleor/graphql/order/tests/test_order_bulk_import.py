@@ -0,0 +1,107 @@
+import json
+from io import StringIO
+
+import graphene
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from ....order.error_codes import OrderBulkCreateErrorCode
+from ....order.models import Order, OrderLine
+from ....warehouse.models import Stock
+from ...core.enums import ErrorPolicy
+from ..bulk_mutations.order_bulk_import import import_orders
+
+
+@pytest.fixture
+def order_import_input(
+    channel_PLN,
+    customer_user,
+    default_tax_class,
+    graphql_address_data,
+    variant,
+    warehouse,
+):
+    Stock.objects.create(warehouse=warehouse, product_variant=variant, quantity=10)
+    return {
+        "channel": channel_PLN.slug,
+        "createdAt": timezone.now().isoformat(),
+        "status": "UNFULFILLED",
+        "user": {"email": customer_user.email},
+        "billingAddress": graphql_address_data,
+        "currency": "PLN",
+        "languageCode": "PL",
+        "lines": [
+            {
+                "variantId": graphene.Node.to_global_id("ProductVariant", variant.id),
+                "createdAt": timezone.now().isoformat(),
+                "productName": "Product Name",
+                "variantName": "Variant Name",
+                "isShippingRequired": False,
+                "isGiftCard": False,
+                "quantity": 1,
+                "totalPrice": {"gross": 12, "net": 10},
+                "undiscountedTotalPrice": {"gross": 12, "net": 10},
+                "warehouse": graphene.Node.to_global_id("Warehouse", warehouse.id),
+                "taxRate": 0.2,
+                "taxClassId": graphene.Node.to_global_id(
+                    "TaxClass", default_tax_class.id
+                ),
+            }
+        ],
+    }
+
+
+def test_import_orders(order_import_input):
+    # given
+    invalid_channel_input = {**order_import_input, "channel": "non-existing"}
+    lines = [
+        json.dumps(order_import_input),
+        "",
+        "{invalid json",
+        json.dumps(invalid_channel_input),
+        json.dumps(order_import_input),
+    ]
+
+    # when
+    results = list(import_orders(lines, chunk_size=2))
+
+    # then
+    assert [(r.first_line, r.last_line, r.created_count) for r in results] == [
+        (1, 3, 1),
+        (4, 5, 1),
+    ]
+    assert [line_number for line_number, _ in results[0].errors] == [3]
+    assert results[0].errors[0][1].code == OrderBulkCreateErrorCode.INVALID
+    assert [line_number for line_number, _ in results[1].errors] == [4]
+    assert Order.objects.count() == 2
+    assert OrderLine.objects.count() == 2
+
+
+def test_import_orders_reject_everything_rejects_chunk(order_import_input):
+    # given
+    lines = [json.dumps(order_import_input), json.dumps({"currency": "PLN"})]
+
+    # when
+    (result,) = import_orders(lines, error_policy=ErrorPolicy.REJECT_EVERYTHING)
+
+    # then
+    assert result.created_count == 0
+    assert {line_number for line_number, _ in result.errors} == {2}
+    assert not Order.objects.exists()
+
+
+def test_import_orders_command(order_import_input, tmp_path):
+    # given
+    path = tmp_path / "orders.ndjson"
+    path.write_text(f"{json.dumps(order_import_input)}\n{{invalid json\n")
+    stdout, stderr = StringIO(), StringIO()
+
+    # when
+    call_command("import_orders", str(path), stdout=stdout, stderr=stderr)
+
+    # then
+    assert "Lines 1-2: 1 orders created, 1 with errors." in stdout.getvalue()
+    assert "Imported 1 orders, 1 orders with errors." in stdout.getvalue()
+    assert stderr.getvalue().startswith("Line 2: Invalid JSON")
+    assert Order.objects.count() == 1
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from graphql.error import GraphQLError
+
+logger = logging.getLogger(__name__)
+
+PERSISTED_QUERY_VERSION = 1
+PERSISTED_QUERY_CACHE_KEY_PREFIX = "graphql-persisted-query"
+
+
+class PersistedQueryNotFound(GraphQLError):
+    # Apollo Client recognizes this exact message and resends the operation with
+    # the full query text, which registers it for the following requests.
+    def __init__(self):
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryNotSupported(GraphQLError):
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported")
+
+
+class PersistedQueryNotAllowed(GraphQLError):
+    def __init__(self):
+        super().__init__(
+            "Only persisted queries registered in the allow-list can be executed."
+        )
+
+
+def generate_persisted_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_persisted_query_cache_key(query_hash: str) -> str:
+    return f"{PERSISTED_QUERY_CACHE_KEY_PREFIX}:{query_hash}"
+
+
+def get_persisted_query_hash(data: dict) -> str | None:
+    """Return the SHA-256 hash from the `persistedQuery` request extension."""
+    extensions = data.get("extensions")
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            return None
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict):
+        return None
+    if persisted_query.get("version") != PERSISTED_QUERY_VERSION:
+        return None
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        return None
+    return query_hash.lower()
+
+
+@lru_cache(maxsize=1)
+def load_persisted_queries_manifest() -> dict[str, str]:
+    """Load the allow-list of persisted queries.
+
+    The manifest is a JSON file that maps the SHA-256 hash of an operation to its
+    query text, e.g. the output of the GraphQL Code Generator persisted documents
+    preset. Hashes that do not match the query text are skipped.
+
+    The manifest is loaded when the application starts, so a missing or invalid
+    file fails the startup instead of every request.
+    """
+    path = settings.GRAPHQL_PERSISTED_QUERIES_MANIFEST
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError) as e:
+        raise ImproperlyConfigured(
+            f"Failed to load the persisted queries manifest {path}: {e}."
+        ) from e
+    if not isinstance(manifest, dict) or not all(
+        isinstance(query, str) for query in manifest.values()
+    ):
+        raise ImproperlyConfigured(
+            f"Persisted queries manifest {path} must map hashes to query texts."
+        )
+
+    queries = {}
+    for query_hash, query in manifest.items():
+        if generate_persisted_query_hash(query) != query_hash.lower():
+            logger.warning(
+                "Skipping persisted query %s, hash does not match the query.",
+                query_hash,
+            )
+            continue
+        queries[query_hash.lower()] = query
+    return queries
+
+
+def resolve_persisted_query(
+    query: str | None, query_hash: str | None
+) -> tuple[str | None, GraphQLError | None]:
+    """Return the query text that should be executed for the request.
+
+    When the request carries only the hash, the query is looked up in the
+    allow-list manifest and then in the cache. When both the hash and the query are
+    provided, the query is registered under the hash for the following requests,
+    unless the allow-list mode is enabled.
+    """
+    allowlist_only = settings.GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY
+    if not query_hash:
+        if allowlist_only and not is_query_allowed(query):
+            return None, PersistedQueryNotAllowed()
+        return query, None
+
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED and not allowlist_only:
+        if query:
+            # Client falls back to the regular request, the hash is ignored.
+            return query, None
+        return None, PersistedQueryNotSupported()
+
+    manifest = load_persisted_queries_manifest()
+    if persisted_query := manifest.get(query_hash):
+        return persisted_query, None
+    if allowlist_only:
+        return None, PersistedQueryNotAllowed()
+
+    cache_key = get_persisted_query_cache_key(query_hash)
+    if not query:
+        persisted_query = cache.get(cache_key)
+        if persisted_query is None:
+            return None, PersistedQueryNotFound()
+        return persisted_query, None
+
+    if not isinstance(query, str) or generate_persisted_query_hash(query) != query_hash:
+        return None, GraphQLError("Provided sha256Hash does not match the query.")
+    cache.set(cache_key, query)
+    return query, None
+
+
+def is_query_allowed(query: str | None) -> bool:
+    if not query or not isinstance(query, str):
+        # Let the regular validation report the missing query.
+        return True
+    return generate_persisted_query_hash(query) in load_persisted_queries_manifest()
@@ -5,6 +5,7 @@ from .....discount.utils.promotion import mark_active_catalogue_promotion_rules_
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....thumbnail import models as thumbnail_models
+from .....thumbnail.tasks import schedule_thumbnails_creation
 from ....core import ResolveInfo
 from ....core.types import ProductError
 from ....plugins.dataloaders import get_plugin_manager_promise
@@ -42,6 +43,9 @@ class CategoryUpdate(CategoryCreate):
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.category_updated, instance)
 
+        if cleaned_input.get("background_image"):
+            schedule_thumbnails_creation("Category", instance.pk)
+
         if "metadata" in cleaned_input:
             products = models.Product.objects.filter(category_id=instance.id)
             channel_ids = set(
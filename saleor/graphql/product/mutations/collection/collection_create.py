@@ -9,6 +9,7 @@ from .....permission.enums import ProductPermissions
 from .....product import models
 from .....product.error_codes import CollectionErrorCode
 from .....product.tasks import collection_product_updated_task
+from .....thumbnail.tasks import schedule_thumbnails_creation
 from ....core import ResolveInfo
 from ....core.context import ChannelContext
 from ....core.descriptions import DEPRECATED_IN_3X_INPUT, RICH_CONTENT
@@ -125,6 +126,9 @@ class CollectionCreate(DeprecatedModelMutation):
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.collection_created, instance)
 
+        if cleaned_input.get("background_image"):
+            schedule_thumbnails_creation("Collection", instance.pk)
+
         product_ids = list(instance.products.values_list("id", flat=True))
         for ids_batch in cls.batch_product_ids(product_ids):
             collection_product_updated_task.delay(ids_batch)
@@ -5,6 +5,7 @@ from .....discount.utils.promotion import mark_active_catalogue_promotion_rules_
 from .....permission.enums import ProductPermissions
 from .....product import models
 from .....thumbnail import models as thumbnail_models
+from .....thumbnail.tasks import schedule_thumbnails_creation
 from ....core import ResolveInfo
 from ....core.types import CollectionError
 from ....plugins.dataloaders import get_plugin_manager_promise
@@ -45,6 +46,9 @@ class CollectionUpdate(CollectionCreate):
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.collection_updated, instance)
 
+        if cleaned_input.get("background_image"):
+            schedule_thumbnails_creation("Collection", instance.pk)
+
         if "metadata" in cleaned_input:
             collection_products = models.CollectionProduct.objects.filter(
                 collection_id=instance.id
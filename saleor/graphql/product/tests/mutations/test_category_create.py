@@ -133,6 +133,33 @@ def test_category_create_mutation(
     assert data["category"]["parent"]["id"] == parent_id
 
 
+@patch("saleor.thumbnail.tasks.create_thumbnails_task.delay")
+def test_category_create_mutation_schedules_thumbnails_creation(
+    create_thumbnails_task_mock,
+    staff_api_client,
+    permission_manage_products,
+    media_root,
+    settings,
+):
+    # given
+    settings.THUMBNAIL_EAGER_SIZES = [256]
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    image_file, image_name = create_image()
+    variables = {"name": "Test category", "backgroundImage": image_name}
+    body = get_multipart_request_body(
+        CATEGORY_CREATE_MUTATION, variables, image_file, image_name
+    )
+
+    # when
+    response = staff_api_client.post_multipart(body)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["categoryCreate"]["errors"] == []
+    category = Category.objects.get(name="Test category")
+    create_thumbnails_task_mock.assert_called_once_with("Category", category.pk)
+
+
 @freeze_time("2022-05-12 12:00:00")
 @patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
 @patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
@@ -9,6 +9,7 @@ from django_countries import countries
 from ....channel.utils import DEPRECATION_WARNING_MESSAGE
 from ....shipping.models import ShippingZone
 from ....warehouse import WarehouseClickAndCollectOption
+from ....warehouse.availability_cache import invalidate_variants_availability
 from ....warehouse.models import PreorderReservation, Reservation, Stock, Warehouse
 from ...tests.utils import get_graphql_content
 
@@ -946,3 +947,70 @@ def test_variant_quantity_available_preorder_without_channel(
     response = api_client.post_graphql(QUERY_VARIANT_AVAILABILITY, variables)
     content = get_graphql_content(response)
     assert not content["data"]["productVariant"]
+
+
+def test_variant_quantity_available_from_availability_cache(
+    settings, api_client, variant_with_many_stocks, channel_USD
+):
+    # given
+    settings.AVAILABILITY_CACHE_ENABLED = True
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant_with_many_stocks.pk),
+        "channel": channel_USD.slug,
+    }
+    api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+    variant_with_many_stocks.stocks.update(quantity=100)
+
+    # when
+    response = api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == 7
+
+
+def test_variant_quantity_available_availability_cache_invalidated(
+    settings,
+    api_client,
+    variant_with_many_stocks,
+    channel_USD,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.AVAILABILITY_CACHE_ENABLED = True
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant_with_many_stocks.pk),
+        "channel": channel_USD.slug,
+    }
+    api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+    variant_with_many_stocks.stocks.update(quantity=10)
+    with django_capture_on_commit_callbacks(execute=True):
+        invalidate_variants_availability([variant_with_many_stocks.pk])
+
+    # when
+    response = api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == 20
+
+
+def test_variant_quantity_available_availability_cache_respects_checkout_limit(
+    settings, site_settings, api_client, variant_with_many_stocks, channel_USD
+):
+    # given
+    settings.AVAILABILITY_CACHE_ENABLED = True
+    variables = {
+        "id": graphene.Node.to_global_id("ProductVariant", variant_with_many_stocks.pk),
+        "channel": channel_USD.slug,
+    }
+    api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+    site_settings.limit_quantity_per_checkout = 5
+    site_settings.save(update_fields=["limit_quantity_per_checkout"])
+
+    # when
+    response = api_client.post_graphql(QUERY_QUANTITY_AVAILABLE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["quantityAvailable"] == 5
@@ -0,0 +1,117 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest
+
+from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
+from ..core.utils.cache import bump_cache_version, get_cache_version
+
+RESPONSE_CACHE_VERSION_KEY = "graphql-response-cache-version"
+
+# Root query fields which responses are public and depend only on the query
+# arguments, so they can be shared between anonymous requests.
+CACHEABLE_ROOT_FIELDS = frozenset(
+    {
+        "categories",
+        "category",
+        "collection",
+        "collections",
+        "menu",
+        "menus",
+        "product",
+        "products",
+        "shop",
+    }
+)
+
+# Plugin manager events that change the data returned by the cacheable queries.
+RESPONSE_CACHE_INVALIDATING_EVENTS = frozenset(
+    {
+        "attribute_updated",
+        "attribute_deleted",
+        "attribute_value_updated",
+        "attribute_value_deleted",
+        "category_created",
+        "category_updated",
+        "category_deleted",
+        "channel_updated",
+        "channel_deleted",
+        "channel_status_changed",
+        "collection_created",
+        "collection_updated",
+        "collection_deleted",
+        "collection_metadata_updated",
+        "menu_created",
+        "menu_updated",
+        "menu_deleted",
+        "menu_item_created",
+        "menu_item_updated",
+        "menu_item_deleted",
+        "product_created",
+        "product_updated",
+        "product_deleted",
+        "product_media_created",
+        "product_media_updated",
+        "product_media_deleted",
+        "product_metadata_updated",
+        "product_variant_created",
+        "product_variant_updated",
+        "product_variant_deleted",
+        "product_variant_metadata_updated",
+        "product_variant_out_of_stock",
+        "product_variant_back_in_stock",
+        "promotion_started",
+        "promotion_ended",
+        "shop_metadata_updated",
+        "translations_created",
+        "translations_updated",
+    }
+)
+
+
+def is_response_cacheable(
+    request: HttpRequest, operation_type: str | None, operation_identifier: str
+) -> bool:
+    """Return True when the response can be served from the response cache.
+
+    Only queries sent by anonymous requestors are cached, and only when all
+    selected root fields are in `CACHEABLE_ROOT_FIELDS`.
+    """
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return False
+    if operation_type != "query":
+        return False
+    if getattr(request, "app", None) or get_token_from_request(request):
+        return False
+    root_fields = set(operation_identifier.split(", "))
+    return root_fields.issubset(CACHEABLE_ROOT_FIELDS)
+
+
+def get_response_cache_version() -> int:
+    return get_cache_version(RESPONSE_CACHE_VERSION_KEY)
+
+
+def invalidate_response_cache():
+    bump_cache_version(RESPONSE_CACHE_VERSION_KEY)
+
+
+def generate_response_cache_key(
+    raw_query: str, variables: dict | None, operation_name: str | None
+) -> str:
+    """Generate the response cache key.
+
+    Channel and language are passed to the cacheable queries as arguments, so they
+    are part of the query string or the variables.
+    """
+    payload = json.dumps(
+        [raw_query, variables, operation_name], cls=DjangoJSONEncoder, sort_keys=True
+    )
+    hashed_payload = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    version = get_response_cache_version()
+    key = f"{saleor_version}-graphql-response-{version}-{hashed_payload}"
+    if settings.GRAPHQL_CACHE_SUFFIX:
+        return f"{key}-{settings.GRAPHQL_CACHE_SUFFIX}"
+    return key
@@ -0,0 +1,217 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from ..persisted_queries import (
+    generate_persisted_query_hash,
+    get_persisted_query_cache_key,
+    get_persisted_query_hash,
+    load_persisted_queries_manifest,
+)
+from .utils import get_graphql_content_from_response
+
+QUERY_SHOP = """
+query ShopName {
+    shop {
+        name
+    }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_persisted_queries():
+    load_persisted_queries_manifest.cache_clear()
+    yield
+    load_persisted_queries_manifest.cache_clear()
+    cache.delete(
+        get_persisted_query_cache_key(generate_persisted_query_hash(QUERY_SHOP))
+    )
+
+
+@pytest.fixture
+def persisted_queries_manifest(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({generate_persisted_query_hash(QUERY_SHOP): QUERY_SHOP}))
+    return str(path)
+
+
+def _persisted_query_extensions(query_hash):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+def test_load_persisted_queries_manifest_missing_file(tmp_path):
+    # given
+    path = str(tmp_path / "missing.json")
+
+    # when & then
+    with override_settings(GRAPHQL_PERSISTED_QUERIES_MANIFEST=path):
+        with pytest.raises(ImproperlyConfigured):
+            load_persisted_queries_manifest()
+
+
+@pytest.mark.parametrize("content", ["not json", "[]", '{"hash": 1}'])
+def test_load_persisted_queries_manifest_invalid_file(tmp_path, content):
+    # given
+    path = tmp_path / "manifest.json"
+    path.write_text(content)
+
+    # when & then
+    with override_settings(GRAPHQL_PERSISTED_QUERIES_MANIFEST=str(path)):
+        with pytest.raises(ImproperlyConfigured):
+            load_persisted_queries_manifest()
+
+
+def test_get_persisted_query_hash():
+    # given
+    data = {"extensions": _persisted_query_extensions("ABC")}
+
+    # when
+    query_hash = get_persisted_query_hash(data)
+
+    # then
+    assert query_hash == "abc"
+
+
+@pytest.mark.parametrize(
+    "extensions",
+    [
+        None,
+        {},
+        {"persistedQuery": {"version": 2, "sha256Hash": "abc"}},
+        {"persistedQuery": {"version": 1}},
+        "invalid-json",
+    ],
+)
+def test_get_persisted_query_hash_invalid_extension(extensions):
+    assert get_persisted_query_hash({"extensions": extensions}) is None
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ENABLED=True)
+def test_persisted_query_not_found(api_client, site_settings):
+    # given
+    query_hash = generate_persisted_query_hash(QUERY_SHOP)
+    data = {"extensions": _persisted_query_extensions(query_hash)}
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotFound"
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ENABLED=True)
+def test_persisted_query_registered_and_executed_by_hash(api_client, site_settings):
+    # given
+    query_hash = generate_persisted_query_hash(QUERY_SHOP)
+    extensions = _persisted_query_extensions(query_hash)
+    api_client.post({"query": QUERY_SHOP, "extensions": extensions})
+
+    # when
+    response = api_client.post({"extensions": extensions})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert "errors" not in content
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+@override_settings(GRAPHQL_PERSISTED_QUERIES_ENABLED=True)
+def test_persisted_query_hash_mismatch(api_client, site_settings):
+    # given
+    extensions = _persisted_query_extensions(generate_persisted_query_hash("other"))
+
+    # when
+    response = api_client.post({"query": QUERY_SHOP, "extensions": extensions})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match the query."
+    )
+
+
+def test_persisted_query_not_supported(api_client, site_settings):
+    # given
+    query_hash = generate_persisted_query_hash(QUERY_SHOP)
+
+    # when
+    response = api_client.post({"extensions": _persisted_query_extensions(query_hash)})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_persisted_query_allowlist_executes_registered_hash(
+    api_client, site_settings, persisted_queries_manifest
+):
+    # given
+    query_hash = generate_persisted_query_hash(QUERY_SHOP)
+
+    # when
+    with override_settings(
+        GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY=True,
+        GRAPHQL_PERSISTED_QUERIES_MANIFEST=persisted_queries_manifest,
+    ):
+        response = api_client.post(
+            {"extensions": _persisted_query_extensions(query_hash)}
+        )
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert "errors" not in content
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_allowlist_rejects_unknown_query(
+    api_client, site_settings, persisted_queries_manifest
+):
+    # given
+    query = "{ shop { description } }"
+
+    # when
+    with override_settings(
+        GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY=True,
+        GRAPHQL_PERSISTED_QUERIES_MANIFEST=persisted_queries_manifest,
+    ):
+        response = api_client.post_graphql(query)
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["exception"]["code"] == (
+        "PersistedQueryNotAllowed"
+    )
+    assert "data" in content
+    assert content["data"] is None
+
+
+def test_persisted_query_allowlist_does_not_register_new_queries(
+    api_client, site_settings, persisted_queries_manifest
+):
+    # given
+    query = "{ shop { description } }"
+    extensions = _persisted_query_extensions(generate_persisted_query_hash(query))
+
+    # when
+    with override_settings(
+        GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY=True,
+        GRAPHQL_PERSISTED_QUERIES_MANIFEST=persisted_queries_manifest,
+    ):
+        response = api_client.post({"query": query, "extensions": extensions})
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["extensions"]["exception"]["code"] == (
+        "PersistedQueryNotAllowed"
+    )
+    assert (
+        cache.get(
+            get_persisted_query_cache_key(extensions["persistedQuery"]["sha256Hash"])
+        )
+        is None
+    )
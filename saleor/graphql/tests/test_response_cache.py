@@ -0,0 +1,146 @@
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from ...plugins.manager import get_plugins_manager
+from ..response_cache import (
+    generate_response_cache_key,
+    get_response_cache_version,
+    invalidate_response_cache,
+)
+from .utils import get_graphql_content
+
+QUERY_PRODUCT = """
+query Product($id: ID!, $channel: String) {
+    product(id: $id, channel: $channel) {
+        name
+    }
+}
+"""
+
+QUERY_ME = """
+query Me {
+    me {
+        email
+    }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_generate_response_cache_key_depends_on_variables():
+    # when
+    key_usd = generate_response_cache_key(QUERY_PRODUCT, {"channel": "usd"}, None)
+    key_pln = generate_response_cache_key(QUERY_PRODUCT, {"channel": "pln"}, None)
+
+    # then
+    assert key_usd != key_pln
+
+
+def test_invalidate_response_cache_changes_cache_key():
+    # given
+    key = generate_response_cache_key(QUERY_PRODUCT, {"channel": "usd"}, None)
+    version = get_response_cache_version()
+
+    # when
+    invalidate_response_cache()
+
+    # then
+    assert get_response_cache_version() == version + 1
+    assert generate_response_cache_key(QUERY_PRODUCT, {"channel": "usd"}, None) != key
+
+
+@override_settings(GRAPHQL_RESPONSE_CACHE_ENABLED=True)
+def test_anonymous_catalog_query_response_is_cached(api_client, product, channel_USD):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    get_graphql_content(api_client.post_graphql(QUERY_PRODUCT, variables))
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] != "New name"
+
+
+@override_settings(GRAPHQL_RESPONSE_CACHE_ENABLED=True)
+def test_cached_response_invalidated_by_product_updated_event(
+    api_client, product, channel_USD
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+    get_graphql_content(api_client.post_graphql(QUERY_PRODUCT, variables))
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # when
+    get_plugins_manager(allow_replica=False).product_updated(product)
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+
+
+@override_settings(GRAPHQL_RESPONSE_CACHE_ENABLED=True)
+@patch("saleor.graphql.views.cache.set")
+def test_authenticated_query_response_is_not_cached(
+    cache_set_mock, staff_api_client, product, channel_USD
+):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    get_graphql_content(response)
+    cache_set_mock.assert_not_called()
+
+
+@override_settings(GRAPHQL_RESPONSE_CACHE_ENABLED=True)
+@patch("saleor.graphql.views.cache.set")
+def test_not_cacheable_query_response_is_not_cached(cache_set_mock, api_client):
+    # when
+    response = api_client.post_graphql(QUERY_ME)
+
+    # then
+    get_graphql_content(response)
+    cache_set_mock.assert_not_called()
+
+
+@patch("saleor.graphql.views.cache.set")
+def test_response_cache_disabled(cache_set_mock, api_client, product, channel_USD):
+    # given
+    variables = {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCT, variables)
+
+    # then
+    get_graphql_content(response)
+    cache_set_mock.assert_not_called()
@@ -33,7 +33,7 @@ from ..core.telemetry import Scope, SpanKind, saleor_attributes, tracer
 from ..webhook import observability
 from .api import API_PATH, schema
 from .context import clear_context, get_context_value
-from .core.validators.query_cost import validate_query_cost
+from .core.validators.query_cost import QueryCostCache, validate_query_cost
 from .error import clear_errors
 from .metrics import (
     record_graphql_query_cost,
@@ -42,7 +42,9 @@ from .metrics import (
     record_request_count,
     record_request_duration,
 )
+from .persisted_queries import get_persisted_query_hash, resolve_persisted_query
 from .query_cost_map import COST_MAP, QUERY_COST_FAILED_OPERATION
+from .response_cache import generate_response_cache_key, is_response_cacheable
 from .utils import (
     format_error,
     get_source_service_name_value,
@@ -53,6 +55,10 @@ from .utils.validators import check_if_query_contains_only_schema
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
 
+query_cost_cache = QueryCostCache(
+    COST_MAP, capacity=settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+)
+
 
 class GraphQLView(View):
     # This class is our implementation of `graphene_django.views.GraphQLView`,
@@ -278,6 +284,22 @@ class GraphQLView(View):
             span.set_attribute(saleor_attributes.COMPONENT, "graphql")
 
             query, variables, operation_name = self.get_graphql_params(request, data)
+            query, persisted_query_error = resolve_persisted_query(
+                query, get_persisted_query_hash(data)
+            )
+            error_type: str | None = None
+            if persisted_query_error:
+                error_type = persisted_query_error.__class__.__name__
+                span.set_status(
+                    status=StatusCode.ERROR, description=str(persisted_query_error)
+                )
+                record_graphql_query_count(error_type=error_type)
+                record_graphql_query_cost(
+                    QUERY_COST_FAILED_OPERATION, error_type=error_type
+                )
+                query_duration_attrs[error_attributes.ERROR_TYPE] = error_type
+                return ExecutionResult(errors=[persisted_query_error])
+
             document, error = self.parse_query(query)
 
             with observability.report_gql_operation() as operation:
@@ -360,6 +382,7 @@ class GraphQLView(View):
                 variables,
                 COST_MAP,
                 settings.GRAPHQL_QUERY_MAX_COMPLEXITY,
+                cache=query_cost_cache,
             )
             span.set_attribute(saleor_attributes.GRAPHQL_OPERATION_COST, query_cost)
 
@@ -400,6 +423,17 @@ class GraphQLView(View):
                 if should_use_cache_for_scheme:
                     key = generate_cache_key(raw_query_string)
                     response = cache.get(key)
+                should_use_response_cache = (
+                    not query_contains_schema
+                    and is_response_cacheable(
+                        request, operation_type, operation_identifier
+                    )
+                )
+                if should_use_response_cache:
+                    response_cache_key = generate_response_cache_key(
+                        raw_query_string, variables, operation_name
+                    )
+                    response = cache.get(response_cache_key)
 
                 if not response:
                     response = document.execute(
@@ -419,6 +453,12 @@ class GraphQLView(View):
 
                     if should_use_cache_for_scheme:
                         cache.set(key, response)
+                    if should_use_response_cache and not response.errors:
+                        cache.set(
+                            response_cache_key,
+                            response,
+                            timeout=settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT,
+                        )
 
                 record_graphql_query_count(
                     operation_type=operation_type,
@@ -4,6 +4,7 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING, TypedDict
 from uuid import UUID
 
+from django.conf import settings
 from django.contrib.sites.models import Site
 from django.db.models import Exists, OuterRef, Q, QuerySet
 from django.db.models.aggregates import Sum
@@ -15,6 +16,10 @@ from promise import Promise
 from ...channel.models import Channel
 from ...product.models import ProductVariantChannelListing
 from ...warehouse import WarehouseClickAndCollectOption
+from ...warehouse.availability_cache import (
+    get_cached_available_quantities,
+    set_cached_available_quantities,
+)
 from ...warehouse.models import (
     ChannelWarehouse,
     PreorderReservation,
@@ -98,6 +103,59 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
         variant_ids: Iterable[int],
         site: Site,
     ) -> Iterable[tuple[int, int]]:
+        if settings.AVAILABILITY_CACHE_ENABLED:
+            quantity_map = self.get_cached_quantity_map(
+                country_code, channel_slug, variant_ids, site
+            )
+        else:
+            quantity_map = self.get_quantity_map(
+                country_code, channel_slug, variant_ids
+            )
+
+        # Return the quantities after capping them at the maximum quantity allowed in
+        # checkout. This prevent users from tracking the store's precise stock levels.
+        global_quantity_limit = site.settings.limit_quantity_per_checkout
+        return [
+            (
+                variant_id,
+                min(quantity_map[variant_id], global_quantity_limit or sys.maxsize),
+            )
+            for variant_id in variant_ids
+        ]
+
+    def get_cached_quantity_map(
+        self,
+        country_code: CountryCode | None,
+        channel_slug: str | None,
+        variant_ids: Iterable[int],
+        site: Site,
+    ) -> defaultdict[int, int]:
+        """Return the variant id to quantity map using the availability cache."""
+        quantity_map: defaultdict[int, int] = defaultdict(int)
+        cached_quantities, missing_keys = get_cached_available_quantities(
+            variant_ids,
+            country_code,
+            channel_slug,
+            is_reservation_enabled(site.settings),
+        )
+        quantity_map.update(cached_quantities)
+        missing_variant_ids = [
+            variant_id for variant_id in variant_ids if variant_id not in quantity_map
+        ]
+        if missing_variant_ids:
+            quantities = self.get_quantity_map(
+                country_code, channel_slug, missing_variant_ids
+            )
+            quantity_map.update(quantities)
+            set_cached_available_quantities(missing_keys, quantities)
+        return quantity_map
+
+    def get_quantity_map(
+        self,
+        country_code: CountryCode | None,
+        channel_slug: str | None,
+        variant_ids: Iterable[int],
+    ) -> defaultdict[int, int]:
         # get stocks only for warehouses assigned to the shipping zones
         # that are available in the given channel
         stocks = (
@@ -140,24 +198,13 @@ class AvailableQuantityByProductVariantIdCountryCodeAndChannelSlugLoader(
             stocks, stocks_reservations, warehouse_shipping_zones_map, cc_warehouses
         )
 
-        quantity_map = self.prepare_quantity_map(
+        return self.prepare_quantity_map(
             country_code,
             warehouse_ids_by_shipping_zone_by_variant,
             variants_with_global_cc_warehouses,
             available_quantity_by_warehouse_id_and_variant_id,
         )
 
-        # Return the quantities after capping them at the maximum quantity allowed in
-        # checkout. This prevent users from tracking the store's precise stock levels.
-        global_quantity_limit = site.settings.limit_quantity_per_checkout
-        return [
-            (
-                variant_id,
-                min(quantity_map[variant_id], global_quantity_limit or sys.maxsize),
-            )
-            for variant_id in variant_ids
-        ]
-
     def get_warehouse_shipping_zones(self, country_code, channel_slug):
         """Get the WarehouseShippingZone instances for a given channel and country."""
         WarehouseShippingZone = Warehouse.shipping_zones.through
@@ -1,11 +1,13 @@
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
 from ....webhook.const import MAX_FILTERABLE_CHANNEL_SLUGS_LIMIT
 from ....webhook.error_codes import WebhookErrorCode
+from ....webhook.utils import invalidate_webhook_event_map
 from ....webhook.validators import (
     HEADERS_LENGTH_LIMIT,
     HEADERS_NUMBER_LIMIT,
@@ -187,3 +189,4 @@ class WebhookCreate(DeprecatedModelMutation, NotifyUserEventValidationMixin):
                 for event in events
             ]
         )
+        transaction.on_commit(invalidate_webhook_event_map)
@@ -1,10 +1,12 @@
 import graphene
+from django.db import transaction
 from django.db.models import Exists, OuterRef
 
 from ....app.models import App
 from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
+from ....webhook.utils import invalidate_webhook_event_map
 from ....webhook.validators import HEADERS_LENGTH_LIMIT, HEADERS_NUMBER_LIMIT
 from ...app.dataloaders import get_app_promise
 from ...core import ResolveInfo
@@ -101,6 +103,7 @@ class WebhookUpdate(WebhookCreate, NotifyUserEventValidationMixin):
                     for event in events
                 ]
             )
+            transaction.on_commit(invalidate_webhook_event_map)
 
     @classmethod
     def get_instance(cls, info: ResolveInfo, **data):
@@ -12,6 +12,7 @@ from ..account.models import User
 from ..celeryconf import app
 from ..channel.models import Channel
 from ..core.db.connection import allow_writer
+from ..core.purge import BasePurger, run_purge
 from ..core.tracing import traced_atomic_transaction
 from ..discount.models import Voucher, VoucherCode, VoucherCustomer
 from ..payment.models import Payment, TransactionItem
@@ -177,51 +178,57 @@ def expire_orders_task():
     _expire_orders(manager, now)
 
 
-@app.task
-def delete_expired_orders_task():
-    now = timezone.now()
+class ExpiredOrdersPurger(BasePurger):
+    """Select expired orders without payments, past their channel deletion time."""
 
-    channel_qs = Channel.objects.using(
-        settings.DATABASE_CONNECTION_REPLICA_NAME
-    ).filter(
-        delete_expired_orders_after__gt=datetime.timedelta(),
-        id=OuterRef("channel"),
-    )
+    name = "orders"
+    model = Order
+    initial_batch_size = 500
+    max_batch_size = DELETE_EXPIRED_ORDER_BATCH_SIZE
 
-    qs = (
-        Order.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .annotate(
-            delete_expired_orders_after=Subquery(
-                channel_qs.values("delete_expired_orders_after")[:1]
-            )
+    def __init__(self):
+        self.now = timezone.now()
+
+    def get_queryset(self):
+        channel_qs = Channel.objects.using(
+            settings.DATABASE_CONNECTION_REPLICA_NAME
+        ).filter(
+            delete_expired_orders_after__gt=datetime.timedelta(),
+            id=OuterRef("channel"),
         )
-        .filter(
-            ~Exists(TransactionItem.objects.filter(order=OuterRef("pk"))),
-            ~Exists(Payment.objects.filter(order=OuterRef("pk"))),
-            expired_at__isnull=False,
-            status=OrderStatus.EXPIRED,
-            expired_at__lte=now - F("delete_expired_orders_after"),  # type:ignore[operator]
+        return (
+            Order.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+            .annotate(
+                delete_expired_orders_after=Subquery(
+                    channel_qs.values("delete_expired_orders_after")[:1]
+                )
+            )
+            .filter(
+                ~Exists(TransactionItem.objects.filter(order=OuterRef("pk"))),
+                ~Exists(Payment.objects.filter(order=OuterRef("pk"))),
+                expired_at__isnull=False,
+                status=OrderStatus.EXPIRED,
+                expired_at__lte=self.now - F("delete_expired_orders_after"),  # type:ignore[operator]
+            )
         )
-    )
-    ids_batch = qs.values_list("pk", flat=True)[:DELETE_EXPIRED_ORDER_BATCH_SIZE]
-    if not ids_batch:
-        return
-
-    # Wrap ids_batch with a list as it comes from the replica DB and delete is done on
-    # the writer DB. This avoids mixing querysets from different DBs.
-    ids_batch = list(ids_batch)
-    user_orders_count = Counter(
-        Order.objects.filter(id__in=ids_batch, user_id__isnull=False)
-        .using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .values_list("user_id", flat=True)
-    )
 
-    with allow_writer():
-        Order.objects.filter(id__in=ids_batch).delete()
+    def delete_batch(self, pks: list) -> int:
+        user_orders_count = Counter(
+            Order.objects.filter(id__in=pks, user_id__isnull=False)
+            .using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+            .values_list("user_id", flat=True)
+        )
+        with allow_writer():
+            deleted_count = super().delete_batch(pks)
+        reduce_user_number_of_orders(user_orders_count)
+        return deleted_count
 
-    reduce_user_number_of_orders(user_orders_count)
 
-    delete_expired_orders_task.delay()
+@app.task
+def delete_expired_orders_task():
+    result = run_purge(ExpiredOrdersPurger(), time_limit=settings.PURGE_TASK_TIME_LIMIT)
+    if not result.finished:
+        delete_expired_orders_task.delay()
 
 
 @allow_writer()
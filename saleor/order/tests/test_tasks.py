@@ -9,6 +9,7 @@ from freezegun import freeze_time
 
 from ...account.models import User
 from ...core.models import EventDelivery
+from ...core.purge import reset_purge_progress
 from ...discount.models import VoucherCustomer
 from ...warehouse.models import Allocation
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
@@ -16,6 +17,7 @@ from .. import OrderEvents, OrderStatus
 from ..actions import call_order_event, call_order_events
 from ..models import Order, OrderEvent, get_order_number
 from ..tasks import (
+    ExpiredOrdersPurger,
     _bulk_release_voucher_usage,
     delete_expired_orders_task,
     expire_orders_task,
@@ -23,6 +25,12 @@ from ..tasks import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_expired_orders_purge_progress():
+    yield
+    reset_purge_progress(ExpiredOrdersPurger.name)
+
+
 def test_expire_orders_task_check_voucher(
     order_list, allocations, channel_USD, voucher_customer
 ):
@@ -671,12 +679,14 @@ def test_delete_expired_orders_task_orders_with_payment_objects(
     assert Order.objects.count() == 4
 
 
-@mock.patch("saleor.order.tasks.DELETE_EXPIRED_ORDER_BATCH_SIZE", 1)
+@mock.patch.object(ExpiredOrdersPurger, "min_batch_size", 1)
+@mock.patch.object(ExpiredOrdersPurger, "initial_batch_size", 1)
 @patch("saleor.order.tasks.delete_expired_orders_task.delay")
 def test_delete_expired_orders_task_schedule_itself(
-    mocked_delay, order_list, allocations, channel_USD
+    mocked_delay, order_list, allocations, channel_USD, settings
 ):
     # given
+    settings.PURGE_TASK_TIME_LIMIT = 0
     channel_USD.delete_expired_orders_after = datetime.timedelta(days=3)
     channel_USD.save()
 
@@ -1,9 +1,14 @@
 import datetime
+import hashlib
 import json
 import logging
+import os
+import threading
+import time
 from collections.abc import Iterator
 from dataclasses import dataclass
 from decimal import Decimal
+from http.cookiejar import DefaultCookiePolicy
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urljoin
 
@@ -43,6 +48,11 @@ META_DESCRIPTION_KEY = "avatax.description"
 CACHE_TIME = 60 * 60  # 1 hour
 TAX_CODES_CACHE_TIME = 60 * 60 * 24 * 7  # 7 days
 CACHE_KEY = "avatax_request_id_"
+# Concurrent identical requests wait for the response of the one holding the lock,
+# which is released once the response is cached or the Avatax call times out.
+CACHE_LOCK_KEY = "avatax_request_lock_"
+CACHE_LOCK_TIME = 30
+CACHE_LOCK_POLL_INTERVAL = 0.1
 TAX_CODES_CACHE_KEY = "avatax_tax_codes_cache_key"
 
 # Common discount code use to apply discount on order
@@ -96,13 +106,36 @@ def get_api_url(use_sandbox=True) -> str:
     return "https://rest.avatax.com/api/v2/"
 
 
+_http_sessions = threading.local()
+
+
+def _create_http_session():
+    session = HTTPClient.get_session()
+    # The session is shared by plugins with different credentials.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def get_http_session():
+    """Return the session reusing connections to Avatax within the thread.
+
+    Sessions are not thread-safe, so each thread keeps its own. The session is also
+    bound to the process id, so forked workers don't share sockets.
+    """
+    pid = os.getpid()
+    if getattr(_http_sessions, "pid", None) != pid:
+        _http_sessions.session = _create_http_session()
+        _http_sessions.pid = pid
+    return _http_sessions.session
+
+
 def api_post_request(
     url: str, data: dict[str, Any], config: AvataxConfiguration
 ) -> dict[str, Any]:
     response = None
     try:
         auth = HTTPBasicAuth(config.username_or_account, config.password_or_license)
-        response = HTTPClient.send_request(
+        response = get_http_session().request(
             "POST",
             url,
             auth=auth,
@@ -134,7 +167,9 @@ def api_get_request(
     response = None
     try:
         auth = HTTPBasicAuth(username_or_account, password_or_license)
-        response = HTTPClient.send_request("GET", url, auth=auth, allow_redirects=False)
+        response = get_http_session().request(
+            "GET", url, auth=auth, allow_redirects=False
+        )
         json_response = response.json()
         logger.debug("[GET] Hit to %s", url)
         if "error" in json_response:
@@ -215,6 +250,11 @@ def _validate_checkout(
     )
 
 
+def get_request_data_digest(data: dict[str, Any]) -> str:
+    """Return the digest of the request data, stored in the cache with the response."""
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
 def taxes_need_new_fetch(data: dict[str, Any], cached_data) -> bool:
     """Check if Avatax's taxes data need to be refetched.
 
@@ -225,9 +265,10 @@ def taxes_need_new_fetch(data: dict[str, Any], cached_data) -> bool:
         return True
 
     cached_request_data, _ = cached_data
-    if data != cached_request_data:
-        return True
-    return False
+    if isinstance(cached_request_data, dict):
+        # the whole request data was cached before the digest was introduced
+        return data != cached_request_data
+    return get_request_data_digest(data) != cached_request_data
 
 
 def append_line_to_data(
@@ -571,14 +612,48 @@ def _fetch_new_taxes_data(
     with tracer.start_as_current_span("avatax.transactions.crateoradjust") as span:
         span.set_attribute(saleor_attributes.COMPONENT, "tax")
         response = api_post_request(transaction_url, data, config)
+    digest = get_request_data_digest(data)
     if response and "error" not in response:
-        cache.set(data_cache_key, (data, response), CACHE_TIME)
+        cache.set(data_cache_key, (digest, response), CACHE_TIME)
     else:
         # cache failed response to limit hits to avatax.
-        cache.set(data_cache_key, (data, response), 10)
+        cache.set(data_cache_key, (digest, response), 10)
     return response
 
 
+def _fetch_new_taxes_data_once(
+    data: dict[str, dict], data_cache_key: str, config: AvataxConfiguration
+):
+    """Fetch taxes, sharing a single Avatax call between identical requests.
+
+    The request that acquires the lock calls Avatax, while concurrent requests with
+    the same data wait until its response is cached. If the lock holder doesn't
+    cache the response, waiting requests call Avatax on their own.
+    """
+    digest = get_request_data_digest(data)
+    lock_key = f"{CACHE_LOCK_KEY}{data_cache_key}_{digest}"
+    if cache.add(lock_key, 1, timeout=CACHE_LOCK_TIME):
+        try:
+            # the response could be cached just before the lock was acquired
+            cached_data = cache.get(data_cache_key)
+            if cached_data and cached_data[0] == digest:
+                return cached_data[1]
+            return _fetch_new_taxes_data(data, data_cache_key, config)
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + CACHE_LOCK_TIME
+    while time.monotonic() < deadline:
+        time.sleep(CACHE_LOCK_POLL_INTERVAL)
+        cached_values = cache.get_many([data_cache_key, lock_key])
+        cached_data = cached_values.get(data_cache_key)
+        if cached_data and cached_data[0] == digest:
+            return cached_data[1]
+        if lock_key not in cached_values:
+            break
+    return _fetch_new_taxes_data(data, data_cache_key, config)
+
+
 def get_cached_response_or_fetch(
     data: dict[str, dict],
     token_in_cache: str,
@@ -593,9 +668,11 @@ def get_cached_response_or_fetch(
     if not data:
         return None
     data_cache_key = CACHE_KEY + token_in_cache
+    if force_refresh:
+        return _fetch_new_taxes_data(data, data_cache_key, config)
     cached_data = cache.get(data_cache_key)
-    if taxes_need_new_fetch(data, cached_data) or force_refresh:
-        response = _fetch_new_taxes_data(data, data_cache_key, config)
+    if taxes_need_new_fetch(data, cached_data):
+        response = _fetch_new_taxes_data_once(data, data_cache_key, config)
     else:
         _, response = cached_data
     return response
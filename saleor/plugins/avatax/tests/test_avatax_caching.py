@@ -1,13 +1,23 @@
+import threading
 from copy import deepcopy
 from decimal import Decimal
 from unittest.mock import ANY, Mock, patch
 
+from django.core.cache import cache
 from django.test import override_settings
 from prices import Money, TaxedMoney
 
 from ....checkout.fetch import fetch_checkout_lines
 from ...manager import get_plugins_manager
-from .. import CACHE_KEY, generate_request_data_from_checkout
+from .. import (
+    CACHE_KEY,
+    CACHE_LOCK_KEY,
+    generate_request_data_from_checkout,
+    get_cached_response_or_fetch,
+    get_http_session,
+    get_request_data_digest,
+    taxes_need_new_fetch,
+)
 from ..plugin import DeprecatedAvataxPlugin
 
 
@@ -713,3 +723,112 @@ def test_get_checkout_shipping_tax_rate_save_avatax_response_in_cache(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
     mocked_avalara.assert_called_once_with(ANY, avalara_request_data, plugin.config)
+
+
+AVATAX_REQUEST_DATA = {"createTransactionModel": {"code": "123", "lines": []}}
+
+
+@patch("saleor.plugins.avatax.api_post_request")
+def test_get_cached_response_or_fetch_caches_request_digest(
+    mocked_avalara, avatax_config
+):
+    # given
+    response = {"id": 1}
+    mocked_avalara.return_value = response
+    token = "digest-token"
+
+    # when
+    result = get_cached_response_or_fetch(AVATAX_REQUEST_DATA, token, avatax_config)
+
+    # then
+    assert result == response
+    assert cache.get(CACHE_KEY + token) == (
+        get_request_data_digest(AVATAX_REQUEST_DATA),
+        response,
+    )
+    assert not taxes_need_new_fetch(AVATAX_REQUEST_DATA, cache.get(CACHE_KEY + token))
+
+
+@patch("saleor.plugins.avatax.time.sleep")
+@patch("saleor.plugins.avatax.api_post_request")
+def test_get_cached_response_or_fetch_waits_for_in_flight_request(
+    mocked_avalara, mocked_sleep, avatax_config
+):
+    # given
+    response = {"id": 1}
+    token = "in-flight-token"
+    data_cache_key = CACHE_KEY + token
+    digest = get_request_data_digest(AVATAX_REQUEST_DATA)
+    cache.add(f"{CACHE_LOCK_KEY}{data_cache_key}_{digest}", 1)
+
+    # the response of the request holding the lock is cached while waiting
+    mocked_sleep.side_effect = lambda _: cache.set(data_cache_key, (digest, response))
+
+    # when
+    result = get_cached_response_or_fetch(AVATAX_REQUEST_DATA, token, avatax_config)
+
+    # then
+    assert result == response
+    mocked_avalara.assert_not_called()
+
+
+@patch("saleor.plugins.avatax.time.sleep")
+@patch("saleor.plugins.avatax.api_post_request")
+def test_get_cached_response_or_fetch_lock_released_without_response(
+    mocked_avalara, mocked_sleep, avatax_config
+):
+    # given
+    response = {"id": 1}
+    mocked_avalara.return_value = response
+    token = "released-lock-token"
+    lock_key = (
+        f"{CACHE_LOCK_KEY}{CACHE_KEY}{token}_"
+        f"{get_request_data_digest(AVATAX_REQUEST_DATA)}"
+    )
+    cache.add(lock_key, 1)
+
+    # the request holding the lock fails without caching the response
+    mocked_sleep.side_effect = lambda _: cache.delete(lock_key)
+
+    # when
+    result = get_cached_response_or_fetch(AVATAX_REQUEST_DATA, token, avatax_config)
+
+    # then
+    assert result == response
+    mocked_avalara.assert_called_once_with(ANY, AVATAX_REQUEST_DATA, avatax_config)
+
+
+def test_get_http_session_is_reused_within_thread():
+    # when
+    session = get_http_session()
+
+    # then
+    assert get_http_session() is session
+
+
+def test_get_http_session_is_not_shared_between_threads():
+    # given
+    session = get_http_session()
+    thread_sessions = []
+    thread = threading.Thread(target=lambda: thread_sessions.append(get_http_session()))
+
+    # when
+    thread.start()
+    thread.join()
+
+    # then
+    assert thread_sessions[0] is not session
+
+
+@patch("saleor.plugins.avatax.os.getpid")
+def test_get_http_session_is_not_shared_between_processes(mocked_getpid):
+    # given
+    mocked_getpid.return_value = 1
+    session = get_http_session()
+
+    # when
+    mocked_getpid.return_value = 2
+    forked_session = get_http_session()
+
+    # then
+    assert forked_session is not session
@@ -1,6 +1,7 @@
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 from decimal import Decimal
+from functools import cache
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from django.conf import settings
@@ -10,6 +11,10 @@ from prices import TaxedMoney
 
 from ..channel.models import Channel
 from ..checkout import base_calculations
+from ..checkout.snapshot import (
+    CHECKOUT_SNAPSHOT_INVALIDATING_EVENTS,
+    invalidate_checkout_snapshots,
+)
 from ..core.db.connection import allow_writer
 from ..core.models import EventDelivery
 from ..core.payments import PaymentInterface
@@ -17,6 +22,10 @@ from ..core.prices import quantize_price
 from ..core.taxes import TaxData, TaxDataError, TaxType, zero_money, zero_taxed_money
 from ..core.telemetry import tracer
 from ..graphql.core import SaleorContext
+from ..graphql.response_cache import (
+    RESPONSE_CACHE_INVALIDATING_EVENTS,
+    invalidate_response_cache,
+)
 from ..order import base_calculations as base_order_calculations
 from ..order.base_calculations import (
     base_order_line_total,
@@ -51,6 +60,7 @@ from ..payment.interface import (
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
 from .models import PluginConfiguration
+from .snapshot import get_channel_plugin_configs
 
 if TYPE_CHECKING:
     from ..account.models import Address, Group, User
@@ -87,6 +97,29 @@ if TYPE_CHECKING:
 NotifyEventTypeChoice = str
 
 
+@cache
+def import_plugin_class(plugin_path: str) -> type["BasePlugin"]:
+    return import_string(plugin_path)
+
+
+_plugin_methods: dict[type["BasePlugin"], frozenset[str]] = {}
+
+
+def get_plugin_methods(PluginClass: type["BasePlugin"]) -> frozenset[str]:
+    """Return names of the attributes defined by the plugin class.
+
+    Plugin hooks are only declared in `BasePlugin`, so the manager skips plugins
+    without the hook in this set, without probing them. Attributes that are not
+    callable are included, so running them as hooks still raises an error.
+    """
+    methods = _plugin_methods.get(PluginClass)
+    if methods is None:
+        methods = _plugin_methods[PluginClass] = frozenset(
+            name for name in dir(PluginClass) if not name.startswith("__")
+        )
+    return methods
+
+
 class PluginsManager(PaymentInterface):
     """Base manager for handling plugins logic."""
 
@@ -153,11 +186,12 @@ class PluginsManager(PaymentInterface):
         self, channel_slug: str | None, channel: Channel | None = None
     ):
         if channel_slug is None and not self.loaded_global:
-            global_db_config = self._get_db_plugin_configs(None)
+            global_db_configs = self._get_channel_db_plugin_configs(None)
+            global_db_config = global_db_configs[1] if global_db_configs else {}
 
             for plugin_path in self.plugins:
                 with tracer.start_as_current_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = import_plugin_class(plugin_path)
                     if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -170,20 +204,16 @@ class PluginsManager(PaymentInterface):
             self.loaded_global = True
 
         if channel_slug is not None and channel_slug not in self.loaded_channels:
-            if channel is None:
-                channel = (
-                    Channel.objects.using(self.database)
-                    .filter(slug=channel_slug)
-                    .first()
-                )
-                if not channel:
-                    return
-
-            channel_db_config = self._get_db_plugin_configs(channel)
+            channel_db_configs = self._get_channel_db_plugin_configs(
+                channel_slug, channel
+            )
+            if channel_db_configs is None:
+                return
+            channel, channel_db_config = channel_db_configs
 
             for plugin_path in self.plugins:
                 with tracer.start_as_current_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
+                    PluginClass = import_plugin_class(plugin_path)
                     if getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
                         plugin = self._load_plugin(
                             PluginClass,
@@ -199,6 +229,27 @@ class PluginsManager(PaymentInterface):
             self.plugins_per_channel[channel_slug].extend(self.global_plugins)
             self.loaded_channels.add(channel_slug)
 
+    def _get_channel_db_plugin_configs(
+        self, channel_slug: str | None, channel: Channel | None = None
+    ) -> tuple[Channel | None, dict] | None:
+        """Return the channel and plugin configurations of it or of global plugins.
+
+        Return None if the channel does not exist.
+        """
+        if settings.PLUGIN_CONFIGS_CACHE_ENABLED:
+            channel_configs = get_channel_plugin_configs(channel_slug)
+            if channel_configs is None:
+                return None
+            return channel_configs.channel, channel_configs.configs
+
+        if channel_slug is not None and channel is None:
+            channel = (
+                Channel.objects.using(self.database).filter(slug=channel_slug).first()
+            )
+            if not channel:
+                return None
+        return channel, self._get_db_plugin_configs(channel)
+
     def _get_db_plugin_configs(self, channel: Channel | None):
         with tracer.start_as_current_span("_get_db_plugin_configs"):
             plugin_manager_configs = PluginConfiguration.objects.using(
@@ -219,6 +270,16 @@ class PluginsManager(PaymentInterface):
         **kwargs,
     ):
         """Try to run a method with the given name on each declared active plugin."""
+        if (
+            settings.GRAPHQL_RESPONSE_CACHE_ENABLED
+            and method_name in RESPONSE_CACHE_INVALIDATING_EVENTS
+        ):
+            invalidate_response_cache()
+        if (
+            settings.CHECKOUT_SNAPSHOT_CACHE_ENABLED
+            and method_name in CHECKOUT_SNAPSHOT_INVALIDATING_EVENTS
+        ):
+            invalidate_checkout_snapshots()
         value = default_value
         plugins = self.get_plugins(
             channel_slug=channel_slug,
@@ -245,6 +306,8 @@ class PluginsManager(PaymentInterface):
         method. If plugin doesn't have own implementation of expected method_name, it
         will return previous_value.
         """
+        if plugin is None or method_name not in get_plugin_methods(type(plugin)):
+            return previous_value
         plugin_method = getattr(plugin, method_name, NotImplemented)
         if plugin_method == NotImplemented:
             return previous_value
@@ -0,0 +1,7 @@
+from django.db import transaction
+
+from .snapshot import invalidate_plugin_configs
+
+
+def invalidate_plugin_configs_on_commit(sender, **kwargs):
+    transaction.on_commit(invalidate_plugin_configs)
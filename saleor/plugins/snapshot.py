@@ -0,0 +1,98 @@
+import copy
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from ..channel.models import Channel
+from ..core.db.connection import allow_writer
+from ..core.utils.cache import CacheDict, bump_cache_version, get_cache_version
+from .models import PluginConfiguration
+
+PLUGIN_CONFIGS_VERSION_KEY = "plugin-configs-version"
+
+# Process-local cache of plugin configurations of channels. Entries are keyed by the
+# version stored in the cache backend, so bumping the version in one process
+# invalidates the entries in all of them.
+_plugin_configs_cache = CacheDict(
+    1024,
+    timeout=settings.PLUGIN_CONFIGS_CACHE_TIMEOUT,
+    name="plugin_configs",
+)
+
+
+@dataclass(frozen=True)
+class ChannelPluginConfigs:
+    """Database configurations of plugins in the channel, or of global plugins."""
+
+    channel: Channel | None
+    configs: dict[str, PluginConfiguration]
+
+
+def get_plugin_configs_version() -> int:
+    return get_cache_version(PLUGIN_CONFIGS_VERSION_KEY)
+
+
+def invalidate_plugin_configs():
+    """Invalidate cached plugin configurations in all processes.
+
+    Should be called after the transaction that changes plugin configurations or
+    channels is committed.
+    """
+    if not settings.PLUGIN_CONFIGS_CACHE_ENABLED:
+        return
+    bump_cache_version(PLUGIN_CONFIGS_VERSION_KEY)
+    _plugin_configs_cache.clear()
+
+
+def get_channel_plugin_configs(
+    channel_slug: str | None,
+) -> ChannelPluginConfigs | None:
+    """Return plugin configurations of the channel, or of global plugins for None.
+
+    Return None if the channel does not exist. Returned configurations are copies,
+    as plugin managers modify them, e.g. when saving a plugin configuration.
+    """
+    key = (get_plugin_configs_version(), channel_slug)
+    channel_configs = _plugin_configs_cache.get(key)
+    if channel_configs is None:
+        channel_configs = _fetch_channel_plugin_configs(channel_slug)
+        _plugin_configs_cache[key] = channel_configs
+    if channel_slug is not None and channel_configs.channel is None:
+        return None
+    return _copy_channel_plugin_configs(channel_configs)
+
+
+def _copy_channel_plugin_configs(
+    channel_configs: ChannelPluginConfigs,
+) -> ChannelPluginConfigs:
+    channel = copy.copy(channel_configs.channel)
+    configs = {}
+    for identifier, db_config in channel_configs.configs.items():
+        config_copy = copy.copy(db_config)
+        config_copy.configuration = copy.deepcopy(db_config.configuration)
+        config_copy.channel = channel
+        configs[identifier] = config_copy
+    return ChannelPluginConfigs(channel=channel, configs=configs)
+
+
+def _fetch_channel_plugin_configs(channel_slug: str | None) -> ChannelPluginConfigs:
+    # Configurations are read from the writer, as the replica could still return
+    # the data from before the change that invalidated the cache.
+    with allow_writer():
+        channel = None
+        if channel_slug is not None:
+            channel = (
+                Channel.objects.using(settings.DATABASE_CONNECTION_DEFAULT_NAME)
+                .filter(slug=channel_slug)
+                .first()
+            )
+            if channel is None:
+                return ChannelPluginConfigs(channel=None, configs={})
+        configs = {}
+        for db_config in PluginConfiguration.objects.using(
+            settings.DATABASE_CONNECTION_DEFAULT_NAME
+        ).filter(channel=channel):
+            # set the channel, so plugins don't fetch it separately
+            db_config.channel = channel
+            configs[db_config.identifier] = db_config
+    return ChannelPluginConfigs(channel=channel, configs=configs)
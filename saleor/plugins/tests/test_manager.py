@@ -1056,6 +1056,25 @@ def test_run_method_on_single_plugin_valid_response(plugins_manager):
     )
 
 
+def test_run_method_on_plugins_not_callable_attribute(plugins_manager, channel_USD):
+    # given
+    class NotCallableHookPlugin(PluginSample):
+        PLUGIN_ID = "plugin.not_callable_hook"
+        get_supported_currencies = ["USD"]
+
+    plugin = NotCallableHookPlugin(configuration=None, active=True)
+    plugins_manager.all_plugins = [plugin]
+    plugins_manager.plugins_per_channel[channel_USD.slug] = [plugin]
+
+    # when & then
+    with pytest.raises(ValueError, match="get_supported_currencies"):
+        plugins_manager._PluginsManager__run_method_on_plugins(
+            method_name="get_supported_currencies",
+            default_value="default_value",
+            channel_slug=channel_USD.slug,
+        )
+
+
 def test_run_check_payment_balance(channel_USD):
     plugins = ["saleor.plugins.tests.sample_plugins.ActiveDummyPaymentGateway"]
 
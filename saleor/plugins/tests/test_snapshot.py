@@ -0,0 +1,120 @@
+import pytest
+
+from ..manager import PluginsManager, get_plugin_methods
+from ..models import PluginConfiguration
+from ..snapshot import _plugin_configs_cache, get_channel_plugin_configs
+from .sample_plugins import ActivePaymentGateway, ChannelPluginSample, PluginSample
+
+
+@pytest.fixture
+def plugin_configs_cache(settings):
+    settings.PLUGIN_CONFIGS_CACHE_ENABLED = True
+    _plugin_configs_cache.clear()
+    yield
+    _plugin_configs_cache.clear()
+
+
+def test_get_channel_plugin_configs(plugin_configs_cache, channel_USD):
+    # given
+    config = PluginConfiguration.objects.create(
+        identifier=ChannelPluginSample.PLUGIN_ID, channel=channel_USD, active=True
+    )
+    get_channel_plugin_configs(channel_USD.slug)
+
+    # when
+    channel_configs = get_channel_plugin_configs(channel_USD.slug)
+
+    # then
+    assert channel_configs.channel == channel_USD
+    assert channel_configs.configs == {config.identifier: config}
+
+
+def test_get_channel_plugin_configs_returns_copies(plugin_configs_cache, channel_USD):
+    # given
+    PluginConfiguration.objects.create(
+        identifier=ChannelPluginSample.PLUGIN_ID,
+        channel=channel_USD,
+        active=True,
+        configuration=[{"name": "Username", "value": "admin"}],
+    )
+    channel_configs = get_channel_plugin_configs(channel_USD.slug)
+    config = channel_configs.configs[ChannelPluginSample.PLUGIN_ID]
+
+    # when
+    config.active = False
+    config.configuration[0]["value"] = "changed"
+
+    # then
+    cached_config = get_channel_plugin_configs(channel_USD.slug).configs[
+        ChannelPluginSample.PLUGIN_ID
+    ]
+    assert cached_config is not config
+    assert cached_config.active is True
+    assert cached_config.configuration == [{"name": "Username", "value": "admin"}]
+
+
+def test_get_channel_plugin_configs_channel_does_not_exist(plugin_configs_cache):
+    # when
+    channel_configs = get_channel_plugin_configs("non-existing")
+
+    # then
+    assert channel_configs is None
+
+
+def test_plugins_manager_uses_cached_plugin_configs(
+    plugin_configs_cache, channel_USD, django_assert_num_queries
+):
+    # given
+    plugins = [
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+        "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+    ]
+    PluginsManager(plugins=plugins).get_plugins(channel_slug=channel_USD.slug)
+    manager = PluginsManager(plugins=plugins)
+
+    # when
+    with django_assert_num_queries(0):
+        plugins = manager.get_plugins(channel_slug=channel_USD.slug)
+
+    # then
+    assert {type(plugin) for plugin in plugins} == {PluginSample, ChannelPluginSample}
+    assert plugins[0].channel == channel_USD
+
+
+def test_plugin_config_change_invalidates_cached_plugin_configs(
+    plugin_configs_cache, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    get_channel_plugin_configs(channel_USD.slug)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        config = PluginConfiguration.objects.create(
+            identifier=ChannelPluginSample.PLUGIN_ID, channel=channel_USD, active=True
+        )
+
+    # then
+    channel_configs = get_channel_plugin_configs(channel_USD.slug)
+    assert channel_configs.configs == {config.identifier: config}
+
+
+def test_get_plugin_methods():
+    # when
+    methods = get_plugin_methods(ActivePaymentGateway)
+
+    # then
+    assert "process_payment" in methods
+    assert "get_payment_config" in methods
+    assert "calculate_checkout_total" not in methods
+
+
+def test_get_plugin_methods_includes_not_callable_attributes():
+    # given
+    class NotCallableHookPlugin(PluginSample):
+        get_supported_currencies = ["USD"]
+
+    # when
+    methods = get_plugin_methods(NotCallableHookPlugin)
+
+    # then
+    assert "get_supported_currencies" in methods
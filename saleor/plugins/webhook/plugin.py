@@ -124,7 +124,7 @@ from ...webhook.transport.synchronous.transport import (
     trigger_taxes_all_webhooks_sync,
     trigger_transaction_request,
     trigger_webhook_sync,
-    trigger_webhook_sync_if_not_cached,
+    trigger_webhooks_sync_if_not_cached,
 )
 from ...webhook.transport.taxes import (
     DEFAULT_TAX_CODE,
@@ -2832,20 +2832,18 @@ class WebhookPlugin(BasePlugin):
                 list_payment_method_data.user.id, list_payment_method_data.channel.slug
             )
             payload = self._serialize_payload(payload_dict)
-            for webhook in webhooks:
-                if not webhook.app.identifier:
-                    continue
-                response_data = trigger_webhook_sync_if_not_cached(
-                    event_type,
-                    payload,
-                    webhook,
-                    payload_dict,
-                    self.allow_replica,
-                    subscribable_object=list_payment_method_data,
-                    request_timeout=WEBHOOK_SYNC_TIMEOUT,
-                    cache_timeout=WEBHOOK_CACHE_DEFAULT_TTL,
-                    requestor=self.requestor,
-                )
+            responses = trigger_webhooks_sync_if_not_cached(
+                event_type,
+                payload,
+                [webhook for webhook in webhooks if webhook.app.identifier],
+                payload_dict,
+                self.allow_replica,
+                subscribable_object=list_payment_method_data,
+                request_timeout=WEBHOOK_SYNC_TIMEOUT,
+                cache_timeout=WEBHOOK_CACHE_DEFAULT_TTL,
+                requestor=self.requestor,
+            )
+            for webhook, response_data in responses:
                 if response_data:
                     previous_value.extend(
                         get_list_stored_payment_methods_from_response(
@@ -3627,19 +3625,18 @@ class WebhookPlugin(BasePlugin):
         if webhooks:
             payload = generate_checkout_payload(checkout, self.requestor)
             cache_data = get_cache_data_for_shipping_list_methods_for_checkout(payload)
-            for webhook in webhooks:
-                response_data = trigger_webhook_sync_if_not_cached(
-                    event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    payload=payload,
-                    webhook=webhook,
-                    cache_data=cache_data,
-                    allow_replica=self.allow_replica,
-                    subscribable_object=(checkout, built_in_shipping_methods),
-                    request_timeout=WEBHOOK_SYNC_TIMEOUT,
-                    cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    requestor=self.requestor,
-                )
-
+            responses = trigger_webhooks_sync_if_not_cached(
+                event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                payload=payload,
+                webhooks=webhooks,
+                cache_data=cache_data,
+                allow_replica=self.allow_replica,
+                subscribable_object=(checkout, built_in_shipping_methods),
+                request_timeout=WEBHOOK_SYNC_TIMEOUT,
+                cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                requestor=self.requestor,
+            )
+            for webhook, response_data in responses:
                 if response_data:
                     shipping_methods = parse_list_shipping_methods_response(
                         response_data, webhook.app, checkout.currency
@@ -0,0 +1,101 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Max, Min
+
+from ....core.db.connection import allow_writer
+from ...models import Product
+from ...search import PRODUCTS_BATCH_SIZE, update_products_search_vector
+
+# Number of consecutive product ids processed as a single unit of work.
+SHARD_SIZE = 10000
+
+
+class Command(BaseCommand):
+    help = "Rebuild search vectors of all products."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Number of worker processes; product ids are split into shards.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PRODUCTS_BATCH_SIZE,
+            help="Number of products updated with a single query.",
+        )
+        parser.add_argument(
+            "--dirty-only",
+            action="store_true",
+            help="Update only products with outdated search index.",
+        )
+
+    def handle(self, *args, **options):
+        dirty_only = options["dirty_only"]
+        batch_size = options["batch_size"]
+        processes = options["processes"]
+
+        products = _get_products(dirty_only)
+        total = products.count()
+        pk_range = products.aggregate(min_pk=Min("pk"), max_pk=Max("pk"))
+        if not total:
+            self.stdout.write("No products to update.")
+            return
+
+        shards = [
+            (start_pk, start_pk + SHARD_SIZE - 1, dirty_only, batch_size)
+            for start_pk in range(
+                pk_range["min_pk"], pk_range["max_pk"] + 1, SHARD_SIZE
+            )
+        ]
+        self.stdout.write(
+            f"Updating search vectors of {total} products "
+            f"using {processes} process(es)."
+        )
+
+        started_at = time.monotonic()
+        updated_count = 0
+        for shard_updated_count in self._run_shards(shards, processes):
+            updated_count += shard_updated_count
+            elapsed = time.monotonic() - started_at
+            self.stdout.write(
+                f"Updated {updated_count}/{total} products ({elapsed:.1f}s)."
+            )
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated_count} products."))
+
+    def _run_shards(self, shards, processes):
+        if processes <= 1:
+            for shard in shards:
+                yield _update_shard(*shard)
+            return
+
+        # Workers open their own database connections.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=django.setup
+        ) as executor:
+            futures = [executor.submit(_update_shard, *shard) for shard in shards]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def _get_products(dirty_only: bool):
+    products = Product.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+    if dirty_only:
+        products = products.filter(search_index_dirty=True)
+    return products
+
+
+def _update_shard(start_pk: int, end_pk: int, dirty_only: bool, batch_size: int):
+    product_ids = _get_products(dirty_only).filter(pk__gte=start_pk, pk__lte=end_pk)
+    with allow_writer():
+        return update_products_search_vector(
+            product_ids.values_list("pk", flat=True), batch_size=batch_size
+        )
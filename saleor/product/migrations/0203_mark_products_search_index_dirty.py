@@ -0,0 +1,32 @@
+from django.apps import apps as registry
+from django.conf import settings
+from django.db import migrations
+from django.db.models.signals import post_migrate
+
+from .tasks.saleor3_23 import mark_products_search_index_dirty_task
+
+
+def mark_products_search_index_dirty(apps, _schema_editor):
+    # Documents are filled only for the trigram search. When the mode is enabled
+    # later, the `update_products_search_vector` command fills them instead.
+    if settings.PRODUCT_SEARCH_MODE != "trigram":
+        return
+
+    def on_migrations_complete(sender=None, **kwargs):
+        mark_products_search_index_dirty_task.delay()
+
+    sender = registry.get_app_config("product")
+    post_migrate.connect(on_migrations_complete, weak=False, sender=sender)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0202_category_product_category_tree_id_lf1e1"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            mark_products_search_index_dirty,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,25 @@
+from ....celeryconf import app
+from ....core.db.connection import allow_writer
+from ...models import Product
+
+BATCH_SIZE = 1000
+
+
+@app.task
+@allow_writer()
+def mark_products_search_index_dirty_task(product_pk=0):
+    """Mark products to reindex to fill `search_document` used by the trigram search.
+
+    The search index update task fills the document of dirty products.
+    """
+    products = Product.objects.filter(
+        pk__gt=product_pk, search_document="", search_index_dirty=False
+    ).order_by("pk")
+    product_ids = list(products.values_list("id", flat=True)[:BATCH_SIZE])
+
+    if not product_ids:
+        return
+
+    Product.objects.filter(pk__in=product_ids).update(search_index_dirty=True)
+
+    mark_products_search_index_dirty_task.delay(product_ids[-1])
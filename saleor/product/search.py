@@ -1,17 +1,29 @@
 from collections import defaultdict
 from collections.abc import Iterable
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
 from django.db.models import F, Q, Value, prefetch_related_objects
 
-from ..attribute.models import AssignedProductAttributeValue, AttributeValue
+from ..attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttribute,
+    AssignedVariantAttributeValue,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+)
 from ..attribute.search import get_search_vectors_for_attribute_values
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.batches import queryset_in_batches
 from ..page.models import Page
-from ..product.models import Product
+from ..product.models import Product, ProductVariant
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -24,55 +36,222 @@ PRODUCT_FIELDS_TO_PREFETCH = [
     "product_type__attributeproduct__attribute",
 ]
 
+# Product search modes, selected with `PRODUCT_SEARCH_MODE` setting.
+# `tsvector` - full text search on `search_vector`, ranked with `SearchRank`.
+# `trigram` - similarity search on `search_document`, matching prefixes and
+# misspelled words, ranked with word similarity.
+PRODUCT_SEARCH_MODE_TSVECTOR = "tsvector"
+PRODUCT_SEARCH_MODE_TRIGRAM = "trigram"
+
 PRODUCTS_BATCH_SIZE = 100
-# Setting threshold to 100 results in about 766.98MB of memory usage
-# when testing locally with multiple attributes of different types assigned to product
-# and product variants.
-
-
-def _prep_product_search_vector_index(
-    products, page_id_to_title_map: dict[int, str] | None = None
-):
-    prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
-
-    for product in products:
-        product.search_vector = FlatConcatSearchVector(
-            *prepare_product_search_vector_value(
-                product,
-                already_prefetched=True,
-                page_id_to_title_map=page_id_to_title_map,
-            )
-        )
-        product.search_index_dirty = False
 
-    Product.objects.bulk_update(
-        products, ["search_vector", "updated_at", "search_index_dirty"]
-    )
+# Attribute value fields used in the product search vector.
+ATTRIBUTE_VALUE_SEARCH_FIELDS = [
+    "attribute_id",
+    "name",
+    "rich_text",
+    "plain_text",
+    "date_time",
+    "reference_page_id",
+]
 
 
-def update_products_search_vector(product_ids: Iterable[int]):
+def update_products_search_vector(
+    product_ids: Iterable[int], batch_size: int = PRODUCTS_BATCH_SIZE
+) -> int:
+    """Update `search_vector` and `search_document` of the given products.
+
+    The values are built from flat queries fetching only the indexed fields,
+    instead of prefetching the product, variants and attributes object graphs.
+    Return the number of updated products.
+    """
     db_conn = settings.DATABASE_CONNECTION_REPLICA_NAME
     product_ids = list(product_ids)
-    products = Product.objects.using(db_conn).filter(pk__in=product_ids).order_by("pk")
-    for product_pks in queryset_in_batches(products, PRODUCTS_BATCH_SIZE):
-        value_ids = (
-            AssignedProductAttributeValue.objects.using(db_conn)
-            .filter(product_id__in=product_pks)
-            .values_list("value_id", flat=True)
+    products = Product.objects.using(db_conn).filter(pk__in=product_ids)
+    updated_count = 0
+    for product_pks in queryset_in_batches(products, batch_size):
+        products_batch = _prepare_products_search_index(product_pks, db_conn)
+        Product.objects.bulk_update(
+            products_batch, ["search_vector", "search_document", "search_index_dirty"]
+        )
+        updated_count += len(products_batch)
+    return updated_count
+
+
+def _prepare_products_search_index(
+    product_pks: list[int], db_conn: str
+) -> list[Product]:
+    products_data = (
+        Product.objects.using(db_conn)
+        .filter(pk__in=product_pks)
+        .values_list("pk", "name", "description_plaintext", "product_type_id")
+    )
+    product_type_ids = {product_type_id for *_, product_type_id in products_data}
+
+    attribute_ids_by_product_type = defaultdict(list)
+    for product_type_id, attribute_id in (
+        AttributeProduct.objects.using(db_conn)
+        .filter(product_type_id__in=product_type_ids)
+        .order_by("sort_order", "pk")
+        .values_list("product_type_id", "attribute_id")
+    ):
+        attribute_ids_by_product_type[product_type_id].append(attribute_id)
+
+    value_ids_by_product = defaultdict(list)
+    for product_id, value_id in (
+        AssignedProductAttributeValue.objects.using(db_conn)
+        .filter(product_id__in=product_pks)
+        .order_by("sort_order", "pk")
+        .values_list("product_id", "value_id")
+    ):
+        value_ids_by_product[product_id].append(value_id)
+
+    variants_by_product = defaultdict(list)
+    for variant_id, product_id, sku, name in (
+        ProductVariant.objects.using(db_conn)
+        .filter(product_id__in=product_pks)
+        .order_by("sort_order", "sku")
+        .values_list("pk", "product_id", "sku", "name")
+    ):
+        variants = variants_by_product[product_id]
+        if len(variants) < settings.PRODUCT_MAX_INDEXED_VARIANTS:
+            variants.append((variant_id, sku, name))
+
+    variant_ids = [
+        variant_id
+        for variants in variants_by_product.values()
+        for variant_id, *_ in variants
+    ]
+    assignments_by_variant = defaultdict(list)
+    for assignment_id, variant_id, attribute_id in (
+        AssignedVariantAttribute.objects.using(db_conn)
+        .filter(variant_id__in=variant_ids)
+        .order_by("pk")
+        .values_list("pk", "variant_id", "assignment__attribute_id")
+    ):
+        assignments = assignments_by_variant[variant_id]
+        if len(assignments) < settings.PRODUCT_MAX_INDEXED_ATTRIBUTES:
+            assignments.append((assignment_id, attribute_id))
+
+    assignment_ids = [
+        assignment_id
+        for assignments in assignments_by_variant.values()
+        for assignment_id, _ in assignments
+    ]
+    value_ids_by_assignment = defaultdict(list)
+    for assignment_id, value_id in (
+        AssignedVariantAttributeValue.objects.using(db_conn)
+        .filter(assignment_id__in=assignment_ids)
+        .order_by("value__sort_order", "value_id")
+        .values_list("assignment_id", "value_id")
+    ):
+        value_ids_by_assignment[assignment_id].append(value_id)
+
+    # Attributes and values are shared by many products, each is fetched once.
+    values = (
+        AttributeValue.objects.using(db_conn)
+        .only(*ATTRIBUTE_VALUE_SEARCH_FIELDS)
+        .in_bulk(
+            {
+                value_id
+                for value_ids in chain(
+                    value_ids_by_product.values(), value_ids_by_assignment.values()
+                )
+                for value_id in value_ids
+            }
+        )
+    )
+    attributes = (
+        Attribute.objects.using(db_conn)
+        .only("input_type", "unit")
+        .in_bulk(
+            {
+                *chain.from_iterable(attribute_ids_by_product_type.values()),
+                *(
+                    attribute_id
+                    for assignments in assignments_by_variant.values()
+                    for _, attribute_id in assignments
+                ),
+            }
         )
-        value_to_page_id = (
-            AttributeValue.objects.using(db_conn)
-            .filter(id__in=value_ids, reference_page_id__isnull=False)
-            .values_list("id", "reference_page_id")
+    )
+    page_id_to_title_map = dict(
+        Page.objects.using(db_conn)
+        .filter(
+            id__in=[
+                value.reference_page_id
+                for value in values.values()
+                if value.reference_page_id
+            ]
         )
-        page_id_to_title_map = dict(
-            Page.objects.using(db_conn)
-            .filter(id__in=[page_id for _, page_id in value_to_page_id])
-            .values_list("id", "title")
+        .values_list("id", "title")
+    )
+
+    def get_attribute_search_vectors(attribute_id, value_ids):
+        return get_search_vectors_for_attribute_values(
+            attributes[attribute_id],
+            [values[value_id] for value_id in value_ids][
+                : settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES
+            ],
+            page_id_to_title_map=page_id_to_title_map,
+            weight="B",
         )
 
-        products_batch = list(Product.objects.using(db_conn).filter(id__in=product_pks))
-        _prep_product_search_vector_index(products_batch, page_id_to_title_map)
+    products = []
+    for product_id, name, description_plaintext, product_type_id in products_data:
+        search_vectors = [
+            NoValidationSearchVector(Value(name), config="simple", weight="A"),
+            NoValidationSearchVector(
+                Value(description_plaintext), config="simple", weight="C"
+            ),
+        ]
+
+        value_ids_by_attribute = defaultdict(list)
+        for value_id in value_ids_by_product[product_id]:
+            value_ids_by_attribute[values[value_id].attribute_id].append(value_id)
+        attribute_ids = attribute_ids_by_product_type[product_type_id][
+            : settings.PRODUCT_MAX_INDEXED_ATTRIBUTES
+        ]
+        for attribute_id in attribute_ids:
+            search_vectors += get_attribute_search_vectors(
+                attribute_id, value_ids_by_attribute[attribute_id]
+            )
+
+        variants = variants_by_product[product_id]
+        variants_search_vectors = [
+            NoValidationSearchVector(
+                Value(sku), Value(variant_name), config="simple", weight="A"
+            )
+            if sku
+            else NoValidationSearchVector(
+                Value(variant_name), config="simple", weight="A"
+            )
+            for _, sku, variant_name in variants
+            if sku or variant_name
+        ]
+        if variants_search_vectors:
+            search_vectors += variants_search_vectors
+            for variant_id, *_ in variants:
+                for assignment_id, attribute_id in assignments_by_variant[variant_id]:
+                    search_vectors += get_attribute_search_vectors(
+                        attribute_id, value_ids_by_assignment[assignment_id]
+                    )
+
+        search_document_values = [name]
+        for _, sku, variant_name in variants:
+            search_document_values.extend(
+                value for value in [sku, variant_name] if value
+            )
+
+        products.append(
+            Product(
+                pk=product_id,
+                search_vector=FlatConcatSearchVector(*search_vectors),
+                search_document="\n".join(search_document_values).lower(),
+                search_index_dirty=False,
+            )
+        )
+    return products
 
 
 def prepare_product_search_vector_value(
@@ -97,6 +276,23 @@ def prepare_product_search_vector_value(
     return search_vectors
 
 
+def prepare_product_search_document_value(
+    product: "Product", *, already_prefetched=False
+) -> str:
+    """Prepare `search_document` product value used by the trigram search.
+
+    Only short, identifying values are included: product name and variant names
+    and SKUs.
+    """
+    if not already_prefetched:
+        prefetch_related_objects([product], "variants")
+
+    values = [product.name]
+    for variant in product.variants.all()[: settings.PRODUCT_MAX_INDEXED_VARIANTS]:
+        values.extend(value for value in [variant.sku, variant.name] if value)
+    return "\n".join(values).lower()
+
+
 def generate_variants_search_vector_value(
     product: "Product",
 ) -> list[NoValidationSearchVector]:
@@ -174,6 +370,8 @@ def generate_attributes_search_vector_value_with_assignment(
 
 
 def search_products(qs, value):
+    if value and settings.PRODUCT_SEARCH_MODE == PRODUCT_SEARCH_MODE_TRIGRAM:
+        return _search_products_by_trigram(qs, value)
     if value:
         query = SearchQuery(value, search_type="websearch", config="simple")
         lookup = Q(search_vector=query)
@@ -181,3 +379,18 @@ def search_products(qs, value):
             search_rank=SearchRank(F("search_vector"), query)
         )
     return qs
+
+
+def _search_products_by_trigram(qs, value):
+    # Both lookups use the `product_search_gin` trigram index. Word similarity
+    # matches prefixes and words with typos, `contains` matches any fragment,
+    # e.g. of the SKU. `search_document` is stored in lowercase, so `contains` is
+    # used with the lowercase value instead of `icontains`, which compares
+    # `UPPER()` of the column and can't use the index.
+    value = value.lower()
+    lookup = Q(search_document__trigram_word_similar=value) | Q(
+        search_document__contains=value
+    )
+    return qs.filter(lookup).annotate(
+        search_rank=TrigramWordSimilarity(value, "search_document")
+    )
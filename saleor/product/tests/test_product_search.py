@@ -1,5 +1,17 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from ...core.postgres import FlatConcatSearchVector
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import (
+    PRODUCT_SEARCH_MODE_TRIGRAM,
+    prepare_product_search_document_value,
+    prepare_product_search_vector_value,
+    search_products,
+    update_products_search_vector,
+)
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +27,132 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+        assert product.search_document
+
+
+@pytest.mark.parametrize(
+    "product_fixture",
+    [
+        "product",
+        "product_with_variant_with_two_attributes",
+        "product_with_multiple_values_attributes",
+        "product_with_rich_text_attribute",
+        "product_with_two_variants",
+    ],
+)
+def test_update_products_search_vector_matches_product_objects_value(
+    product_fixture, request
+):
+    # given
+    product = request.getfixturevalue(product_fixture)
+    if isinstance(product, list):
+        product = product[0]
+    product.search_vector = FlatConcatSearchVector(
+        *prepare_product_search_vector_value(product)
+    )
+    product.save(update_fields=["search_vector"])
+    product.refresh_from_db(fields=["search_vector"])
+    expected_search_vector = product.search_vector
+    Product.objects.filter(pk=product.pk).update(search_vector=None)
+
+    # when
+    updated_count = update_products_search_vector([product.pk])
+
+    # then
+    product.refresh_from_db(fields=["search_vector"])
+    assert updated_count == 1
+    assert product.search_vector == expected_search_vector
+
+
+def test_prepare_product_search_document_value(product):
+    # given
+    variant = product.variants.get()
+    variant.name = "Large"
+    variant.save(update_fields=["name"])
+
+    # when
+    search_document = prepare_product_search_document_value(product)
+
+    # then
+    assert search_document == f"{product.name}\n{variant.sku}\nlarge".lower()
+
+
+def test_search_products_trigram_mode_matches_misspelled_word(product_list, settings):
+    # given
+    settings.PRODUCT_SEARCH_MODE = PRODUCT_SEARCH_MODE_TRIGRAM
+    update_products_search_vector(Product.objects.all().values_list("id", flat=True))
+    product = product_list[0]
+    product.name = "Shiny Aluminium Kettle"
+    product.save(update_fields=["name"])
+    update_products_search_vector([product.pk])
+
+    # when
+    results = search_products(Product.objects.all(), "aluminum")
+
+    # then
+    assert list(results) == [product]
+    assert results[0].search_rank > 0
+
+
+def test_search_products_trigram_mode_matches_sku_fragment(product_list, settings):
+    # given
+    settings.PRODUCT_SEARCH_MODE = PRODUCT_SEARCH_MODE_TRIGRAM
+    product = product_list[1]
+    variant = product.variants.first()
+    variant.sku = "XYZ-10042-BLK"
+    variant.save(update_fields=["sku"])
+    update_products_search_vector(Product.objects.all().values_list("id", flat=True))
+
+    # when
+    results = search_products(Product.objects.all(), "10042")
+
+    # then
+    assert list(results) == [product]
+
+
+def test_search_products_trigram_mode_matches_prefix(product_list, settings):
+    # given
+    settings.PRODUCT_SEARCH_MODE = PRODUCT_SEARCH_MODE_TRIGRAM
+    product = product_list[0]
+    product.name = "Shiny Aluminium Kettle"
+    product.save(update_fields=["name"])
+    update_products_search_vector(Product.objects.all().values_list("id", flat=True))
+
+    # when
+    results = search_products(Product.objects.all(), "kett")
+
+    # then
+    assert list(results) == [product]
+
+
+def test_update_products_search_vector_command(product_list):
+    # given
+    Product.objects.update(search_vector=None, search_document="")
+    out = StringIO()
+
+    # when
+    call_command("update_products_search_vector", batch_size=2, stdout=out)
+
+    # then
+    for product in product_list:
+        product.refresh_from_db()
+        assert product.search_vector
+        assert product.search_document
+    assert f"Updated {len(product_list)} products." in out.getvalue()
+
+
+def test_update_products_search_vector_command_dirty_only(product_list):
+    # given
+    Product.objects.update(search_vector=None, search_index_dirty=False)
+    dirty_product = product_list[0]
+    dirty_product.search_index_dirty = True
+    dirty_product.save(update_fields=["search_index_dirty"])
+
+    # when
+    call_command("update_products_search_vector", dirty_only=True, stdout=StringIO())
+
+    # then
+    dirty_product.refresh_from_db()
+    assert dirty_product.search_vector
+    assert not dirty_product.search_index_dirty
+    assert Product.objects.filter(search_vector=None).count() == len(product_list) - 1
@@ -619,12 +619,34 @@ PLACEHOLDER_IMAGES = {
     4096: "images/placeholder4096.png",
 }
 
+# Thumbnails of product media, category and collection images created right after
+# the image is uploaded, for each size and format, e.g. "256,512" and "webp,original".
+THUMBNAIL_EAGER_SIZES = [
+    int(size) for size in get_list(os.environ.get("THUMBNAIL_EAGER_SIZES", ""))
+]
+THUMBNAIL_EAGER_FORMATS = get_list(
+    os.environ.get("THUMBNAIL_EAGER_FORMATS", "original")
+)
+THUMBNAIL_EAGER_WORKERS = int(os.environ.get("THUMBNAIL_EAGER_WORKERS", 4))
+# Time for which thumbnail URLs are cached by the thumbnail view. Keep it shorter than
+# the expiration of signed URLs when the media storage uses them.
+THUMBNAIL_URL_CACHE_TIMEOUT = parse(
+    os.environ.get("THUMBNAIL_URL_CACHE_TIMEOUT", "10 minutes")
+)
+
 
 AUTHENTICATION_BACKENDS = [
     "saleor.core.auth_backend.JSONWebTokenBackend",
     "saleor.core.auth_backend.PluginBackend",
 ]
 
+# Authenticate apps by the HMAC-SHA256 digest of their tokens, keyed with
+# `SECRET_KEY`, instead of checking password hashes of all tokens with the same last 4
+# characters. Tokens without a valid digest, e.g. created before enabling this or
+# before changing `SECRET_KEY`, are checked against the password hash once and then
+# get their digest stored.
+APP_TOKEN_DIGEST_ENABLED = get_bool_from_env("APP_TOKEN_DIGEST_ENABLED", False)
+
 # Expired checkouts settings - defines after what time checkouts will be deleted
 ANONYMOUS_CHECKOUTS_TIMEDELTA = datetime.timedelta(
     seconds=parse(os.environ.get("ANONYMOUS_CHECKOUTS_TIMEDELTA", "30 days"))
@@ -709,6 +731,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.core.tasks.delete_event_payloads_task",
         "schedule": datetime.timedelta(days=1),
     },
+    "create-event-partitions": {
+        "task": "saleor.core.tasks.create_event_partitions_task",
+        "schedule": datetime.timedelta(days=1),
+    },
     "deactivate-expired-gift-cards": {
         "task": "saleor.giftcard.tasks.deactivate_expired_cards_task",
         "schedule": crontab(hour=0, minute=0),
@@ -784,6 +810,18 @@ EVENT_PAYLOAD_DELETE_PERIOD = datetime.timedelta(
 EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT = datetime.timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT", "1 hour"))
 )
+
+# Expired checkouts, orders and event payloads are deleted in batches. The batch size
+# is adjusted to keep every delete close to the target duration. A task runs up to
+# the time limit and then re-enqueues itself, resuming from the saved progress.
+PURGE_TASK_TIME_LIMIT = parse(os.environ.get("PURGE_TASK_TIME_LIMIT", "1 minute"))
+PURGE_BATCH_TARGET_DURATION = parse(
+    os.environ.get("PURGE_BATCH_TARGET_DURATION", "0.5 seconds")
+)
+
+# Number of future daily partitions created for the event tables, once they are
+# partitioned with the `partition_event_tables` command.
+EVENT_PARTITIONS_PREMAKE_DAYS = int(os.environ.get("EVENT_PARTITIONS_PREMAKE_DAYS", 7))
 EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT = int(
     os.environ.get("EVENT_DELIVERY_ATTEMPT_RESPONSE_SIZE_LIMIT", 1024)
 )
@@ -817,6 +855,11 @@ OBSERVABILITY_REPORT_PERIOD = datetime.timedelta(
 OBSERVABILITY_BUFFER_TIMEOUT = datetime.timedelta(
     seconds=parse(os.environ.get("OBSERVABILITY_BUFFER_TIMEOUT", "5 minutes"))
 )
+# Codec used to store events in the observability buffer: "zlib" or "zlib-dict".
+# "zlib-dict" compresses events with a preset dictionary of common payload fragments,
+# which makes them notably smaller. Events stored with any of the codecs can be read,
+# so the codec can be changed once all workers are able to decode it.
+OBSERVABILITY_BUFFER_CODEC = os.environ.get("OBSERVABILITY_BUFFER_CODEC", "zlib")
 if OBSERVABILITY_ACTIVE:
     CELERY_BEAT_SCHEDULE["observability-reporter"] = {
         "task": "saleor.webhook.transport.asynchronous.transport.observability_reporter_task",
@@ -898,6 +941,52 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
 # Set FEDERATED_QUERY_MAX_ENTITIES=0 in env to disable (not recommended)
 FEDERATED_QUERY_MAX_ENTITIES = int(os.environ.get("FEDERATED_QUERY_MAX_ENTITIES", 100))
 
+# Number of parsed and validated GraphQL documents kept in memory by each process.
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get("GRAPHQL_DOCUMENT_CACHE_SIZE", 1000))
+
+# Automatic persisted queries: clients may send `extensions.persistedQuery.sha256Hash`
+# instead of the full query text. Queries sent together with their hash are
+# registered in the cache and can be executed by the hash in the following requests.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", False
+)
+# Path to a JSON file mapping SHA-256 hashes to query texts of known operations.
+GRAPHQL_PERSISTED_QUERIES_MANIFEST = os.environ.get(
+    "GRAPHQL_PERSISTED_QUERIES_MANIFEST", None
+)
+# When enabled, only operations listed in `GRAPHQL_PERSISTED_QUERIES_MANIFEST` can be
+# executed and registering new persisted queries is disabled.
+GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ALLOWLIST_ONLY", False
+)
+
+# Cache responses of public catalog queries (e.g. `products`, `collections`, `menus`)
+# sent by anonymous requestors. Cached responses are invalidated by catalog change
+# events and expire after `GRAPHQL_RESPONSE_CACHE_TIMEOUT`, which bounds staleness of
+# data that changes without an event, like stock quantities.
+GRAPHQL_RESPONSE_CACHE_ENABLED = get_bool_from_env(
+    "GRAPHQL_RESPONSE_CACHE_ENABLED", False
+)
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = parse(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", "60 seconds")
+)
+
+# How `totalCount` of connections is computed when the client doesn't pass `mode`:
+# "exact" runs `COUNT(*)`, "estimate" uses the row estimate of the query planner.
+GRAPHQL_TOTAL_COUNT_DEFAULT_MODE = os.environ.get(
+    "GRAPHQL_TOTAL_COUNT_DEFAULT_MODE", "exact"
+)
+# Planner estimates below this number are replaced with the exact count, as
+# counting small result sets is cheap and estimates of them are the least accurate.
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 10000)
+)
+# Max number of rows counted exactly; larger result sets return the planner
+# estimate instead. Set GRAPHQL_TOTAL_COUNT_EXACT_LIMIT=0 in env to disable.
+GRAPHQL_TOTAL_COUNT_EXACT_LIMIT = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_EXACT_LIMIT", 0)
+)
+
 BUILTIN_PLUGINS = [
     "saleor.plugins.avatax.plugin.DeprecatedAvataxPlugin",
     "saleor.plugins.webhook.plugin.WebhookPlugin",
@@ -927,6 +1016,16 @@ for entry_point in installed_plugins:
 
 PLUGINS: list[str] = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 
+# Cache plugin configurations of channels in memory of each process, so plugin
+# managers of requests don't query them. The cache is invalidated when plugin
+# configurations or channels change; entries also expire after
+# `PLUGIN_CONFIGS_CACHE_TIMEOUT`, which bounds staleness after changes made without
+# Django signals, like `QuerySet.update()`.
+PLUGIN_CONFIGS_CACHE_ENABLED = get_bool_from_env("PLUGIN_CONFIGS_CACHE_ENABLED", False)
+PLUGIN_CONFIGS_CACHE_TIMEOUT = parse(
+    os.environ.get("PLUGIN_CONFIGS_CACHE_TIMEOUT", "5 minutes")
+)
+
 # When `True`, HTTP requests made from arbitrary URLs will be rejected (e.g., webhooks).
 # if they try to access private IP address ranges, and loopback ranges (unless
 # `HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS=False`).
@@ -943,6 +1042,26 @@ HTTP_IP_FILTER_ALLOW_LOOPBACK_IPS: bool = get_bool_from_env(
 # time of the reservation in seconds.
 RESERVE_DURATION = 45
 
+# IDs of product variants with high demand, e.g. during flash sales. Their stocks are
+# allocated with conditional updates based on the denormalized
+# `Stock.quantity_allocated`, which skips summing the existing allocations. Stocks
+# are still locked until the order is committed, so concurrent orders of the same
+# stock wait for each other as before. If `quantity_allocated` drifts below the sum
+# of the allocations, the stock can be oversold. Allocations that cannot be made
+# with a single conditional update fall back to the regular path.
+STOCK_ALLOCATION_HOT_VARIANTS = [
+    int(pk) for pk in get_list(os.environ.get("STOCK_ALLOCATION_HOT_VARIANTS", ""))
+]
+
+# Cache the available quantities of variants displayed by the `quantityAvailable`
+# field. Cached quantities are outdated by stock allocations and reservations, and
+# reconciled with the database when they expire. Stock checks done by mutations
+# always use the database.
+AVAILABILITY_CACHE_ENABLED = get_bool_from_env("AVAILABILITY_CACHE_ENABLED", False)
+AVAILABILITY_CACHE_TIMEOUT = parse(
+    os.environ.get("AVAILABILITY_CACHE_TIMEOUT", "1 minute")
+)
+
 
 # Some cloud providers (Heroku) export REDIS_URL variable instead of CACHE_URL
 REDIS_URL = os.environ.get("REDIS_URL")
@@ -970,9 +1089,29 @@ JWT_TTL_REQUEST_EMAIL_CHANGE = datetime.timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
 )
 
+# Cache users authenticated by JWT together with their effective permissions, so
+# requests of the same user don't query them. Entries are invalidated when the user,
+# its permissions or permission groups change; they also expire after
+# `JWT_USER_CACHE_TIMEOUT`, which bounds staleness after changes made without
+# Django signals, like `QuerySet.update()`.
+JWT_USER_CACHE_ENABLED = get_bool_from_env("JWT_USER_CACHE_ENABLED", False)
+JWT_USER_CACHE_TIMEOUT = parse(os.environ.get("JWT_USER_CACHE_TIMEOUT", "60 seconds"))
+
 CHECKOUT_PRICES_TTL = datetime.timedelta(
     seconds=parse(os.environ.get("CHECKOUT_PRICES_TTL", "1 hour"))
 )
+
+# Cache the catalogue data of checkout lines, like variants, products, channel
+# listings and discounts, used by checkout queries. Snapshots are used only while the
+# checkout prices are valid and are outdated by any change of the checkout, its lines,
+# or the catalogue.
+CHECKOUT_SNAPSHOT_CACHE_ENABLED = get_bool_from_env(
+    "CHECKOUT_SNAPSHOT_CACHE_ENABLED", False
+)
+CHECKOUT_SNAPSHOT_CACHE_TIMEOUT = parse(
+    os.environ.get("CHECKOUT_SNAPSHOT_CACHE_TIMEOUT", "5 minutes")
+)
+
 CHECKOUT_DELIVERY_OPTIONS_TTL = datetime.timedelta(
     seconds=parse(os.environ.get("CHECKOUT_DELIVERY_OPTIONS_TTL", "24 hours"))
 )
@@ -1009,6 +1148,10 @@ PRODUCT_MAX_INDEXED_ATTRIBUTES = 1000
 PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES = 100
 PRODUCT_MAX_INDEXED_VARIANTS = 1000
 
+# Product search mode: "tsvector" for full text search or "trigram" for similarity
+# search with prefix matching and typo tolerance.
+PRODUCT_SEARCH_MODE = os.environ.get("PRODUCT_SEARCH_MODE", "tsvector")
+
 # Maximum related objects that can be indexed in a page
 PAGE_MAX_INDEXED_ATTRIBUTES = 1000
 PAGE_MAX_INDEXED_ATTRIBUTE_VALUES = 100
@@ -1092,6 +1235,49 @@ WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT = 18
 WEBHOOK_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 WEBHOOK_SYNC_TIMEOUT = (REQUESTS_CONN_EST_TIMEOUT, WEBHOOK_WAITING_FOR_RESPONSE_TIMEOUT)
 
+# When enabled, webhooks sent over HTTP reuse connections to the same host. Each
+# worker process (or thread) keeps pooled sessions for up to
+# `WEBHOOK_HTTP_POOL_MAX_HOSTS` hosts with up to `WEBHOOK_HTTP_POOL_MAXSIZE`
+# connections each. Sessions unused for longer than `WEBHOOK_HTTP_KEEP_ALIVE_TIMEOUT`
+# are replaced with new ones.
+WEBHOOK_HTTP_POOL_ENABLED = get_bool_from_env("WEBHOOK_HTTP_POOL_ENABLED", False)
+WEBHOOK_HTTP_POOL_MAX_HOSTS = int(os.environ.get("WEBHOOK_HTTP_POOL_MAX_HOSTS", 50))
+WEBHOOK_HTTP_POOL_MAXSIZE = int(os.environ.get("WEBHOOK_HTTP_POOL_MAXSIZE", 10))
+WEBHOOK_HTTP_KEEP_ALIVE_TIMEOUT = parse(
+    os.environ.get("WEBHOOK_HTTP_KEEP_ALIVE_TIMEOUT", "60 seconds")
+)
+
+# Max number of async webhook deliveries of a single app sent at the same time by
+# a worker. By default, they are sent one by one.
+WEBHOOK_ASYNC_DISPATCH_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_ASYNC_DISPATCH_CONCURRENCY", 1)
+)
+
+# Cache webhooks active for events in memory of each process. The cache is
+# invalidated when webhooks, apps or app permissions change; entries also expire after
+# `WEBHOOK_EVENT_MAP_CACHE_TIMEOUT`, which bounds staleness after changes made
+# without Django signals, like `QuerySet.update()`.
+WEBHOOK_EVENT_MAP_CACHE_ENABLED = get_bool_from_env(
+    "WEBHOOK_EVENT_MAP_CACHE_ENABLED", False
+)
+WEBHOOK_EVENT_MAP_CACHE_TIMEOUT = parse(
+    os.environ.get("WEBHOOK_EVENT_MAP_CACHE_TIMEOUT", "60 seconds")
+)
+
+# Send synchronous webhooks of a single event, like shipping methods, stored payment
+# methods and taxes, to all apps concurrently instead of one by one. Requests that
+# do not finish within `WEBHOOK_SYNC_PARALLEL_DEADLINE` are treated as failed.
+WEBHOOK_SYNC_PARALLEL_ENABLED = get_bool_from_env(
+    "WEBHOOK_SYNC_PARALLEL_ENABLED", False
+)
+WEBHOOK_SYNC_PARALLEL_DEADLINE = parse(
+    os.environ.get("WEBHOOK_SYNC_PARALLEL_DEADLINE", "20 seconds")
+)
+# Max number of threads of a process sending synchronous webhooks concurrently.
+WEBHOOK_SYNC_PARALLEL_MAX_THREADS = int(
+    os.environ.get("WEBHOOK_SYNC_PARALLEL_MAX_THREADS", 20)
+)
+
 # The max number of rules with order_predicate defined
 ORDER_RULES_LIMIT = os.environ.get("ORDER_RULES_LIMIT", 100)
 
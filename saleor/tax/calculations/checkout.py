@@ -2,7 +2,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from prices import TaxedMoney
+from prices import Money, TaxedMoney
 
 from ...checkout import base_calculations
 from ...core.prices import quantize_price
@@ -38,6 +38,11 @@ def update_checkout_prices_with_flat_rates(
         default_country_rate_obj.rate if default_country_rate_obj else Decimal(0)
     )
     currency = checkout.currency
+    lines_total_prices = (
+        base_calculations.get_lines_total_prices_with_propagated_checkout_discount(
+            checkout_info, lines
+        )
+    )
 
     # Calculate checkout line totals.
     for line_info in lines:
@@ -56,6 +61,7 @@ def update_checkout_prices_with_flat_rates(
             line_info,
             tax_rate,
             prices_entered_with_tax,
+            total_price=lines_total_prices[line.pk],
         )
         line.total_price = line_total_price
         line.tax_rate = normalize_tax_rate_for_db(tax_rate)
@@ -103,14 +109,21 @@ def _calculate_checkout_line_total(
     checkout_line_info: "CheckoutLineInfo",
     tax_rate: Decimal,
     prices_entered_with_tax: bool,
+    total_price: Money | None = None,
 ) -> TaxedMoney:
-    total_price = (
-        base_calculations.get_line_total_price_with_propagated_checkout_discount(
-            checkout_info,
-            lines,
-            checkout_line_info,
+    """Calculate the checkout line total with the flat rate tax.
+
+    `total_price` is the line price with the propagated checkout discount. It is
+    calculated when not given.
+    """
+    if total_price is None:
+        total_price = (
+            base_calculations.get_line_total_price_with_propagated_checkout_discount(
+                checkout_info,
+                lines,
+                checkout_line_info,
+            )
         )
-    )
     total_price = calculate_flat_rate_tax(
         total_price, tax_rate, prices_entered_with_tax
     )
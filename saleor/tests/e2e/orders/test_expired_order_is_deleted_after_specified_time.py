@@ -4,7 +4,12 @@ import pytest
 from django.utils import timezone
 from freezegun import freeze_time
 
-from ....order.tasks import delete_expired_orders_task, expire_orders_task
+from ....core.purge import reset_purge_progress
+from ....order.tasks import (
+    ExpiredOrdersPurger,
+    delete_expired_orders_task,
+    expire_orders_task,
+)
 from ..checkout.utils import checkout_create, checkout_delivery_method_update
 from ..product.utils.preparing_product import prepare_product
 from ..shop.utils.preparing_shop import prepare_shop
@@ -12,6 +17,12 @@ from ..utils import assign_permissions
 from .utils import order_create_from_checkout, order_query
 
 
+@pytest.fixture(autouse=True)
+def reset_expired_orders_purge_progress():
+    yield
+    reset_purge_progress(ExpiredOrdersPurger.name)
+
+
 @pytest.mark.e2e
 def test_expired_order_is_deleted_after_specified_time_CORE_0216(
     e2e_staff_api_client,
@@ -1634,8 +1634,9 @@ def setup_mock_for_cache():
     - `dummy_cache` is a dict the mock is write to, instead of real cache db
     - `cache_mock` is a patch applied on real cache db
 
-    It supports following functions: `get`, `set`, `delete`, `incr` and `add`. If other
-    function is utilised in a tested codebase, this fixture should be extended.
+    It supports following functions: `get`, `set`, `delete`, `incr`, `add`, `get_many`,
+    `set_many` and `delete_many`. If other function is utilised in a tested codebase,
+    this fixture should be extended.
 
     Stores `key`, `value` and `ttl` in following format:
     {key: {"value": value, "ttl": ttl}}
@@ -1669,6 +1670,19 @@ def setup_mock_for_cache():
                 return new_value
             return None
 
+        def cache_get_many(keys):
+            return {
+                key: data["value"] for key in keys if (data := dummy_cache.get(key))
+            }
+
+        def cache_set_many(data, timeout):
+            for key, value in data.items():
+                cache_set(key, value, timeout)
+
+        def cache_delete_many(keys):
+            for key in keys:
+                cache_delete(key)
+
         mocked_get_cache = MagicMock()
         mocked_set_cache = MagicMock()
         mocked_add_cache = MagicMock()
@@ -1686,6 +1700,9 @@ def setup_mock_for_cache():
         cache_mock.add = mocked_add_cache
         cache_mock.incr = mocked_incr_cache
         cache_mock.delete = mocked_delete_cache
+        cache_mock.get_many = MagicMock(side_effect=cache_get_many)
+        cache_mock.set_many = MagicMock(side_effect=cache_set_many)
+        cache_mock.delete_many = MagicMock(side_effect=cache_delete_many)
 
     return _mocked_cache
 
@@ -1,6 +1,14 @@
+from django.core.cache import cache
+
 from ..core.tasks import delete_from_storage_task
+from .utils import get_thumbnail_url_cache_key_for_thumbnail
 
 
 def delete_thumbnail_image(sender, instance, **kwargs):
     if image := instance.image:
         delete_from_storage_task.delay(image.name)
+
+
+def delete_thumbnail_url_cache(sender, instance, **kwargs):
+    if cache_key := get_thumbnail_url_cache_key_for_thumbnail(instance):
+        cache.delete(cache_key)
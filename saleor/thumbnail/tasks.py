@@ -0,0 +1,126 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import product
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from ..celeryconf import app
+from ..core.db.connection import allow_writer
+from ..core.utils.events import call_event
+from ..plugins.manager import get_plugins_manager
+from . import ALLOWED_THUMBNAIL_FORMATS
+from .models import Thumbnail
+from .utils import (
+    ProcessedImage,
+    get_thumbnail_format,
+    get_thumbnail_size,
+    get_thumbnail_url_cache_key,
+    prepare_thumbnail_file_name,
+)
+from .views import TYPE_TO_MODEL_DATA_MAPPING
+
+logger = logging.getLogger(__name__)
+
+
+def get_eager_thumbnail_variants() -> list[tuple[int, str | None]]:
+    """Return sizes and formats of thumbnails created on image upload."""
+    sizes = {get_thumbnail_size(size) for size in settings.THUMBNAIL_EAGER_SIZES}
+    formats = {
+        get_thumbnail_format(format) for format in settings.THUMBNAIL_EAGER_FORMATS
+    }
+    formats = {
+        format
+        for format in formats
+        if not format or format in ALLOWED_THUMBNAIL_FORMATS
+    }
+    return sorted(product(sizes, formats), key=lambda v: (v[0], v[1] or ""))
+
+
+def schedule_thumbnails_creation(object_type: str, instance_pk: int):
+    """Create thumbnails of the uploaded image once the transaction is committed."""
+    if not settings.THUMBNAIL_EAGER_SIZES:
+        return
+    transaction.on_commit(
+        lambda: create_thumbnails_task.delay(object_type, instance_pk)
+    )
+
+
+def _render_thumbnail(image_data: bytes, size: int, format: str | None):
+    thumbnail_file, _ = ProcessedImage(
+        BytesIO(image_data), size, format
+    ).create_thumbnail()
+    return thumbnail_file
+
+
+@app.task
+@allow_writer()
+def create_thumbnails_task(object_type: str, instance_pk: int):
+    """Create thumbnails of the instance image in all eager sizes and formats.
+
+    The source image is downloaded once and thumbnails are rendered by a thread
+    pool, as image processing releases the GIL. Thumbnails that already exist are
+    skipped, so the task is safe to retry.
+    """
+    model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
+    instance = model_data.model.objects.filter(pk=instance_pk).first()
+    if instance is None:
+        logger.info("%s with id %s does not exist.", object_type, instance_pk)
+        return
+    image = getattr(instance, model_data.image_field)
+    if not image:
+        return
+
+    existing_variants = set(
+        Thumbnail.objects.filter(**{model_data.thumbnail_field: instance}).values_list(
+            "size", "format"
+        )
+    )
+    variants = [
+        variant
+        for variant in get_eager_thumbnail_variants()
+        if variant not in existing_variants
+    ]
+    if not variants:
+        return
+
+    try:
+        with default_storage.open(image.name, "rb") as image_file:
+            image_data = image_file.read()
+    except FileNotFoundError as error:
+        logger.info(str(error))
+        return
+
+    with ThreadPoolExecutor(max_workers=settings.THUMBNAIL_EAGER_WORKERS) as executor:
+        futures = {
+            (size, format): executor.submit(_render_thumbnail, image_data, size, format)
+            for size, format in variants
+        }
+
+    manager = get_plugins_manager(allow_replica=False)
+    for (size, format), future in futures.items():
+        try:
+            thumbnail_file = future.result()
+        except ValueError as error:
+            logger.info(str(error))
+            continue
+
+        thumbnail = Thumbnail(
+            size=size, format=format, **{model_data.thumbnail_field: instance}
+        )
+        thumbnail.image.save(
+            prepare_thumbnail_file_name(image.name, size, format), thumbnail_file
+        )
+        cache.set(
+            get_thumbnail_url_cache_key(object_type, instance_pk, size, format),
+            thumbnail.image.url,
+            timeout=settings.THUMBNAIL_URL_CACHE_TIMEOUT,
+        )
+
+        # set additional `instance` attribute, to easily get instance data
+        # for ThumbnailCreated subscription type
+        setattr(thumbnail, "instance", instance)
+        call_event(manager.thumbnail_created, thumbnail)
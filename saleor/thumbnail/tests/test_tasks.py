@@ -0,0 +1,107 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from .. import ThumbnailFormat
+from ..models import Thumbnail
+from ..tasks import (
+    create_thumbnails_task,
+    get_eager_thumbnail_variants,
+    schedule_thumbnails_creation,
+)
+from ..utils import get_thumbnail_url_cache_key
+
+
+def test_get_eager_thumbnail_variants(settings):
+    # given
+    settings.THUMBNAIL_EAGER_SIZES = [60, 256]
+    settings.THUMBNAIL_EAGER_FORMATS = ["original", "webp", "png"]
+
+    # when
+    variants = get_eager_thumbnail_variants()
+
+    # then
+    assert variants == [
+        (64, None),
+        (64, ThumbnailFormat.WEBP),
+        (256, None),
+        (256, ThumbnailFormat.WEBP),
+    ]
+
+
+@patch("saleor.plugins.manager.PluginsManager.thumbnail_created")
+def test_create_thumbnails_task(
+    thumbnail_created_mock,
+    category_with_image,
+    image,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_EAGER_SIZES = [64, 128]
+    settings.THUMBNAIL_EAGER_FORMATS = ["original", "webp"]
+    Thumbnail.objects.create(category=category_with_image, size=64, image=image)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        create_thumbnails_task("Category", category_with_image.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(category=category_with_image)
+    assert set(thumbnails.values_list("size", "format")) == {
+        (64, None),
+        (64, ThumbnailFormat.WEBP),
+        (128, None),
+        (128, ThumbnailFormat.WEBP),
+    }
+    assert thumbnail_created_mock.call_count == 3
+    thumbnail = thumbnails.get(size=128, format=ThumbnailFormat.WEBP)
+    assert (
+        cache.get(
+            get_thumbnail_url_cache_key(
+                "Category", category_with_image.pk, 128, ThumbnailFormat.WEBP
+            )
+        )
+        == thumbnail.image.url
+    )
+
+
+def test_create_thumbnails_task_no_image(category, settings):
+    # given
+    settings.THUMBNAIL_EAGER_SIZES = [64]
+
+    # when
+    create_thumbnails_task("Category", category.pk)
+
+    # then
+    assert not Thumbnail.objects.filter(category=category).exists()
+
+
+@patch("saleor.thumbnail.tasks.create_thumbnails_task.delay")
+def test_schedule_thumbnails_creation(
+    create_thumbnails_task_mock, category, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.THUMBNAIL_EAGER_SIZES = [64]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_thumbnails_creation("Category", category.pk)
+
+    # then
+    create_thumbnails_task_mock.assert_called_once_with("Category", category.pk)
+
+
+@patch("saleor.thumbnail.tasks.create_thumbnails_task.delay")
+def test_schedule_thumbnails_creation_disabled(
+    create_thumbnails_task_mock, category, settings, django_capture_on_commit_callbacks
+):
+    # given
+    settings.THUMBNAIL_EAGER_SIZES = []
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule_thumbnails_creation("Category", category.pk)
+
+    # then
+    create_thumbnails_task_mock.assert_not_called()
@@ -1,10 +1,12 @@
 from unittest.mock import patch
 
 import graphene
+from django.core.cache import cache
 from PIL import Image
 
 from .. import IconThumbnailFormat, ThumbnailFormat
 from ..models import Thumbnail
+from ..utils import get_thumbnail_url_cache_key
 
 
 def test_handle_thumbnail_view_with_format(client, category_with_image, settings):
@@ -413,3 +415,66 @@ def test_handle_thumbnail_view_for_app_installation_logo_default_thumbnail_exist
     assert response.status_code == 302
     assert response.url == thumbnail.image.url
     assert Thumbnail.objects.count() == thumbnail_count
+
+
+def test_handle_thumbnail_view_returns_cached_url(
+    client, category, django_assert_num_queries
+):
+    # given
+    size = 64
+    url = "https://example.com/thumbnails/category_thumbnail_64.png"
+    cache.set(get_thumbnail_url_cache_key("Category", category.id, size, None), url)
+    category_id = graphene.Node.to_global_id("Category", category.id)
+
+    # when
+    with django_assert_num_queries(0):
+        response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == url
+
+
+def test_handle_thumbnail_view_caches_thumbnail_url(
+    client, category, image, media_root
+):
+    # given
+    size = 64
+    format = ThumbnailFormat.WEBP
+    thumbnail = Thumbnail.objects.create(
+        category=category, size=size, format=format, image=image
+    )
+    category_id = graphene.Node.to_global_id("Category", category.id)
+    cache_key = get_thumbnail_url_cache_key("Category", category.id, size, format)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/{format}/")
+
+    # then
+    assert response.status_code == 302
+    assert cache.get(cache_key) == thumbnail.image.url
+
+    # when
+    thumbnail.delete()
+
+    # then
+    assert cache.get(cache_key) is None
+
+
+def test_handle_thumbnail_view_does_not_cache_user_thumbnail_url(
+    client, staff_user, image, media_root
+):
+    # given
+    size = 64
+    Thumbnail.objects.create(user=staff_user, size=size, image=image)
+    user_id = graphene.Node.to_global_id("User", staff_user.uuid)
+
+    # when
+    response = client.get(f"/thumbnail/{user_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert (
+        cache.get(get_thumbnail_url_cache_key("User", staff_user.uuid, size, None))
+        is None
+    )
@@ -23,6 +23,16 @@ from . import (
 if TYPE_CHECKING:
     from .models import Thumbnail
 
+THUMBNAIL_URL_CACHE_KEY_PREFIX = "thumbnail-url"
+
+# Object types, identified by integer ids, with the thumbnail URLs stored in the cache,
+# mapped to the thumbnail field of the instance.
+URL_CACHED_THUMBNAIL_TYPES = {
+    "Category": "category",
+    "Collection": "collection",
+    "ProductMedia": "product_media",
+}
+
 
 def get_image_or_proxy_url(
     thumbnail: Optional["Thumbnail"],
@@ -80,6 +90,25 @@ def get_icon_thumbnail_format(format: str | None) -> str | None:
     return format
 
 
+def get_thumbnail_url_cache_key(
+    object_type: str, instance_pk, size: int, format: str | None
+) -> str:
+    format = format or ThumbnailFormat.ORIGINAL
+    return (
+        f"{THUMBNAIL_URL_CACHE_KEY_PREFIX}-{object_type}-{instance_pk}-{size}-{format}"
+    )
+
+
+def get_thumbnail_url_cache_key_for_thumbnail(thumbnail: "Thumbnail") -> str | None:
+    """Return the URL cache key of the thumbnail, if URLs of its type are cached."""
+    for object_type, thumbnail_field in URL_CACHED_THUMBNAIL_TYPES.items():
+        if instance_pk := getattr(thumbnail, f"{thumbnail_field}_id"):
+            return get_thumbnail_url_cache_key(
+                object_type, instance_pk, thumbnail.size, thumbnail.format
+            )
+    return None
+
+
 def prepare_thumbnail_file_name(file_name: str, size: int, format: str | None) -> str:
     file_path, file_ext = file_name.rsplit(".", 1)
     file_ext = format or file_ext
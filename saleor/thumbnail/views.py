@@ -2,6 +2,7 @@ import logging
 from typing import NamedTuple
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import (
     HttpResponseBadRequest,
@@ -20,9 +21,11 @@ from ..product.models import Category, Collection, ProductMedia
 from ..thumbnail.models import Thumbnail
 from . import ALLOWED_ICON_THUMBNAIL_FORMATS, ALLOWED_THUMBNAIL_FORMATS
 from .utils import (
+    URL_CACHED_THUMBNAIL_TYPES,
     ProcessedIconImage,
     ProcessedImage,
     get_thumbnail_size,
+    get_thumbnail_url_cache_key,
     prepare_thumbnail_file_name,
 )
 
@@ -79,6 +82,13 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
     except ValueError:
         return HttpResponseNotFound("Invalid size.")
 
+    # return the cached thumbnail URL, without reaching the database
+    cache_key = None
+    if object_type in URL_CACHED_THUMBNAIL_TYPES:
+        cache_key = get_thumbnail_url_cache_key(object_type, pk, size_px, format)
+        if url := cache.get(cache_key):
+            return HttpResponseRedirect(url)
+
     # return the thumbnail if it's already exist
     model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
     if object_type in UUID_IDENTIFIABLE_TYPES:
@@ -91,7 +101,7 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
         .filter(format=format, size=size_px, **{instance_id_lookup: pk})
         .first()
     ):
-        return HttpResponseRedirect(thumbnail.image.url)
+        return _thumbnail_redirect(thumbnail, cache_key)
 
     try:
         if object_type in UUID_IDENTIFIABLE_TYPES:
@@ -141,4 +151,11 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
         manager = get_plugins_manager(allow_replica=False)
         call_event(manager.thumbnail_created, thumbnail)
 
-    return HttpResponseRedirect(thumbnail.image.url)
+    return _thumbnail_redirect(thumbnail, cache_key)
+
+
+def _thumbnail_redirect(thumbnail: Thumbnail, cache_key: str | None):
+    url = thumbnail.image.url
+    if cache_key:
+        cache.set(cache_key, url, timeout=settings.THUMBNAIL_URL_CACHE_TIMEOUT)
+    return HttpResponseRedirect(url)
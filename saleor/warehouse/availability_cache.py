@@ -0,0 +1,103 @@
+import uuid
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+AVAILABILITY_CACHE_VERSION_KEY_PREFIX = "variant-availability-version"
+
+
+def _get_version_key(variant_id: int) -> str:
+    return f"{AVAILABILITY_CACHE_VERSION_KEY_PREFIX}-{variant_id}"
+
+
+def _get_variants_versions(variant_ids: Iterable[int]) -> dict[int, str]:
+    """Return the current availability versions of the given variants.
+
+    Versions are random tokens, so an evicted version key never brings back
+    quantities cached before it was evicted.
+    """
+    version_keys = {
+        variant_id: _get_version_key(variant_id) for variant_id in variant_ids
+    }
+    versions = cache.get_many(version_keys.values())
+    missing_keys = [key for key in version_keys.values() if key not in versions]
+    if missing_keys:
+        for key in missing_keys:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+        versions.update(cache.get_many(missing_keys))
+    return {
+        variant_id: versions[key]
+        for variant_id, key in version_keys.items()
+        if key in versions
+    }
+
+
+def _get_quantity_key(
+    variant_id: int,
+    version: str,
+    country_code: str | None,
+    channel_slug: str | None,
+    reservations_enabled: bool,
+) -> str:
+    return (
+        f"variant-availability-{variant_id}-{version}-{country_code}-"
+        f"{channel_slug}-{int(reservations_enabled)}"
+    )
+
+
+def get_cached_available_quantities(
+    variant_ids: Iterable[int],
+    country_code: str | None,
+    channel_slug: str | None,
+    reservations_enabled: bool,
+) -> tuple[dict[int, int], dict[int, str]]:
+    """Return cached available quantities of variants.
+
+    Return the quantities found in the cache and the cache keys under which
+    the missing quantities should be stored.
+    """
+    versions = _get_variants_versions(variant_ids)
+    keys = {
+        variant_id: _get_quantity_key(
+            variant_id, version, country_code, channel_slug, reservations_enabled
+        )
+        for variant_id, version in versions.items()
+    }
+    cached = cache.get_many(keys.values())
+    quantities = {}
+    missing_keys = {}
+    for variant_id, key in keys.items():
+        if key in cached:
+            quantities[variant_id] = cached[key]
+        else:
+            missing_keys[variant_id] = key
+    return quantities, missing_keys
+
+
+def set_cached_available_quantities(
+    cache_keys: dict[int, str], quantities: dict[int, int]
+):
+    cache.set_many(
+        {key: quantities.get(variant_id, 0) for variant_id, key in cache_keys.items()},
+        timeout=settings.AVAILABILITY_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_variants_availability(variant_ids: Iterable[int]):
+    """Outdate cached available quantities of variants once the transaction commits.
+
+    Quantities calculated before the commit would be cached again under
+    the new version if it were changed earlier.
+    """
+    if not settings.AVAILABILITY_CACHE_ENABLED:
+        return
+    version_keys = {_get_version_key(variant_id) for variant_id in variant_ids}
+    if not version_keys:
+        return
+    transaction.on_commit(
+        lambda: cache.set_many(
+            {key: uuid.uuid4().hex for key in version_keys}, timeout=None
+        )
+    )
@@ -4,6 +4,7 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
 from uuid import UUID
 
+from django.conf import settings
 from django.db import transaction
 from django.db.models import F, Sum
 from django.db.models.expressions import Exists, OuterRef
@@ -23,6 +24,7 @@ from ..order.fetch import OrderLineInfo
 from ..order.models import OrderLine
 from ..plugins.manager import PluginsManager
 from ..product.models import ProductVariant, ProductVariantChannelListing
+from .availability_cache import invalidate_variants_availability
 from .lock_objects import (
     allocation_with_stock_qs_select_for_update,
     stock_qs_select_for_update,
@@ -65,6 +67,7 @@ def stock_bulk_update(stocks: list[Stock], fields_to_update: list[str]):
             .values_list("id", flat=True)
         )
         Stock.objects.bulk_update(stocks, fields_to_update)
+        invalidate_variants_availability(stock.product_variant_id for stock in stocks)
 
 
 def delete_allocations(allocation_pks_to_delete: list[int]):
@@ -103,14 +106,11 @@ def allocate_stocks(
     if not order_lines_info:
         return
 
+    invalidate_variants_availability(
+        line_info.variant.pk for line_info in order_lines_info if line_info.variant
+    )
     channel_slug = channel.slug
 
-    variants = [line_info.variant for line_info in order_lines_info]
-    filter_lookup = {"product_variant__in": variants}
-
-    if additional_filter_lookup is not None:
-        filter_lookup.update(additional_filter_lookup)
-
     # in case of click and collect order, we need to check local or global stock
     # regardless of the country code
     stocks = (
@@ -118,6 +118,24 @@ def allocate_stocks(
         if collection_point_pk
         else Stock.objects.for_channel_and_country(channel_slug, country_code)
     )
+    if additional_filter_lookup is not None:
+        stocks = stocks.filter(**additional_filter_lookup)
+
+    if settings.STOCK_ALLOCATION_HOT_VARIANTS:
+        order_lines_info = _allocate_hot_variants_stocks(
+            order_lines_info,
+            stocks,
+            channel,
+            manager,
+            collection_point_pk,
+            check_reservations,
+            checkout_lines,
+        )
+        if not order_lines_info:
+            return
+
+    variants = [line_info.variant for line_info in order_lines_info]
+    filter_lookup = {"product_variant__in": variants}
 
     stocks = list(
         stock_select_for_update_for_existing_qs(stocks)
@@ -202,6 +220,105 @@ def allocate_stocks(
                 )
 
 
+def _allocate_hot_variants_stocks(
+    order_lines_info: list["OrderLineInfo"],
+    stocks_qs,
+    channel: "Channel",
+    manager: PluginsManager,
+    collection_point_pk: UUID | None,
+    check_reservations: bool,
+    checkout_lines: Iterable["CheckoutLine"] | None,
+) -> list["OrderLineInfo"]:
+    """Allocate stocks of hot variants without summing their allocations.
+
+    The stock is allocated with a single conditional update, which succeeds only
+    when the stock has enough quantity available. Each line is allocated from a
+    single stock; lines that cannot be allocated that way are returned, to be
+    allocated with the regular path.
+
+    Stocks of all order lines, hot or not, are locked upfront with a single
+    statement ordered by pk, the same order used by the regular path and by
+    `reserve_stocks`, so the updates below cannot deadlock with them. The locks
+    are held until the transaction of `allocate_stocks` is committed, so
+    concurrent orders of the same stock still wait for each other; they only skip
+    the sum of the existing allocations. The available quantity is based on the
+    denormalized `Stock.quantity_allocated` instead of the `Allocation` rows, so if
+    that counter drifts below the sum of the allocations, the stock can be oversold.
+    """
+    hot_variants = set(settings.STOCK_ALLOCATION_HOT_VARIANTS)
+    hot_lines_info: list[tuple[int, OrderLineInfo]] = []
+    lines_info_to_allocate = []
+    for line_info in order_lines_info:
+        variant_pk = line_info.variant.pk if line_info.variant else None
+        if variant_pk in hot_variants:
+            hot_lines_info.append((cast(int, variant_pk), line_info))
+        else:
+            lines_info_to_allocate.append(line_info)
+    if not hot_lines_info:
+        return order_lines_info
+
+    locked_stocks = list(
+        stock_select_for_update_for_existing_qs(stocks_qs)
+        .filter(
+            product_variant__in=[line_info.variant for line_info in order_lines_info]
+        )
+        .values(
+            "pk", "product_variant", "quantity", "quantity_allocated", "warehouse_id"
+        )
+    )
+    stocks = [
+        stock for stock in locked_stocks if stock["product_variant"] in hot_variants
+    ]
+    quantity_reservation_for_stocks = _prepare_stock_to_reserved_quantity_map(
+        checkout_lines, check_reservations, [stock["pk"] for stock in stocks]
+    )
+    quantity_allocation_for_stocks = {
+        stock["pk"]: stock.pop("quantity_allocated") for stock in stocks
+    }
+    stocks = sort_stocks(
+        channel.allocation_strategy,
+        stocks,
+        channel,
+        quantity_allocation_for_stocks,
+        collection_point_pk,
+    )
+    variant_to_stocks: dict[int, list[int]] = defaultdict(list)
+    for stock_data in stocks:
+        variant_to_stocks[stock_data["product_variant"]].append(stock_data["pk"])
+
+    allocations = []
+    for variant_pk, line_info in sorted(hot_lines_info, key=lambda item: item[0]):
+        quantity = line_info.quantity
+        for stock_pk in variant_to_stocks[variant_pk]:
+            reserved_quantity = quantity_reservation_for_stocks[stock_pk]
+            updated = Stock.objects.filter(
+                pk=stock_pk,
+                quantity__gte=F("quantity_allocated") + reserved_quantity + quantity,
+            ).update(quantity_allocated=F("quantity_allocated") + quantity)
+            if updated:
+                allocations.append(
+                    Allocation(
+                        order_line=line_info.line,
+                        stock_id=stock_pk,
+                        quantity_allocated=quantity,
+                    )
+                )
+                break
+        else:
+            lines_info_to_allocate.append(line_info)
+
+    if allocations:
+        Allocation.objects.bulk_create(allocations)
+        for stock in Stock.objects.filter(
+            pk__in=[allocation.stock_id for allocation in allocations],
+            quantity__lte=F("quantity_allocated"),
+        ):
+            transaction.on_commit(
+                lambda stock=stock: manager.product_variant_out_of_stock(stock)
+            )
+    return lines_info_to_allocate
+
+
 def _prepare_stock_to_reserved_quantity_map(
     checkout_lines, check_reservations, stocks_id
 ):
@@ -387,6 +504,9 @@ def deallocate_stock(order_lines_data: list["OrderLineInfo"], manager: PluginsMa
             )
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_variants_availability(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
     if not_dellocated_lines:
         raise AllocationError(not_dellocated_lines)
@@ -410,6 +530,7 @@ def increase_stock(
     create a new allocation for this order line in this stock.
     """
     assert order_line.variant
+    invalidate_variants_availability([order_line.variant.pk])
     stock = (
         stock_qs_select_for_update()
         .filter(warehouse=warehouse, product_variant=order_line.variant)
@@ -534,6 +655,7 @@ def decrease_stock(
         return
     variants = [line_info.variant for line_info in order_lines_info]
     warehouse_pks = [line_info.warehouse_pk for line_info in order_lines_info]
+    invalidate_variants_availability(variant.pk for variant in variants if variant)
 
     stocks = (
         stock_qs_select_for_update()
@@ -707,6 +829,9 @@ def deallocate_stock_for_orders(orders_ids: list[UUID], manager: PluginsManager)
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+    invalidate_variants_availability(
+        stock.product_variant_id for stock in stocks_to_update
+    )
 
 
 @traced_atomic_transaction()
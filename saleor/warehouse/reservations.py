@@ -11,6 +11,7 @@ from django.utils import timezone
 from ..core.exceptions import InsufficientStock, InsufficientStockData
 from ..core.tracing import traced_atomic_transaction
 from ..product.models import ProductVariant, ProductVariantChannelListing
+from .availability_cache import invalidate_variants_availability
 from .lock_objects import stock_qs_select_for_update
 from .management import sort_stocks
 from .models import Allocation, PreorderReservation, Reservation
@@ -178,6 +179,9 @@ def reserve_stocks(
         if replace:
             Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
         Reservation.objects.bulk_create(reservations)
+        invalidate_variants_availability(
+            reservation.checkout_line.variant_id for reservation in reservations
+        )
 
 
 def _create_stock_reservations(
@@ -1,8 +1,10 @@
 from unittest import mock
 
 import pytest
+from django.db import connection
 from django.db.models import Sum
 from django.db.models.functions import Coalesce
+from django.test.utils import CaptureQueriesContext
 
 from ...channel import AllocationStrategy
 from ...core.exceptions import InsufficientStock
@@ -10,6 +12,10 @@ from ...order.fetch import OrderLineInfo
 from ...order.models import OrderLine
 from ...plugins.manager import get_plugins_manager
 from ...warehouse.models import Stock
+from ..availability_cache import (
+    get_cached_available_quantities,
+    set_cached_available_quantities,
+)
 from ..management import (
     allocate_preorders,
     allocate_stocks,
@@ -45,6 +51,37 @@ def test_allocate_stocks(order_line, stock, channel_USD):
     assert allocation.quantity_allocated == stock.quantity_allocated == 50
 
 
+def test_allocate_stocks_outdates_cached_availability(
+    settings, order_line, stock, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    settings.AVAILABILITY_CACHE_ENABLED = True
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+    variant_id = order_line.variant_id
+    _, cache_keys = get_cached_available_quantities(
+        [variant_id], COUNTRY_CODE, channel_USD.slug, True
+    )
+    set_cached_available_quantities(cache_keys, {variant_id: 100})
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    quantities, _ = get_cached_available_quantities(
+        [variant_id], COUNTRY_CODE, channel_USD.slug, True
+    )
+    assert quantities == {}
+
+
 def test_allocate_stocks_multiple_lines_the_highest_stock_strategy(
     order_line, order, product, stock, channel_USD
 ):
@@ -1366,3 +1403,150 @@ def test_allocate_preorders_with_global_reservations(
         check_reservations=True,
         checkout_lines=[checkout_line_with_reserved_preorder_item],
     )
+
+
+def test_allocate_stocks_hot_variant(order_line, stock, channel_USD, settings):
+    # given
+    settings.STOCK_ALLOCATION_HOT_VARIANTS = [order_line.variant_id]
+    stock.quantity = 100
+    stock.quantity_allocated = 10
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 60
+    allocation = Allocation.objects.get(order_line=order_line, stock=stock)
+    assert allocation.quantity_allocated == 50
+
+
+def test_allocate_stocks_hot_variant_locks_all_order_stocks_before_update(
+    order_with_lines, channel_USD, settings
+):
+    # given
+    hot_line, regular_line = order_with_lines.lines.all()
+    settings.STOCK_ALLOCATION_HOT_VARIANTS = [hot_line.variant_id]
+    stocks = Stock.objects.filter(
+        product_variant__in=[hot_line.variant_id, regular_line.variant_id]
+    )
+    stocks.update(quantity=100)
+    allocations_count = Allocation.objects.count()
+
+    lines_data = [
+        OrderLineInfo(line=line, variant=line.variant, quantity=1)
+        for line in [hot_line, regular_line]
+    ]
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        allocate_stocks(
+            lines_data,
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    stock_queries = [
+        query["sql"]
+        for query in ctx.captured_queries
+        if "warehouse_stock" in query["sql"]
+    ]
+    first_lock = next(
+        index for index, sql in enumerate(stock_queries) if "FOR UPDATE" in sql
+    )
+    first_update = next(
+        index
+        for index, sql in enumerate(stock_queries)
+        if sql.startswith('UPDATE "warehouse_stock"')
+    )
+    assert first_lock < first_update
+    lock_sql = stock_queries[first_lock]
+    assert 'ORDER BY "warehouse_stock"."id"' in lock_sql
+    for variant_pk in [hot_line.variant_id, regular_line.variant_id]:
+        assert str(variant_pk) in lock_sql
+    assert Allocation.objects.count() == allocations_count + 2
+
+
+def test_allocate_stocks_hot_variant_split_between_stocks(
+    order_line, variant_with_many_stocks, channel_USD, settings
+):
+    # given
+    variant = variant_with_many_stocks
+    settings.STOCK_ALLOCATION_HOT_VARIANTS = [variant.pk]
+    stocks = variant.stocks.all()
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=5)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+
+    # then
+    allocations = Allocation.objects.filter(order_line=order_line, stock__in=stocks)
+    assert allocations[0].quantity_allocated == stocks[0].quantity_allocated == 4
+    assert allocations[1].quantity_allocated == stocks[1].quantity_allocated == 1
+
+
+def test_allocate_stocks_hot_variant_insufficient_stock(
+    order_line, stock, channel_USD, settings
+):
+    # given
+    settings.STOCK_ALLOCATION_HOT_VARIANTS = [order_line.variant_id]
+    stock.quantity = 40
+    stock.quantity_allocated = 0
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    with pytest.raises(InsufficientStock):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 0
+    assert not Allocation.objects.filter(order_line=order_line).exists()
+
+
+def test_allocate_stocks_hot_variant_insufficient_stock_due_to_reservations(
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+    checkout_line_with_reservation_in_many_stocks,
+    settings,
+):
+    # given
+    settings.STOCK_ALLOCATION_HOT_VARIANTS = [variant_with_many_stocks.pk]
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=5)
+
+    # when
+    with pytest.raises(InsufficientStock):
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+            check_reservations=True,
+        )
+
+    # then
+    assert not Allocation.objects.exists()
@@ -6,6 +6,10 @@ from django.utils import timezone
 from ...channel import AllocationStrategy
 from ...checkout.models import Checkout
 from ...core.exceptions import InsufficientStock
+from ..availability_cache import (
+    get_cached_available_quantities,
+    set_cached_available_quantities,
+)
 from ..models import ChannelWarehouse, Reservation, Stock, Warehouse
 from ..reservations import reserve_stocks
 
@@ -36,6 +40,34 @@ def test_reserve_stocks(checkout_line, channel_USD):
     assert reservation.reserved_until > timezone.now() + datetime.timedelta(minutes=1)
 
 
+def test_reserve_stocks_outdates_cached_availability(
+    settings, checkout_line, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    settings.AVAILABILITY_CACHE_ENABLED = True
+    variant_id = checkout_line.variant_id
+    _, cache_keys = get_cached_available_quantities(
+        [variant_id], COUNTRY_CODE, channel_USD.slug, True
+    )
+    set_cached_available_quantities(cache_keys, {variant_id: 10})
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        reserve_stocks(
+            [checkout_line],
+            [checkout_line.variant],
+            COUNTRY_CODE,
+            channel_USD,
+            timezone.now() + datetime.timedelta(minutes=RESERVATION_LENGTH),
+        )
+
+    # then
+    quantities, _ = get_cached_available_quantities(
+        [variant_id], COUNTRY_CODE, channel_USD.slug, True
+    )
+    assert quantities == {}
+
+
 def test_stocks_reservation_skips_prev_reservation_delete_if_replace_is_disabled(
     checkout_line, assert_num_queries, channel_USD
 ):
@@ -0,0 +1,30 @@
+from django.apps import AppConfig as DjangoAppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class WebhookAppConfig(DjangoAppConfig):
+    name = "saleor.webhook"
+
+    def ready(self):
+        from ..app.models import App
+        from .models import Webhook, WebhookEvent
+        from .signals import invalidate_webhook_event_map_on_commit
+
+        # Changes of these models affect which webhooks are triggered for events.
+        for model in (App, Webhook, WebhookEvent):
+            model_name = model._meta.model_name
+            post_save.connect(
+                invalidate_webhook_event_map_on_commit,
+                sender=model,
+                dispatch_uid=f"invalidate_webhook_event_map_on_{model_name}_save",
+            )
+            post_delete.connect(
+                invalidate_webhook_event_map_on_commit,
+                sender=model,
+                dispatch_uid=f"invalidate_webhook_event_map_on_{model_name}_delete",
+            )
+        m2m_changed.connect(
+            invalidate_webhook_event_map_on_commit,
+            sender=App.permissions.through,
+            dispatch_uid="invalidate_webhook_event_map_on_app_permissions_change",
+        )
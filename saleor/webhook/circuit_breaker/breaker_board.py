@@ -188,30 +188,37 @@ class BreakerBoard:
     def register_success(self, app_id: int):
         self.storage.register_event(app_id, "total", self.ttl_seconds)
 
+    def check_webhook(self, event_type: str, webhook: "Webhook") -> tuple[bool, bool]:
+        """Return whether the webhook can be sent and whether to register its result."""
+        if event_type not in settings.BREAKER_BOARD_SYNC_EVENTS:
+            # Execute webhook without affecting breaker state
+            return True, False
+
+        state = self.update_breaker_state(webhook.app)
+        if state == CircuitBreakerState.OPEN:
+            # Skip webhook to prevent sending it, unless in dry-run mode, where it's
+            # executed, but the result is ignored (pretend it's skipped)
+            return event_type in settings.BREAKER_BOARD_DRY_RUN_SYNC_EVENTS, False
+        return True, True
+
+    def register_response(self, app_id: int, response):
+        if response is None:
+            self.register_error(app_id)
+        else:
+            self.register_success(app_id)
+
     def __call__(self, func):
         def inner(*args, **kwargs):
             event_type: str = kwargs.get("event_type") or args[0]
             webhook: Webhook = kwargs.get("webhook") or args[2]
 
-            if event_type not in settings.BREAKER_BOARD_SYNC_EVENTS:
-                # Execute webhook without affecting breaker state
-                return func(*args, **kwargs)
-
-            app = webhook.app
-            state = self.update_breaker_state(app)
-            if state == CircuitBreakerState.OPEN:
-                if event_type not in settings.BREAKER_BOARD_DRY_RUN_SYNC_EVENTS:
-                    # Skip func execution to prevent sending webhooks
-                    return None
-                else:  # noqa: RET505
-                    # Dry-run: execute webhook, but ignore result (pretend it's skipped)
-                    return func(*args, **kwargs)
+            allowed, monitored = self.check_webhook(event_type, webhook)
+            if not allowed:
+                return None
 
             response = func(*args, **kwargs)
-            if response is None:
-                self.register_error(app.id)
-            else:
-                self.register_success(app.id)
+            if monitored:
+                self.register_response(webhook.app.id, response)
 
             return response
 
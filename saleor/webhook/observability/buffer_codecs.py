@@ -0,0 +1,115 @@
+import zlib
+
+from .exceptions import BufferCodecError
+
+# Fragments repeated in every observability event. Used as a preset dictionary, so
+# they are compressed even in small, single events. Most frequent fragments are kept
+# at the end, as zlib encodes closer matches with fewer bits.
+# Never change it; add a new codec with a new tag instead, as events encoded with
+# this dictionary can still be stored in the buffer.
+OBSERVABILITY_ZLIB_DICTIONARY_V1 = (
+    b'"operationType": "query", "operationType": "mutation", '
+    b'"operationType": "subscription", "resultInvalid": false, '
+    b'"gqlOperations": [{"name": {"text": "", "truncated": false}, '
+    b'"query": {"text": "", "truncated": false}, '
+    b'"result": {"text": "", "truncated": false}, '
+    b'"eventSync": false, "eventSync": true, "nextRetry": null, '
+    b'"subscriptionQuery": null, "targetUrl": "https://", '
+    b'"eventDelivery": {"id": "", "status": "success", "eventType": "", '
+    b'"payload": {"contentLength": 0, "body": {"text": "", "truncated": false}}}, '
+    b'"webhook": {"id": "", "name": "", '
+    b'"eventType": "event_delivery_attempt", "duration": 0.0, '
+    b'"status": "failed", "status": "pending", "status": "success", '
+    b'"eventType": "api_call", "request": {"id": "", "method": "POST", '
+    b'"url": "http://", "time": 0.0, "headers": [["Content-Type", '
+    b'"application/json"], ["Content-Length", ""]], "contentLength": 0}, '
+    b'"response": {"headers": [["Content-Type", "application/json"]], '
+    b'"statusCode": 200, "contentLength": 0, "body": {"text": "", '
+    b'"truncated": false}}, "app": {"id": "", "name": ""}, "app": null, '
+    b'{"text": "", "truncated": false}'
+)
+
+# First byte of every zlib stream with the default window size, so events encoded
+# without a tag, like the ones stored by `ZlibCodec`, can be told apart.
+ZLIB_HEADER = b"\x78"
+
+
+class BaseBufferCodec:
+    name: str
+    tag: bytes
+
+    def encode(self, value: bytes) -> bytes:
+        raise NotImplementedError(
+            "subclasses of BaseBufferCodec must provide an encode() method"
+        )
+
+    def decode(self, value: bytes) -> bytes:
+        raise NotImplementedError(
+            "subclasses of BaseBufferCodec must provide a decode() method"
+        )
+
+
+class ZlibCodec(BaseBufferCodec):
+    """Compress every event with zlib, without any framing."""
+
+    name = "zlib"
+    tag = ZLIB_HEADER
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def encode(self, value: bytes) -> bytes:
+        return zlib.compress(value, self.level)
+
+    def decode(self, value: bytes) -> bytes:
+        return zlib.decompress(value)
+
+
+class ZlibDictCodec(BaseBufferCodec):
+    """Compress every event with zlib using a preset dictionary.
+
+    Encoded events are prefixed with the codec tag.
+    """
+
+    name = "zlib-dict"
+    tag = b"\x01"
+    dictionary = OBSERVABILITY_ZLIB_DICTIONARY_V1
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def encode(self, value: bytes) -> bytes:
+        compressor = zlib.compressobj(self.level, zdict=self.dictionary)
+        return self.tag + compressor.compress(value) + compressor.flush()
+
+    def decode(self, value: bytes) -> bytes:
+        decompressor = zlib.decompressobj(zdict=self.dictionary)
+        return decompressor.decompress(value[len(self.tag) :]) + decompressor.flush()
+
+
+CODECS: dict[str, type[BaseBufferCodec]] = {
+    codec.name: codec for codec in (ZlibCodec, ZlibDictCodec)
+}
+_CODECS_BY_TAG: dict[bytes, BaseBufferCodec] = {
+    codec.tag: codec() for codec in CODECS.values()
+}
+
+
+def get_codec(name: str) -> BaseBufferCodec:
+    try:
+        return CODECS[name]()
+    except KeyError as e:
+        raise ValueError(f"Unknown observability buffer codec: {name!r}") from e
+
+
+def decode_event(value: bytes) -> bytes:
+    """Decode an event stored with any of the known codecs.
+
+    Buffers can contain events encoded with a different codec, e.g. after
+    `OBSERVABILITY_BUFFER_CODEC` was changed.
+    """
+    try:
+        codec = _CODECS_BY_TAG[value[:1]]
+    except KeyError as e:
+        raise BufferCodecError(f"Unknown observability event tag: {value[:1]!r}") from e
+    return codec.decode(value)
@@ -1,16 +1,49 @@
 import math
-import zlib
 
 from asgiref.local import Local
 from django.conf import settings
 from redis import ConnectionPool, Redis
 
+from ...core.telemetry import (
+    DEFAULT_DURATION_BUCKETS,
+    MetricType,
+    Scope,
+    Unit,
+    meter,
+    saleor_attributes,
+)
+from .buffer_codecs import BaseBufferCodec, ZlibCodec, decode_event, get_codec
 from .exceptions import ConnectionNotConfigured
 
 KEY_TYPE = str
 DEFAULT_CONNECTION_TIMEOUT = 0.5
 _local = Local()
 
+METRIC_BUFFER_CODEC_DURATION = meter.create_metric(
+    "saleor.observability.buffer.codec_duration",
+    scope=Scope.CORE,
+    type=MetricType.HISTOGRAM,
+    unit=Unit.SECOND,
+    description="Duration of encoding or decoding a batch of observability events.",
+    bucket_boundaries=DEFAULT_DURATION_BUCKETS,
+)
+
+METRIC_BUFFER_RAW_BYTES = meter.create_metric(
+    "saleor.observability.buffer.raw_bytes",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.BYTE,
+    description="Number of bytes of observability events before encoding.",
+)
+
+METRIC_BUFFER_ENCODED_BYTES = meter.create_metric(
+    "saleor.observability.buffer.encoded_bytes",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.BYTE,
+    description="Number of bytes of observability events after encoding.",
+)
+
 
 class BaseBuffer:
     _compressor_preset = 6
@@ -23,6 +56,7 @@ class BaseBuffer:
         batch_size: int,
         connection_timeout=DEFAULT_CONNECTION_TIMEOUT,
         timeout: int = 60,
+        codec: BaseBufferCodec | None = None,
     ):
         self.broker_url = broker_url
         self.key = key
@@ -30,12 +64,49 @@ class BaseBuffer:
         self.batch_size = batch_size
         self.connection_timeout = connection_timeout
         self.timeout = timeout
+        self.codec = codec or ZlibCodec(self._compressor_preset)
 
     def decode(self, value: bytes) -> bytes:
-        return zlib.decompress(value)
+        return decode_event(value)
 
     def encode(self, value: bytes) -> bytes:
-        return zlib.compress(value, self._compressor_preset)
+        return self.codec.encode(value)
+
+    def encode_events(self, events: list[bytes]) -> list[bytes]:
+        attributes = {saleor_attributes.SALEOR_OBSERVABILITY_CODEC: self.codec.name}
+        with meter.record_duration(
+            METRIC_BUFFER_CODEC_DURATION,
+            attributes={
+                **attributes,
+                saleor_attributes.SALEOR_OBSERVABILITY_CODEC_OPERATION: "encode",
+            },
+        ):
+            encoded_events = [self.encode(event) for event in events]
+        # Small events can grow when encoded, so sizes are recorded separately;
+        # counters can't record the negative difference.
+        meter.record(
+            METRIC_BUFFER_RAW_BYTES,
+            sum(len(event) for event in events),
+            Unit.BYTE,
+            attributes=attributes,
+        )
+        meter.record(
+            METRIC_BUFFER_ENCODED_BYTES,
+            sum(len(event) for event in encoded_events),
+            Unit.BYTE,
+            attributes=attributes,
+        )
+        return encoded_events
+
+    def decode_events(self, values: list[bytes]) -> list[bytes]:
+        with meter.record_duration(
+            METRIC_BUFFER_CODEC_DURATION,
+            attributes={
+                saleor_attributes.SALEOR_OBSERVABILITY_CODEC: self.codec.name,
+                saleor_attributes.SALEOR_OBSERVABILITY_CODEC_OPERATION: "decode",
+            },
+        ):
+            return [self.decode(value) for value in values]
 
     def put_event(self, event: bytes) -> int:
         raise NotImplementedError(
@@ -119,7 +190,7 @@ class RedisBuffer(BaseBuffer):
         self, key: KEY_TYPE, events: list[bytes], client: Redis | None = None
     ) -> int:
         start_index = -self.max_size
-        events_data = [self.encode(event) for event in events[start_index:]]
+        events_data = self.encode_events(events[start_index:])
         if client is None:
             client = self.client
         client.lpush(key, *events_data)
@@ -153,7 +224,7 @@ class RedisBuffer(BaseBuffer):
         return trimmed
 
     def _pop_events(self, key: KEY_TYPE, batch_size: int) -> tuple[list[bytes], int]:
-        events = []
+        values = []
         with self.client.pipeline(transaction=False) as pipe:
             pipe.llen(key)
             for _i in range(max(1, batch_size)):
@@ -163,7 +234,8 @@ class RedisBuffer(BaseBuffer):
         for elem in result:
             if elem is None:
                 break
-            events.append(self.decode(elem))
+            values.append(elem)
+        events = self.decode_events(values) if values else []
         return events, size - len(events)
 
     def pop_event(self) -> bytes | None:
@@ -204,4 +276,5 @@ def get_buffer(
         batch_size,
         connection_timeout=connection_timeout,
         timeout=timeout,
+        codec=get_codec(settings.OBSERVABILITY_BUFFER_CODEC),
     )
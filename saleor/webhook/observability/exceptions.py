@@ -9,6 +9,10 @@ class ConnectionNotConfigured(ObservabilityError):
     pass
 
 
+class BufferCodecError(ObservabilityError):
+    pass
+
+
 class TruncationError(ObservabilityError):
     _event_type: ObservabilityEventTypes | None = None
 
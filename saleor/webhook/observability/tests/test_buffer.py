@@ -1,12 +1,20 @@
 import datetime
+from unittest.mock import patch
 
 import pytest
 from django.utils import timezone
 from freezegun import freeze_time
 
-from ..buffers import RedisBuffer, get_buffer
-from ..exceptions import ConnectionNotConfigured
-from ..tests.conftest import BATCH_SIZE, BROKER_URL_HOST, KEY, MAX_SIZE
+from ....core.telemetry import Unit
+from ..buffer_codecs import ZlibCodec, ZlibDictCodec, decode_event
+from ..buffers import (
+    METRIC_BUFFER_ENCODED_BYTES,
+    METRIC_BUFFER_RAW_BYTES,
+    RedisBuffer,
+    get_buffer,
+)
+from ..exceptions import BufferCodecError, ConnectionNotConfigured
+from ..tests.conftest import BATCH_SIZE, BROKER_URL, BROKER_URL_HOST, KEY, MAX_SIZE
 
 
 def test_get_buffer(redis_server, settings):
@@ -156,3 +164,75 @@ def test_pop_expired_events(buffer):
     with freeze_time(push_time + datetime.timedelta(seconds=buffer.timeout + 1)):
         popped_events = buffer.pop_events()
     assert popped_events == []
+
+
+def test_get_buffer_uses_codec_from_settings(redis_server, settings):
+    settings.OBSERVABILITY_BUFFER_CODEC = ZlibDictCodec.name
+    buffer = get_buffer(KEY)
+    assert isinstance(buffer.codec, ZlibDictCodec)
+
+
+def test_get_buffer_with_unknown_codec(redis_server, settings):
+    settings.OBSERVABILITY_BUFFER_CODEC = "unknown"
+    with pytest.raises(ValueError, match="Unknown observability buffer codec"):
+        get_buffer(KEY)
+
+
+@pytest.mark.parametrize("codec", [ZlibCodec(), ZlibDictCodec()])
+def test_codec_round_trip(codec, event_data):
+    encoded = codec.encode(event_data)
+    assert decode_event(encoded) == event_data
+
+
+def test_zlib_dict_codec_compresses_better_than_zlib(event_data):
+    assert len(ZlibDictCodec().encode(event_data)) < len(ZlibCodec().encode(event_data))
+
+
+def test_decode_event_with_unknown_tag():
+    with pytest.raises(BufferCodecError):
+        decode_event(b"\xffevent-data")
+
+
+def test_pop_events_encoded_with_different_codecs(patch_connection_pool):
+    zlib_buffer = RedisBuffer(BROKER_URL, KEY, MAX_SIZE, BATCH_SIZE, codec=ZlibCodec())
+    zlib_dict_buffer = RedisBuffer(
+        BROKER_URL, KEY, MAX_SIZE, BATCH_SIZE, codec=ZlibDictCodec()
+    )
+    zlib_buffer.put_event(b"event-data-0")
+    zlib_dict_buffer.put_event(b"event-data-1")
+
+    events = zlib_dict_buffer.pop_events()
+
+    assert events == [b"event-data-0", b"event-data-1"]
+
+
+@patch("saleor.webhook.observability.buffers.meter.record")
+def test_put_events_records_raw_and_encoded_bytes(mock_record, buffer, event_data):
+    events = [event_data] * 2
+    encoded_size = sum(len(buffer.encode(event)) for event in events)
+    attributes = {"saleor.observability.buffer.codec": buffer.codec.name}
+
+    buffer.put_events(events)
+
+    mock_record.assert_any_call(
+        METRIC_BUFFER_RAW_BYTES, len(event_data) * 2, Unit.BYTE, attributes=attributes
+    )
+    mock_record.assert_any_call(
+        METRIC_BUFFER_ENCODED_BYTES, encoded_size, Unit.BYTE, attributes=attributes
+    )
+
+
+@patch("saleor.webhook.observability.buffers.meter.record")
+def test_put_events_records_encoded_bytes_larger_than_raw(mock_record, buffer):
+    event = b"a"
+    encoded_size = len(buffer.encode(event))
+    assert encoded_size > len(event)
+
+    buffer.put_events([event])
+
+    mock_record.assert_any_call(
+        METRIC_BUFFER_ENCODED_BYTES,
+        encoded_size,
+        Unit.BYTE,
+        attributes={"saleor.observability.buffer.codec": buffer.codec.name},
+    )
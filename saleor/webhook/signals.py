@@ -0,0 +1,7 @@
+from django.db import transaction
+
+from .utils import invalidate_webhook_event_map
+
+
+def invalidate_webhook_event_map_on_commit(sender, **kwargs):
+    transaction.on_commit(invalidate_webhook_event_map)
@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 import pytest
@@ -8,6 +9,7 @@ from ..event_types import WebhookEventSyncType
 from ..models import Webhook, WebhookEvent
 from ..transport.synchronous import trigger_taxes_all_webhooks_sync
 from ..transport.taxes import parse_tax_data
+from ..transport.utils import WebhookResponse
 
 
 @pytest.fixture
@@ -142,3 +144,35 @@ def test_trigger_tax_webhook_sync_invalid_webhooks(
     # then
     assert mock_request.call_count == len(tax_checkout_webhooks)
     assert tax_data is None
+
+
+@mock.patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_tax_webhook_sync_parallel_returns_first_valid_response(
+    mock_send_webhook_using_http,
+    tax_checkout_webhooks,
+    tax_data_response,
+    settings,
+):
+    # given
+    settings.WEBHOOK_SYNC_PARALLEL_ENABLED = True
+    responses = {
+        tax_checkout_webhooks[0].target_url: {},
+        tax_checkout_webhooks[1].target_url: tax_data_response,
+        tax_checkout_webhooks[2].target_url: tax_data_response,
+    }
+    mock_send_webhook_using_http.side_effect = (
+        lambda target_url, *args, **kwargs: WebhookResponse(
+            content=json.dumps(responses[target_url])
+        )
+    )
+    event_type = WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
+    lines_count = len(tax_data_response["lines"])
+
+    # when
+    tax_data = trigger_taxes_all_webhooks_sync(
+        event_type, lambda: '{"key": "value"}', lines_count
+    )
+
+    # then
+    assert mock_send_webhook_using_http.call_count == 3
+    assert tax_data == parse_tax_data(tax_data_response, lines_count)
@@ -1,4 +1,9 @@
+from unittest.mock import patch
+
 import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
 
 from ...app.models import App
 from ..event_types import WebhookEventAsyncType, WebhookEventSyncType
@@ -12,7 +17,15 @@ from ..observability.payload_schema import ObservabilityEventTypes
 from ..transport.utils import (
     generate_cache_key_for_webhook,
 )
-from ..utils import get_webhooks_for_event, get_webhooks_for_multiple_events
+from ..utils import (
+    WEBHOOK_EVENT_MAP_VERSION_KEY,
+    _fetch_webhooks_for_multiple_events,
+    _webhook_event_map_cache,
+    get_webhook_event_map_version,
+    get_webhooks_for_event,
+    get_webhooks_for_multiple_events,
+    invalidate_webhook_event_map,
+)
 
 
 @pytest.fixture
@@ -216,6 +229,110 @@ def test_get_webhooks_for_multiple_events(
     }
 
 
+@pytest.fixture
+def clear_webhook_event_map_cache():
+    cache.delete(WEBHOOK_EVENT_MAP_VERSION_KEY)
+    _webhook_event_map_cache.clear()
+    yield
+    cache.delete(WEBHOOK_EVENT_MAP_VERSION_KEY)
+    _webhook_event_map_cache.clear()
+
+
+@override_settings(WEBHOOK_EVENT_MAP_CACHE_ENABLED=True)
+def test_get_webhooks_for_multiple_events_cached(
+    clear_webhook_event_map_cache,
+    async_app_factory,
+    async_type,
+    django_assert_num_queries,
+):
+    # given
+    _, webhook = async_app_factory()
+    get_webhooks_for_multiple_events([async_type])
+
+    # when
+    with django_assert_num_queries(0):
+        webhook_map = get_webhooks_for_multiple_events([async_type])
+
+    # then
+    assert webhook_map[async_type] == {webhook}
+
+
+@override_settings(WEBHOOK_EVENT_MAP_CACHE_ENABLED=True)
+def test_get_webhooks_for_multiple_events_invalidated_on_webhook_change(
+    clear_webhook_event_map_cache,
+    async_app_factory,
+    async_type,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    _, webhook = async_app_factory()
+    get_webhooks_for_multiple_events([async_type])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        webhook.is_active = False
+        webhook.save(update_fields=["is_active"])
+    webhook_map = get_webhooks_for_multiple_events([async_type])
+
+    # then
+    assert webhook_map[async_type] == set()
+
+
+@override_settings(WEBHOOK_EVENT_MAP_CACHE_ENABLED=True)
+def test_get_webhooks_for_multiple_events_invalidated_on_app_permissions_change(
+    clear_webhook_event_map_cache,
+    async_app_factory,
+    async_type,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    app, _ = async_app_factory()
+    get_webhooks_for_multiple_events([async_type])
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        app.permissions.clear()
+    webhook_map = get_webhooks_for_multiple_events([async_type])
+
+    # then
+    assert webhook_map[async_type] == set()
+
+
+@override_settings(WEBHOOK_EVENT_MAP_CACHE_ENABLED=True)
+@patch(
+    "saleor.webhook.utils._fetch_webhooks_for_multiple_events",
+    wraps=_fetch_webhooks_for_multiple_events,
+)
+def test_get_webhooks_for_multiple_events_cache_filled_from_writer(
+    mocked_fetch_webhooks, clear_webhook_event_map_cache, async_app_factory, async_type
+):
+    # given
+    _, webhook = async_app_factory()
+
+    # when
+    webhook_map = get_webhooks_for_multiple_events([async_type])
+
+    # then
+    assert webhook_map[async_type] == {webhook}
+    mocked_fetch_webhooks.assert_called_once()
+    assert (
+        mocked_fetch_webhooks.call_args.args[1]
+        == settings.DATABASE_CONNECTION_DEFAULT_NAME
+    )
+
+
+@override_settings(WEBHOOK_EVENT_MAP_CACHE_ENABLED=True)
+def test_invalidate_webhook_event_map(clear_webhook_event_map_cache):
+    # given
+    version = get_webhook_event_map_version()
+
+    # when
+    invalidate_webhook_event_map()
+
+    # then
+    assert get_webhook_event_map_version() == version + 1
+
+
 def test_different_target_urls_produce_different_cache_key(checkout_with_item):
     # given
     target_url_1 = "http://example.com/1"
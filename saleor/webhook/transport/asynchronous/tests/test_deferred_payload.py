@@ -9,8 +9,12 @@ import pytest
 from .....checkout.calculations import fetch_checkout_data
 from .....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from .....core import EventDeliveryStatus
-from .....core.models import EventDelivery
+from .....core.models import EventDelivery, EventPayload
+from .....graphql.webhook.subscription_payload import (
+    generate_payload_promise_from_subscription,
+)
 from ....event_types import WebhookEventAsyncType
+from ....models import Webhook
 from ....utils import get_webhooks_for_event
 from ..transport import (
     DeferredPayloadData,
@@ -199,3 +203,62 @@ def test_pass_queue_to_send_webhook_request_async(
         mocked_send_webhook_request_async.call_args.kwargs
     )
     assert call_kwargs_send_webhook_request["queue"] == queue
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
+)
+def test_generate_deferred_payload_shares_payload_for_same_subscription_query(
+    mocked_generate_payload_promise_from_subscription,
+    mocked_send_webhook_request_async,
+    checkout_with_item,
+    setup_checkout_webhooks,
+    staff_user,
+    fetch_kwargs,
+):
+    # given
+    fetch_checkout_data(**fetch_kwargs)
+    event_type = WebhookEventAsyncType.CHECKOUT_UPDATED
+    _, _, _, checkout_updated_webhook = setup_checkout_webhooks(event_type)
+    other_webhook = Webhook.objects.create(
+        app=checkout_updated_webhook.app,
+        name="Other checkout updated webhook",
+        target_url="https://www.example.com/other-checkout-updated",
+        subscription_query=checkout_updated_webhook.subscription_query,
+    )
+    other_webhook.events.create(event_type=event_type)
+    deferred_payload_data = DeferredPayloadData(
+        model_name="checkout.checkout",
+        object_id=checkout_with_item.pk,
+        requestor_model_name="account.user",
+        requestor_object_id=staff_user.pk,
+        request_time=None,
+    )
+    deliveries = EventDelivery.objects.bulk_create(
+        EventDelivery(
+            event_type=event_type,
+            webhook=webhook,
+            status=EventDeliveryStatus.PENDING,
+        )
+        for webhook in [checkout_updated_webhook, other_webhook]
+    )
+
+    # when
+    generate_deferred_payloads.delay(
+        event_delivery_ids=[delivery.pk for delivery in deliveries],
+        deferred_payload_data=asdict(deferred_payload_data),
+    )
+
+    # then
+    mocked_generate_payload_promise_from_subscription.assert_called_once()
+    first_delivery, second_delivery = EventDelivery.objects.filter(
+        pk__in=[delivery.pk for delivery in deliveries]
+    )
+    assert first_delivery.payload_id
+    assert first_delivery.payload_id == second_delivery.payload_id
+    assert EventPayload.objects.count() == 1
+    assert mocked_send_webhook_request_async.call_count == 2
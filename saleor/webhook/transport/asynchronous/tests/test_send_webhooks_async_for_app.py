@@ -214,3 +214,33 @@ def test_send_webhooks_async_for_app_last_retry_failed(
     mock_send_webhooks_async_for_app_apply_async.assert_called_once_with(
         kwargs={"app_id": app.id, "telemetry_context": ANY},
     )
+
+
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+@patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhooks_async_for_app.apply_async"
+)
+def test_send_multiple_webhooks_async_for_app_partially_failed(
+    mock_send_webhooks_async_for_app_apply_async,
+    mock_send_webhook_using_scheme_method,
+    app,
+    event_deliveries,
+):
+    # given
+    mock_send_webhook_using_scheme_method.side_effect = [
+        WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS),
+        WebhookResponse(content="", status=EventDeliveryStatus.FAILED),
+        WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS),
+    ]
+
+    # when
+    send_webhooks_async_for_app(app_id=app.id)
+
+    # then
+    assert mock_send_webhook_using_scheme_method.call_count == 3
+    deliveries = EventDelivery.objects.all()
+    assert len(deliveries) == 1
+    assert deliveries[0].status == EventDeliveryStatus.PENDING
+    assert EventDeliveryAttempt.objects.get().status == EventDeliveryStatus.FAILED
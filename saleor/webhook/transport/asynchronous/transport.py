@@ -4,6 +4,7 @@ import logging
 from collections import defaultdict
 from collections.abc import Callable, Sequence
 from dataclasses import asdict, dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
@@ -37,6 +38,7 @@ from ....graphql.webhook.subscription_types import WEBHOOK_TYPES_MAP
 from ... import observability
 from ...event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ...observability import WebhookData
+from ..dispatcher import dispatch_concurrently
 from ..metrics import record_external_request, record_first_delivery_attempt_delay
 from ..utils import (
     DeferredPayloadData,
@@ -522,29 +524,40 @@ def generate_deferred_payloads(
         )
         return
 
-    event_payloads = []
-    event_payloads_data = []
-    event_deliveries_for_bulk_update = []
-
+    # Webhooks of the same app with the same subscription query receive the same
+    # payload, so the subscription is executed and the payload stored once for them.
+    deliveries_by_subscription: dict[tuple, list[EventDelivery]] = defaultdict(list)
     for delivery in deliveries:
-        event_type = delivery.event_type
         webhook = delivery.webhook
         if not webhook.subscription_query:
             continue
+        key = (webhook.subscription_query, webhook.app_id, delivery.event_type)
+        deliveries_by_subscription[key].append(delivery)
 
-        request = initialize_request(
-            requestor,
-            event_type in WebhookEventSyncType.ALL,
-            event_type=event_type,
-            allow_replica=True,
-            request_time=args_obj.request_time,
-        )
+    event_payloads = []
+    event_payloads_data = []
+    event_deliveries_for_bulk_update = []
+    requests = {}
+
+    for (
+        subscription_query,
+        app_id,
+        event_type,
+    ), subscription_deliveries in deliveries_by_subscription.items():
+        if (app_id, event_type) not in requests:
+            requests[app_id, event_type] = initialize_request(
+                requestor,
+                event_type in WebhookEventSyncType.ALL,
+                event_type=event_type,
+                allow_replica=True,
+                request_time=args_obj.request_time,
+            )
         data_promise = generate_payload_promise_from_subscription(
             event_type=event_type,
             subscribable_object=subscribable_object,
-            subscription_query=webhook.subscription_query,
-            request=request,
-            app=webhook.app,
+            subscription_query=subscription_query,
+            request=requests[app_id, event_type],
+            app=subscription_deliveries[0].webhook.app,
         )
 
         if data_promise:
@@ -554,8 +567,9 @@ def generate_deferred_payloads(
                 event_payloads_data.append(data_json)
                 event_payload = EventPayload()
                 event_payloads.append(event_payload)
-                delivery.payload = event_payload
-                event_deliveries_for_bulk_update.append(delivery)
+                for delivery in subscription_deliveries:
+                    delivery.payload = event_payload
+                    event_deliveries_for_bulk_update.append(delivery)
 
     if event_deliveries_for_bulk_update:
         with allow_writer():
@@ -693,33 +707,46 @@ def send_webhooks_async_for_app(
     failed_deliveries_attempts = []
     successful_deliveries = []
 
+    # Load the payloads first, as the database can't be used while sending
+    # the requests concurrently.
+    payloads: dict[int, bytes] = {}
     for delivery_id, delivery_with_count in deliveries.items():
         delivery = delivery_with_count.delivery
-        attempt_count = delivery_with_count.count
-        attempt = attempts_for_deliveries[delivery_id]
-
-        webhook = delivery.webhook
-
         try:
             if not delivery.payload:
                 raise ValueError(f"Event delivery id: {delivery_id} has no payload.")
             data = delivery.payload.get_payload()
-            # Convert payload to bytes if it's not already.
-            data = data if isinstance(data, bytes) else data.encode("utf-8")
-            # Count payload size in bytes.
-            payload_size = len(data)
-
-            if attempt_count == 0:
-                record_first_delivery_attempt_delay(
-                    delivery.created_at, delivery.event_type, webhook.app
-                )
+        except ValueError as e:
+            response = WebhookResponse(
+                content=str(e), status=EventDeliveryStatus.FAILED
+            )
+            attempt = attempts_for_deliveries[delivery_id]
+            attempt_update(attempt, response, with_save=False)
+            failed_deliveries_attempts.append(
+                (delivery, attempt, delivery_with_count.count)
+            )
+            observability.report_event_delivery_attempt(attempt)
+            successful_deliveries.append(delivery)
+            continue
+        # Convert payload to bytes if it's not already.
+        payloads[delivery_id] = (
+            data if isinstance(data, bytes) else data.encode("utf-8")
+        )
+        if delivery_with_count.count == 0:
+            record_first_delivery_attempt_delay(
+                delivery.created_at, delivery.event_type, delivery.webhook.app
+            )
+
+    def send_delivery(delivery: EventDelivery, data: bytes) -> WebhookResponse:
+        webhook = delivery.webhook
+        try:
             with webhooks_otel_trace(
                 delivery.event_type,
-                payload_size,
+                len(data),
                 webhook.app,
                 span_links=telemetry_context.links,
             ):
-                response = send_webhook_using_scheme_method(
+                return send_webhook_using_scheme_method(
                     webhook.target_url,
                     domain,
                     webhook.secret_key,
@@ -727,35 +754,50 @@ def send_webhooks_async_for_app(
                     data,
                     webhook.custom_headers,
                 )
+        except ValueError as e:
+            return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
+
+    responses = dispatch_concurrently(
+        [
+            partial(send_delivery, deliveries[delivery_id].delivery, data)
+            for delivery_id, data in payloads.items()
+        ]
+    )
 
-            record_external_request(
+    for delivery_id, dispatched_response in zip(payloads, responses, strict=True):
+        # Deliveries are dispatched without a deadline, so each of them has a
+        # response; a missing one is treated as a failed attempt.
+        response = dispatched_response or WebhookResponse(
+            content="Webhook delivery was not sent.",
+            status=EventDeliveryStatus.FAILED,
+        )
+        delivery = deliveries[delivery_id].delivery
+        attempt_count = deliveries[delivery_id].count
+        attempt = attempts_for_deliveries[delivery_id]
+        webhook = delivery.webhook
+
+        record_external_request(
+            delivery.event_type,
+            webhook.target_url,
+            response,
+            len(payloads[delivery_id]),
+            webhook.app,
+            sync=False,
+        )
+        if response.status == EventDeliveryStatus.FAILED:
+            attempt_update(attempt, response, with_save=False)
+            failed_deliveries_attempts.append((delivery, attempt, attempt_count))
+        elif response.status == EventDeliveryStatus.SUCCESS:
+            task_logger.info(
+                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+                webhook.id,
+                sanitize_url_for_logging(webhook.target_url),
                 delivery.event_type,
-                webhook.target_url,
-                response,
-                payload_size,
-                webhook.app,
-                sync=False,
-            )
-            if response.status == EventDeliveryStatus.FAILED:
-                attempt_update(attempt, response, with_save=False)
-                failed_deliveries_attempts.append((delivery, attempt, attempt_count))
-            elif response.status == EventDeliveryStatus.SUCCESS:
-                task_logger.info(
-                    "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
-                    webhook.id,
-                    sanitize_url_for_logging(webhook.target_url),
-                    delivery.event_type,
-                    delivery.id,
-                )
-                delivery.status = EventDeliveryStatus.SUCCESS
-                # update attempt without save to provide proper data in observability
-                attempt_update(attempt, response, with_save=False)
-        except ValueError as e:
-            response = WebhookResponse(
-                content=str(e), status=EventDeliveryStatus.FAILED
+                delivery.id,
             )
+            delivery.status = EventDeliveryStatus.SUCCESS
+            # update attempt without save to provide proper data in observability
             attempt_update(attempt, response, with_save=False)
-            failed_deliveries_attempts.append((delivery, attempt, attempt_count))
 
         observability.report_event_delivery_attempt(attempt)
         successful_deliveries.append(delivery)
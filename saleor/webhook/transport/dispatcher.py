@@ -0,0 +1,79 @@
+import asyncio
+import contextvars
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+ASYNC_EXECUTOR = "async"
+SYNC_EXECUTOR = "sync"
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _get_executor(name: str) -> ThreadPoolExecutor:
+    # Created lazily, so each forked worker process gets its own threads.
+    with _executor_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            max_workers = (
+                settings.WEBHOOK_SYNC_PARALLEL_MAX_THREADS
+                if name == SYNC_EXECUTOR
+                else settings.WEBHOOK_ASYNC_DISPATCH_CONCURRENCY
+            )
+            executor = _executors[name] = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"webhook-dispatcher-{name}",
+            )
+        return executor
+
+
+async def _dispatch[T](
+    calls: Sequence[Callable[[], T]],
+    concurrency: int,
+    deadline: float | None,
+    default: T | None,
+    executor_name: str,
+) -> list[T | None]:
+    loop = asyncio.get_running_loop()
+    executor = _get_executor(executor_name)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(call: Callable[[], T]) -> T:
+        async with semaphore:
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(executor, context.run, call)
+
+    tasks = [asyncio.ensure_future(run(call)) for call in calls]
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in pending:
+        task.cancel()
+    return [task.result() if task in done else default for task in tasks]
+
+
+def dispatch_concurrently[T](
+    calls: Sequence[Callable[[], T]],
+    concurrency: int | None = None,
+    timeout: float | None = None,
+    default: T | None = None,
+    executor_name: str = ASYNC_EXECUTOR,
+) -> list[T | None]:
+    """Run blocking calls concurrently and return their results in the same order.
+
+    At most `concurrency` calls run at the same time, each in a thread of the
+    process-wide pool named `executor_name`, which also caps the number of calls
+    running at once. Synchronous webhooks use their own
+    pool, so they don't wait for threads busy with async deliveries. The calls must
+    not use the database, as Django connections are not shared between threads.
+
+    When `timeout` is provided, `default` is returned for calls that didn't finish
+    within `timeout` seconds; such calls are not interrupted, but their results are
+    discarded, and they keep their threads until they finish.
+    """
+    if concurrency is None:
+        concurrency = settings.WEBHOOK_ASYNC_DISPATCH_CONCURRENCY
+    if concurrency <= 1 or len(calls) <= 1:
+        return [call() for call in calls]
+    return asyncio.run(_dispatch(calls, concurrency, timeout, default, executor_name))
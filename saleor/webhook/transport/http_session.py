@@ -0,0 +1,167 @@
+import collections
+import dataclasses
+import threading
+import time
+import weakref
+from urllib.parse import urlparse
+
+from django.conf import settings
+from opentelemetry.semconv.attributes import server_attributes
+from opentelemetry.util.types import Attributes
+from requests import Response
+from requests.adapters import DEFAULT_POOLSIZE
+from requests_hardened import HTTPSession
+
+from ...core.http_client import HTTPClient
+from ...core.telemetry import MetricType, Scope, Unit, meter, saleor_attributes
+
+METRIC_WEBHOOK_HTTP_REQUEST_COUNT = meter.create_metric(
+    "saleor.webhook.http.request_count",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.REQUEST,
+    description="Number of webhook requests sent using pooled HTTP sessions.",
+)
+
+METRIC_WEBHOOK_HTTP_CONNECTION_COUNT = meter.create_metric(
+    "saleor.webhook.http.connection_count",
+    scope=Scope.CORE,
+    type=MetricType.COUNTER,
+    unit=Unit.EVENT,
+    description="Number of new connections opened by pooled HTTP sessions.",
+)
+
+METRIC_WEBHOOK_HTTP_SESSION_COUNT = meter.create_metric(
+    "saleor.webhook.http.session_count",
+    scope=Scope.CORE,
+    type=MetricType.UP_DOWN_COUNTER,
+    unit=Unit.EVENT,
+    description="Number of open pooled HTTP sessions.",
+)
+
+
+@dataclasses.dataclass
+class PooledSession:
+    session: HTTPSession
+    config: tuple
+    last_used: float
+
+
+class WebhookSessionPool:
+    """Keep one HTTP session with a connection pool per target host.
+
+    Sessions are kept per thread, so each worker process or thread reuses its own
+    connections, and are closed when the thread ends. Sessions idle for longer than
+    `keep_alive` seconds are replaced on the next request, and the least recently
+    used ones are closed when more than `max_hosts` hosts are in use.
+    """
+
+    def __init__(self, *, max_hosts: int, pool_maxsize: int, keep_alive: float):
+        self.max_hosts = max_hosts
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self._local = threading.local()
+
+    @property
+    def _sessions(self) -> collections.OrderedDict[str, PooledSession]:
+        sessions = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = collections.OrderedDict()
+            # Thread-local values are dropped without closing the sessions when the
+            # thread ends, which would leave the count of open sessions too high.
+            finalizer = weakref.finalize(
+                threading.current_thread(), self._close_all, sessions
+            )
+            finalizer.atexit = False
+        return sessions
+
+    def get_session(self, url: str) -> HTTPSession:
+        parsed_url = urlparse(url)
+        key = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        config = dataclasses.astuple(HTTPClient.config)
+        now = time.monotonic()
+        sessions = self._sessions
+        pooled = sessions.get(key)
+        if pooled and (
+            pooled.config != config or now - pooled.last_used > self.keep_alive
+        ):
+            self._close(sessions.pop(key))
+            pooled = None
+        if pooled is None:
+            pooled = sessions[key] = PooledSession(
+                session=self._create_session(), config=config, last_used=now
+            )
+            meter.record(METRIC_WEBHOOK_HTTP_SESSION_COUNT, 1, Unit.EVENT)
+        pooled.last_used = now
+        sessions.move_to_end(key)
+        while len(sessions) > self.max_hosts:
+            _, evicted = sessions.popitem(last=False)
+            self._close(evicted)
+        return pooled.session
+
+    def send_request(self, method: str, url: str, **kwargs) -> Response:
+        session = self.get_session(url)
+        connections_before = _get_pool_connection_counts(session)
+        response = session.request(method, url, **kwargs)
+        new_connections = _count_new_connections(session, connections_before)
+        attributes: Attributes = {
+            server_attributes.SERVER_ADDRESS: urlparse(url).hostname or "",
+            saleor_attributes.SALEOR_WEBHOOK_CONNECTION_REUSED: not new_connections,
+        }
+        meter.record(
+            METRIC_WEBHOOK_HTTP_REQUEST_COUNT, 1, Unit.REQUEST, attributes=attributes
+        )
+        if new_connections:
+            meter.record(
+                METRIC_WEBHOOK_HTTP_CONNECTION_COUNT,
+                new_connections,
+                Unit.EVENT,
+                attributes=attributes,
+            )
+        return response
+
+    def close(self):
+        self._close_all(self._sessions)
+
+    def _close_all(self, sessions: collections.OrderedDict[str, PooledSession]):
+        while sessions:
+            _, pooled = sessions.popitem()
+            self._close(pooled)
+
+    def _create_session(self) -> HTTPSession:
+        session = HTTPClient.get_session()
+        for adapter in session.adapters.values():
+            # Keep up to `pool_maxsize` connections to each resolved address of the
+            # host alive between requests.
+            adapter.init_poolmanager(DEFAULT_POOLSIZE, self.pool_maxsize)
+        return session
+
+    def _close(self, pooled: PooledSession):
+        pooled.session.close()
+        meter.record(METRIC_WEBHOOK_HTTP_SESSION_COUNT, -1, Unit.EVENT)
+
+
+def _get_pool_connection_counts(session: HTTPSession) -> dict[int, int]:
+    counts = {}
+    for adapter in session.adapters.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                counts[id(pool)] = pool.num_connections
+    return counts
+
+
+def _count_new_connections(session: HTTPSession, counts_before: dict[int, int]) -> int:
+    counts_after = _get_pool_connection_counts(session)
+    return sum(
+        max(count - counts_before.get(pool_id, 0), 0)
+        for pool_id, count in counts_after.items()
+    )
+
+
+webhook_session_pool = WebhookSessionPool(
+    max_hosts=settings.WEBHOOK_HTTP_POOL_MAX_HOSTS,
+    pool_maxsize=settings.WEBHOOK_HTTP_POOL_MAXSIZE,
+    keep_alive=settings.WEBHOOK_HTTP_KEEP_ALIVE_TIMEOUT,
+)
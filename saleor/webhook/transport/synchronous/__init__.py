@@ -2,10 +2,12 @@ from .transport import (
     trigger_taxes_all_webhooks_sync,
     trigger_webhook_sync,
     trigger_webhook_sync_if_not_cached,
+    trigger_webhooks_sync_if_not_cached,
 )
 
 __all__ = [
     "trigger_taxes_all_webhooks_sync",
     "trigger_webhook_sync",
     "trigger_webhook_sync_if_not_cached",
+    "trigger_webhooks_sync_if_not_cached",
 ]
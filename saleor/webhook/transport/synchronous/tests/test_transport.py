@@ -1,18 +1,27 @@
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 from opentelemetry.trace import StatusCode
 
-from .....core.models import EventDeliveryStatus
+from .....core.models import EventDelivery, EventDeliveryStatus
 from .....core.telemetry import set_global_attributes
 from .....tests.utils import get_metric_data_point
+from .... import const
+from ....event_types import WebhookEventSyncType
+from ....models import Webhook, WebhookEvent
 from ...metrics import (
     METRIC_EXTERNAL_REQUEST_BODY_SIZE,
     METRIC_EXTERNAL_REQUEST_COUNT,
     METRIC_EXTERNAL_REQUEST_DURATION,
 )
 from ...utils import WebhookResponse
-from ..transport import _send_webhook_request_sync
+from ..transport import (
+    _send_webhook_request_sync,
+    generate_cache_key_for_webhook,
+    trigger_webhooks_sync_if_not_cached,
+)
 
 
 @patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
@@ -269,3 +278,153 @@ def test_send_webhook_request_sync_record_external_request_with_unknown_webhook_
     assert external_request_content_length.attributes == attributes
     assert external_request_content_length.count == 1
     assert external_request_content_length.sum == payload_size
+
+
+@pytest.fixture
+def shipping_list_methods_webhooks(app):
+    webhooks = Webhook.objects.bulk_create(
+        Webhook(
+            name=f"Shipping webhook no {i}",
+            app=app,
+            target_url=f"https://www.example.com/shipping-{i}",
+        )
+        for i in range(3)
+    )
+    WebhookEvent.objects.bulk_create(
+        WebhookEvent(
+            event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+            webhook=webhook,
+        )
+        for webhook in webhooks
+    )
+    return webhooks
+
+
+@patch("saleor.webhook.transport.synchronous.transport.cache")
+@patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_webhooks_sync_concurrently_with_sequential_async_dispatch(
+    mock_send_webhook_using_http,
+    mock_cache,
+    shipping_list_methods_webhooks,
+    settings,
+):
+    # given
+    settings.WEBHOOK_SYNC_PARALLEL_ENABLED = True
+    settings.WEBHOOK_ASYNC_DISPATCH_CONCURRENCY = 1
+    mock_cache.get_many.return_value = {}
+    barrier = threading.Barrier(len(shipping_list_methods_webhooks), timeout=5)
+    thread_names = set()
+
+    def send_webhook(*args, **kwargs):
+        # Passes only when all requests are sent at the same time.
+        barrier.wait()
+        thread_names.add(threading.current_thread().name)
+        return WebhookResponse(content=json.dumps({"sent": True}))
+
+    mock_send_webhook_using_http.side_effect = send_webhook
+
+    # when
+    responses = trigger_webhooks_sync_if_not_cached(
+        WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+        '{"key": "value"}',
+        shipping_list_methods_webhooks,
+        {"key": "value"},
+        allow_replica=False,
+    )
+
+    # then
+    assert responses == [
+        (webhook, {"sent": True}) for webhook in shipping_list_methods_webhooks
+    ]
+    assert all(name.startswith("webhook-dispatcher-sync") for name in thread_names)
+
+
+@patch("saleor.webhook.transport.synchronous.transport.cache")
+@patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_webhooks_sync_if_not_cached_sends_requests_concurrently(
+    mock_send_webhook_using_http,
+    mock_cache,
+    shipping_list_methods_webhooks,
+    settings,
+):
+    # given
+    settings.WEBHOOK_SYNC_PARALLEL_ENABLED = True
+    event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    payload = '{"key": "value"}'
+    cache_data = {"key": "value"}
+    cached_webhook, successful_webhook, failed_webhook = shipping_list_methods_webhooks
+    cache_keys = [
+        generate_cache_key_for_webhook(
+            cache_data, webhook.target_url, event_type, webhook.app_id
+        )
+        for webhook in shipping_list_methods_webhooks
+    ]
+    mock_cache.get_many.return_value = {cache_keys[0]: {"cached": True}}
+
+    def send_webhook(target_url, *args, **kwargs):
+        if target_url == successful_webhook.target_url:
+            return WebhookResponse(content=json.dumps({"sent": True}))
+        return WebhookResponse(content="", status=EventDeliveryStatus.FAILED)
+
+    mock_send_webhook_using_http.side_effect = send_webhook
+
+    # when
+    responses = trigger_webhooks_sync_if_not_cached(
+        event_type,
+        payload,
+        shipping_list_methods_webhooks,
+        cache_data,
+        allow_replica=False,
+        cache_timeout=10,
+    )
+
+    # then
+    assert responses == [
+        (cached_webhook, {"cached": True}),
+        (successful_webhook, {"sent": True}),
+        (failed_webhook, None),
+    ]
+    assert mock_send_webhook_using_http.call_count == 2
+    mock_cache.get_many.assert_called_once()
+    mock_cache.get.assert_not_called()
+    mock_cache.set_many.assert_any_call({cache_keys[1]: {"sent": True}}, timeout=10)
+    mock_cache.set_many.assert_any_call(
+        {cache_keys[2]: const.SYNC_WEBHOOK_FAILURE_SENTINEL},
+        timeout=const.SYNC_WEBHOOK_FAILURE_CACHE_TTL,
+    )
+    assert EventDelivery.objects.count() == 1
+    assert EventDelivery.objects.get().webhook == failed_webhook
+
+
+@patch("saleor.webhook.transport.synchronous.transport.cache")
+@patch("saleor.webhook.transport.synchronous.transport.send_webhook_using_http")
+def test_trigger_webhooks_sync_if_not_cached_skips_recently_failed_webhooks(
+    mock_send_webhook_using_http,
+    mock_cache,
+    shipping_list_methods_webhooks,
+    settings,
+):
+    # given
+    settings.WEBHOOK_SYNC_PARALLEL_ENABLED = True
+    event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+    cache_data = {"key": "value"}
+    mock_cache.get_many.return_value = {
+        generate_cache_key_for_webhook(
+            cache_data, webhook.target_url, event_type, webhook.app_id
+        ): const.SYNC_WEBHOOK_FAILURE_SENTINEL
+        for webhook in shipping_list_methods_webhooks
+    }
+
+    # when
+    responses = trigger_webhooks_sync_if_not_cached(
+        event_type,
+        '{"key": "value"}',
+        shipping_list_methods_webhooks,
+        cache_data,
+        allow_replica=False,
+    )
+
+    # then
+    assert responses == [(webhook, None) for webhook in shipping_list_methods_webhooks]
+    mock_send_webhook_using_http.assert_not_called()
+    mock_cache.set_many.assert_not_called()
@@ -1,6 +1,8 @@
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from functools import partial
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlparse
@@ -14,7 +16,7 @@ from pydantic import ValidationError
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
 from ....core.db.connection import allow_writer
-from ....core.models import EventDelivery, EventPayload
+from ....core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ....core.taxes import TaxData
 from ....core.tracing import webhooks_otel_trace
 from ....core.utils import get_domain
@@ -42,6 +44,7 @@ from ...event_types import WebhookEventSyncType
 from ...payloads import generate_transaction_action_request_payload
 from ...utils import get_webhooks_for_event
 from .. import signature_for_payload
+from ..dispatcher import SYNC_EXECUTOR, dispatch_concurrently
 from ..metrics import record_external_request
 from ..taxes import parse_tax_data
 from ..utils import (
@@ -101,27 +104,29 @@ def handle_transaction_request_task(self, delivery_id, request_event_id) -> None
     )
 
 
-def _send_webhook_request_sync(
-    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
-) -> tuple[WebhookResponse, dict[Any, Any] | None]:
+@dataclass
+class SyncWebhookRequest:
+    delivery: EventDelivery
+    attempt: EventDeliveryAttempt
+    message: bytes
+    signature: str
+    domain: str
+
+
+def _prepare_sync_webhook_request(delivery, attempt=None) -> SyncWebhookRequest:
     event_payload = delivery.payload
     data = event_payload.get_payload()
     webhook = delivery.webhook
     parts = urlparse(webhook.target_url)
-    domain = get_domain()
     message = data.encode("utf-8")
-    payload_size = len(message)
-    signature = signature_for_payload(message, webhook.secret_key)
-    response = WebhookResponse(content="", status=EventDeliveryStatus.FAILED)
-    response_data = None
 
     if parts.scheme.lower() not in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
         delivery_update(delivery, EventDeliveryStatus.FAILED)
         record_external_request(
             delivery.event_type,
             webhook.target_url,
-            response,
-            payload_size,
+            WebhookResponse(content="", status=EventDeliveryStatus.FAILED),
+            len(message),
             webhook.app,
             sync=True,
         )
@@ -135,15 +140,34 @@ def _send_webhook_request_sync(
     if attempt is None:
         attempt = create_attempt(delivery=delivery, task_id=None, with_save=False)
 
+    return SyncWebhookRequest(
+        delivery=delivery,
+        attempt=attempt,
+        message=message,
+        signature=signature_for_payload(message, webhook.secret_key),
+        domain=get_domain(),
+    )
+
+
+def _send_sync_webhook_request(
+    request: SyncWebhookRequest, timeout=settings.WEBHOOK_SYNC_TIMEOUT
+) -> tuple[WebhookResponse, dict[Any, Any] | None]:
+    """Send the prepared request; doesn't use the database."""
+    delivery = request.delivery
+    webhook = delivery.webhook
+    payload_size = len(request.message)
+    response = WebhookResponse(content="", status=EventDeliveryStatus.FAILED)
+    response_data = None
+
     with webhooks_otel_trace(
         delivery.event_type, payload_size, webhook.app, sync=True
     ) as span:
         try:
             response = send_webhook_using_http(
                 webhook.target_url,
-                message,
-                domain,
-                signature,
+                request.message,
+                request.domain,
+                request.signature,
                 delivery.event_type,
                 timeout=timeout,
                 custom_headers=webhook.custom_headers,
@@ -155,7 +179,7 @@ def _send_webhook_request_sync(
                 "ID of failed DeliveryAttempt: %r . ",
                 sanitize_url_for_logging(webhook.target_url),
                 e,
-                attempt.id,
+                request.attempt.id,
             )
             response.status = EventDeliveryStatus.FAILED
         else:
@@ -165,13 +189,13 @@ def _send_webhook_request_sync(
                     "ID of failed DeliveryAttempt: %r . ",
                     sanitize_url_for_logging(webhook.target_url),
                     response.content,
-                    attempt.id,
+                    request.attempt.id,
                 )
             if response.status == EventDeliveryStatus.SUCCESS:
                 logger.debug(
                     "[Webhook] Success response from %r.Successful DeliveryAttempt id: %r",
                     sanitize_url_for_logging(webhook.target_url),
-                    attempt.id,
+                    request.attempt.id,
                 )
         finally:
             if response.status == EventDeliveryStatus.FAILED:
@@ -185,14 +209,64 @@ def _send_webhook_request_sync(
                 sync=True,
             )
 
-    attempt_update(attempt, response)
-    delivery_update(delivery, response.status)
-    observability.report_event_delivery_attempt(attempt)
-    save_unsuccessful_delivery_attempt(attempt)
-    clear_successful_delivery(delivery)
     return response, response_data
 
 
+def _finish_sync_webhook_request(
+    request: SyncWebhookRequest, response: WebhookResponse
+):
+    attempt_update(request.attempt, response)
+    delivery_update(request.delivery, response.status)
+    observability.report_event_delivery_attempt(request.attempt)
+    save_unsuccessful_delivery_attempt(request.attempt)
+    clear_successful_delivery(request.delivery)
+
+
+def _send_webhook_request_sync(
+    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
+) -> tuple[WebhookResponse, dict[Any, Any] | None]:
+    request = _prepare_sync_webhook_request(delivery, attempt)
+    response, response_data = _send_sync_webhook_request(request, timeout)
+    _finish_sync_webhook_request(request, response)
+    return response, response_data
+
+
+def send_webhook_requests_sync_concurrently(
+    deliveries: list[EventDelivery], timeout=settings.WEBHOOK_SYNC_TIMEOUT
+) -> list[dict[Any, Any] | None]:
+    """Send synchronous webhook requests at the same time.
+
+    Payloads are prepared and attempts are saved in the current thread; only the
+    HTTP requests are sent concurrently. Responses not received within
+    `WEBHOOK_SYNC_PARALLEL_DEADLINE` are treated as failed.
+    """
+    requests = [_prepare_sync_webhook_request(delivery) for delivery in deliveries]
+    timed_out: tuple[WebhookResponse, dict[Any, Any] | None] = (
+        WebhookResponse(
+            content="Webhook response deadline exceeded.",
+            status=EventDeliveryStatus.FAILED,
+        ),
+        None,
+    )
+    # All requests are sent at once, in threads not shared with async deliveries,
+    # so the deadline doesn't depend on their concurrency settings.
+    results = dispatch_concurrently(
+        [partial(_send_sync_webhook_request, request, timeout) for request in requests],
+        concurrency=len(requests),
+        timeout=settings.WEBHOOK_SYNC_PARALLEL_DEADLINE,
+        default=timed_out,
+        executor_name=SYNC_EXECUTOR,
+    )
+    responses_data = []
+    for request, result in zip(requests, results, strict=True):
+        response, response_data = result or timed_out
+        _finish_sync_webhook_request(request, response)
+        responses_data.append(
+            response_data if response.status == EventDeliveryStatus.SUCCESS else None
+        )
+    return responses_data
+
+
 def send_webhook_request_sync(
     delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT
 ) -> dict[Any, Any] | None:
@@ -258,6 +332,133 @@ def trigger_webhook_sync_if_not_cached(
     return response_data
 
 
+def trigger_webhooks_sync_if_not_cached(
+    event_type: str,
+    payload: str,
+    webhooks: Iterable["Webhook"],
+    cache_data: dict,
+    allow_replica: bool,
+    subscribable_object=None,
+    request_timeout=None,
+    cache_timeout=None,
+    requestor=None,
+    pregenerated_subscription_payloads: dict | None = None,
+) -> list[tuple["Webhook", dict | None]]:
+    """Get responses of multiple synchronous webhooks.
+
+    When `WEBHOOK_SYNC_PARALLEL_ENABLED` is set, cached responses are fetched with a
+    single cache query, the remaining webhooks are called concurrently and their
+    responses are cached together. Otherwise, webhooks are called one by one with
+    `trigger_webhook_sync_if_not_cached`.
+    """
+    if pregenerated_subscription_payloads is None:
+        pregenerated_subscription_payloads = {}
+
+    if not settings.WEBHOOK_SYNC_PARALLEL_ENABLED:
+        return [
+            (
+                webhook,
+                trigger_webhook_sync_if_not_cached(
+                    event_type=event_type,
+                    payload=payload,
+                    webhook=webhook,
+                    cache_data=cache_data,
+                    allow_replica=allow_replica,
+                    subscribable_object=subscribable_object,
+                    request_timeout=request_timeout,
+                    cache_timeout=cache_timeout,
+                    requestor=requestor,
+                    pregenerated_subscription_payload=get_pregenerated_subscription_payload(
+                        webhook, pregenerated_subscription_payloads
+                    ),
+                ),
+            )
+            for webhook in webhooks
+        ]
+
+    webhooks = list(webhooks)
+    cache_keys = {
+        webhook.id: generate_cache_key_for_webhook(
+            cache_data, webhook.target_url, event_type, webhook.app_id
+        )
+        for webhook in webhooks
+    }
+    cached_responses = cache.get_many(cache_keys.values())
+    responses: dict[int, dict | None] = {}
+    deliveries_to_send: list[tuple[Webhook, EventDelivery, bool]] = []
+    for webhook in webhooks:
+        response_data = cached_responses.get(cache_keys[webhook.id])
+        if response_data == const.SYNC_WEBHOOK_FAILURE_SENTINEL:
+            # Prevent sending webhook if the previous one failed recently.
+            logger.warning(
+                "[Webhook] Skipping request to %s for event %s due to previous "
+                "failure.",
+                sanitize_url_for_logging(webhook.target_url),
+                event_type,
+            )
+            responses[webhook.id] = None
+            continue
+        if response_data is not None:
+            responses[webhook.id] = response_data
+            continue
+
+        allowed, monitored = (
+            breaker_board.check_webhook(event_type, webhook)
+            if breaker_board
+            else (True, False)
+        )
+        delivery = (
+            _create_sync_delivery(
+                event_type,
+                payload,
+                webhook,
+                allow_replica,
+                subscribable_object=subscribable_object,
+                requestor=requestor,
+                pregenerated_subscription_payload=get_pregenerated_subscription_payload(
+                    webhook, pregenerated_subscription_payloads
+                ),
+            )
+            if allowed
+            else None
+        )
+        if delivery is None:
+            responses[webhook.id] = None
+            if monitored and breaker_board:
+                breaker_board.register_response(webhook.app_id, None)
+        else:
+            deliveries_to_send.append((webhook, delivery, monitored))
+
+    kwargs = {"timeout": request_timeout} if request_timeout else {}
+    sent_responses = send_webhook_requests_sync_concurrently(
+        [delivery for _, delivery, _ in deliveries_to_send], **kwargs
+    )
+    for (webhook, _, monitored), response_data in zip(
+        deliveries_to_send, sent_responses, strict=True
+    ):
+        responses[webhook.id] = response_data
+        if monitored and breaker_board:
+            breaker_board.register_response(webhook.app_id, response_data)
+
+    responses_to_cache = {}
+    failures_to_cache = {}
+    for webhook in webhooks:
+        cache_key = cache_keys[webhook.id]
+        if cache_key in cached_responses:
+            continue
+        if responses[webhook.id] is None:
+            failures_to_cache[cache_key] = const.SYNC_WEBHOOK_FAILURE_SENTINEL
+        else:
+            responses_to_cache[cache_key] = responses[webhook.id]
+    if responses_to_cache:
+        cache.set_many(
+            responses_to_cache, timeout=cache_timeout or const.WEBHOOK_CACHE_DEFAULT_TTL
+        )
+    if failures_to_cache:
+        cache.set_many(failures_to_cache, timeout=const.SYNC_WEBHOOK_FAILURE_CACHE_TTL)
+    return [(webhook, responses[webhook.id]) for webhook in webhooks]
+
+
 def create_delivery_for_subscription_sync_event(
     event_type,
     subscribable_object,
@@ -329,20 +530,18 @@ def create_delivery_for_subscription_sync_event(
     return event_delivery
 
 
-def trigger_webhook_sync(
+def _create_sync_delivery(
     event_type: str,
     payload: str,
     webhook: "Webhook",
     allow_replica,
     subscribable_object=None,
-    timeout=None,
     request=None,
     requestor=None,
     pregenerated_subscription_payload: dict | None = None,
-) -> dict[Any, Any] | None:
-    """Send a synchronous webhook request."""
+) -> EventDelivery | None:
     if webhook.subscription_query:
-        delivery = create_delivery_for_subscription_sync_event(
+        return create_delivery_for_subscription_sync_event(
             event_type=event_type,
             subscribable_object=subscribable_object,
             webhook=webhook,
@@ -352,15 +551,38 @@ def trigger_webhook_sync(
             pregenerated_payload=pregenerated_subscription_payload,
             with_save=False,
         )
-        if not delivery:
-            return None
-    else:
-        delivery = EventDelivery(
-            status=EventDeliveryStatus.PENDING,
-            event_type=event_type,
-            payload=EventPayload(payload=payload),
-            webhook=webhook,
-        )
+    return EventDelivery(
+        status=EventDeliveryStatus.PENDING,
+        event_type=event_type,
+        payload=EventPayload(payload=payload),
+        webhook=webhook,
+    )
+
+
+def trigger_webhook_sync(
+    event_type: str,
+    payload: str,
+    webhook: "Webhook",
+    allow_replica,
+    subscribable_object=None,
+    timeout=None,
+    request=None,
+    requestor=None,
+    pregenerated_subscription_payload: dict | None = None,
+) -> dict[Any, Any] | None:
+    """Send a synchronous webhook request."""
+    delivery = _create_sync_delivery(
+        event_type,
+        payload,
+        webhook,
+        allow_replica,
+        subscribable_object=subscribable_object,
+        request=request,
+        requestor=requestor,
+        pregenerated_subscription_payload=pregenerated_subscription_payload,
+    )
+    if not delivery:
+        return None
 
     kwargs = {}
     if timeout:
@@ -373,25 +595,13 @@ if breaker_board := initialize_breaker_board():
     trigger_webhook_sync = breaker_board(trigger_webhook_sync)
 
 
-def trigger_taxes_all_webhooks_sync(
+def _generate_tax_deliveries(
     event_type: str,
     generate_payload: Callable,
-    expected_lines_count: int,
-    subscribable_object=None,
-    requestor=None,
-    pregenerated_subscription_payloads: dict | None = None,
-) -> TaxData | None:
-    """Send all synchronous webhook request for given event type.
-
-    Requests are send sequentially.
-    If the current webhook does not return expected response,
-    the next one is send.
-    If no webhook responds with expected response,
-    this function returns None.
-    """
-    if pregenerated_subscription_payloads is None:
-        pregenerated_subscription_payloads = {}
-
+    subscribable_object,
+    requestor,
+    pregenerated_subscription_payloads: dict,
+) -> Iterator[EventDelivery]:
     webhooks = get_webhooks_for_event(event_type)
     request_context = None
     event_payload = None
@@ -418,7 +628,7 @@ def trigger_taxes_all_webhooks_sync(
                 with_save=False,
             )
             if not delivery:
-                return None
+                return
         else:
             if event_payload is None:
                 event_payload = EventPayload(payload=generate_payload())
@@ -428,19 +638,70 @@ def trigger_taxes_all_webhooks_sync(
                 payload=event_payload,
                 webhook=webhook,
             )
+        yield delivery
 
-        response_data = send_webhook_request_sync(delivery)
-        try:
-            parsed_response = parse_tax_data(response_data, expected_lines_count)
-        except ValidationError as e:
-            logger.warning(
-                "Webhook response for event %s is invalid: %s",
-                event_type,
-                str(e),
-                extra={"errors": e.errors()},
+
+def _parse_tax_response(
+    event_type: str, response_data, expected_lines_count: int
+) -> TaxData | None:
+    try:
+        return parse_tax_data(response_data, expected_lines_count)
+    except ValidationError as e:
+        logger.warning(
+            "Webhook response for event %s is invalid: %s",
+            event_type,
+            str(e),
+            extra={"errors": e.errors()},
+        )
+        return None
+
+
+def trigger_taxes_all_webhooks_sync(
+    event_type: str,
+    generate_payload: Callable,
+    expected_lines_count: int,
+    subscribable_object=None,
+    requestor=None,
+    pregenerated_subscription_payloads: dict | None = None,
+) -> TaxData | None:
+    """Send all synchronous webhook request for given event type.
+
+    Requests are send sequentially.
+    If the current webhook does not return expected response,
+    the next one is send.
+    If no webhook responds with expected response,
+    this function returns None.
+
+    When `WEBHOOK_SYNC_PARALLEL_ENABLED` is set, requests are sent to all webhooks
+    at the same time and the first valid response, in the webhooks order, is used.
+    """
+    if pregenerated_subscription_payloads is None:
+        pregenerated_subscription_payloads = {}
+
+    deliveries = _generate_tax_deliveries(
+        event_type,
+        generate_payload,
+        subscribable_object,
+        requestor,
+        pregenerated_subscription_payloads,
+    )
+    if settings.WEBHOOK_SYNC_PARALLEL_ENABLED:
+        responses_data = send_webhook_requests_sync_concurrently(list(deliveries))
+        for response_data in responses_data:
+            parsed_response = _parse_tax_response(
+                event_type, response_data, expected_lines_count
             )
-            continue
-        return parsed_response
+            if parsed_response is not None:
+                return parsed_response
+        return None
+
+    for delivery in deliveries:
+        response_data = send_webhook_request_sync(delivery)
+        parsed_response = _parse_tax_response(
+            event_type, response_data, expected_lines_count
+        )
+        if parsed_response is not None:
+            return parsed_response
     return None
 
 
@@ -0,0 +1,76 @@
+import threading
+import time
+from functools import partial
+from unittest import mock
+
+from .. import dispatcher
+from ..dispatcher import dispatch_concurrently
+
+
+def test_dispatch_concurrently_returns_results_in_order():
+    # given
+    def call(value):
+        time.sleep(0.01 * (5 - value))
+        return value
+
+    # when
+    results = dispatch_concurrently([partial(call, i) for i in range(5)], 5)
+
+    # then
+    assert results == [0, 1, 2, 3, 4]
+
+
+def test_dispatch_concurrently_limits_concurrency(settings):
+    # given
+    settings.WEBHOOK_ASYNC_DISPATCH_CONCURRENCY = 4
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def call():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    # when
+    with mock.patch.dict(dispatcher._executors, clear=True):
+        dispatch_concurrently([call] * 8, 2)
+
+    # then
+    assert max_running == 2
+
+
+def test_dispatch_concurrently_runs_in_current_thread_without_concurrency():
+    # given
+    thread_ids = []
+
+    def call():
+        thread_ids.append(threading.get_ident())
+
+    # when
+    dispatch_concurrently([call] * 3, 1)
+
+    # then
+    assert thread_ids == [threading.get_ident()] * 3
+
+
+def test_dispatch_concurrently_returns_default_after_timeout():
+    # given
+    def fast_call():
+        return "fast"
+
+    def slow_call():
+        time.sleep(0.5)
+        return "slow"
+
+    # when
+    results = dispatch_concurrently(
+        [fast_call, slow_call], 2, timeout=0.1, default="timeout"
+    )
+
+    # then
+    assert results == ["fast", "timeout"]
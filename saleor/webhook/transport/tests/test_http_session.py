@@ -0,0 +1,136 @@
+import gc
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from ..http_session import WebhookSessionPool
+from ..utils import get_static_webhook_headers
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session_pool():
+    pool = WebhookSessionPool(max_hosts=2, pool_maxsize=2, keep_alive=60)
+    yield pool
+    pool.close()
+
+
+def test_get_session_reuses_session_per_host(session_pool):
+    # when
+    session = session_pool.get_session("https://example.com/webhook")
+    same_host_session = session_pool.get_session("https://example.com/other")
+    other_host_session = session_pool.get_session("https://other.com/webhook")
+
+    # then
+    assert session is same_host_session
+    assert session is not other_host_session
+
+
+def test_get_session_replaces_idle_session(session_pool):
+    # given
+    with patch("saleor.webhook.transport.http_session.time.monotonic") as monotonic:
+        monotonic.return_value = 100
+        session = session_pool.get_session("https://example.com/webhook")
+
+        # when
+        monotonic.return_value = 100 + session_pool.keep_alive + 1
+        new_session = session_pool.get_session("https://example.com/webhook")
+
+    # then
+    assert new_session is not session
+
+
+def test_get_session_closes_least_recently_used_session(session_pool):
+    # given
+    session = session_pool.get_session("https://example.com/webhook")
+    session_pool.get_session("https://other.com/webhook")
+
+    # when
+    with patch.object(session, "close") as close_mock:
+        session_pool.get_session("https://third.com/webhook")
+
+    # then
+    close_mock.assert_called_once_with()
+    assert session_pool.get_session("https://example.com/webhook") is not session
+
+
+def test_sessions_closed_when_thread_ends(session_pool):
+    # given
+    sessions = []
+    thread = threading.Thread(
+        target=lambda: sessions.append(
+            session_pool.get_session("https://example.com/webhook")
+        )
+    )
+    thread.start()
+    thread.join()
+
+    # when
+    with (
+        patch.object(sessions[0], "close") as close_mock,
+        patch("saleor.webhook.transport.http_session.meter.record") as record_mock,
+    ):
+        del thread
+        gc.collect()
+
+    # then
+    close_mock.assert_called_once_with()
+    assert record_mock.call_args.args[1] == -1
+
+
+def test_send_request_reuses_connection(session_pool, http_server):
+    # given
+    session_pool.send_request("POST", f"{http_server}/webhook", data="{}")
+
+    # when
+    with patch("saleor.webhook.transport.http_session.meter.record") as record_mock:
+        response = session_pool.send_request(
+            "POST", f"{http_server}/webhook", data="{}"
+        )
+
+    # then
+    assert response.status_code == 200
+    record_mock.assert_called_once()
+    assert record_mock.call_args.kwargs["attributes"][
+        "saleor.webhook.connection_reused"
+    ]
+
+
+def test_get_static_webhook_headers(settings):
+    # given
+    settings.PUBLIC_URL = None
+    settings.ENABLE_SSL = True
+
+    # when
+    headers = get_static_webhook_headers(
+        "example.com", settings.PUBLIC_URL, settings.ENABLE_SSL
+    )
+
+    # then
+    assert headers["Saleor-Api-Url"] == "https://example.com/graphql/"
+    assert headers["Saleor-Domain"] == "example.com"
@@ -6,6 +6,7 @@ from collections.abc import Callable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from time import time
 from typing import Optional
 from urllib.parse import unquote, urlparse, urlunparse
@@ -42,6 +43,7 @@ from .. import observability
 from ..const import APP_ID_PREFIX
 from ..models import Webhook
 from . import signature_for_payload
+from .http_session import webhook_session_pool
 
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(f"{__name__}.celery")
@@ -129,6 +131,23 @@ def generate_cache_key_for_webhook(
     )
 
 
+@lru_cache(maxsize=128)
+def get_static_webhook_headers(
+    domain: str, public_url: str | None, enable_ssl: bool
+) -> dict[str, str]:
+    """Return webhook headers that depend only on the Saleor domain.
+
+    `public_url` and `enable_ssl` are passed to invalidate the cache when the
+    settings used to build the API URL change.
+    """
+    return {
+        "Content-Type": "application/json",
+        DeprecatedAppHeaders.DOMAIN: domain,
+        AppHeaders.DOMAIN: domain,
+        AppHeaders.API_URL: build_absolute_uri(reverse("api"), domain),
+    }
+
+
 # TODO (PE-568): change typing of data to `bytes` to avoid unnecessary encoding.
 def send_webhook_using_http(
     target_url,
@@ -152,23 +171,23 @@ def send_webhook_using_http(
     :return: WebhookResponse object.
     """
     headers = {
-        "Content-Type": "application/json",
+        **get_static_webhook_headers(domain, settings.PUBLIC_URL, settings.ENABLE_SSL),
         # X- headers will be deprecated in Saleor 4.0, proper headers are without X-
         DeprecatedAppHeaders.EVENT_TYPE: event_type,
-        DeprecatedAppHeaders.DOMAIN: domain,
         DeprecatedAppHeaders.SIGNATURE: signature,
         AppHeaders.EVENT_TYPE: event_type,
-        AppHeaders.DOMAIN: domain,
         AppHeaders.SIGNATURE: signature,
-        AppHeaders.API_URL: build_absolute_uri(reverse("api"), domain),
     }
     tracer.inject_context(headers)
 
     if custom_headers:
         headers.update(custom_headers)
 
+    http_client = (
+        webhook_session_pool if settings.WEBHOOK_HTTP_POOL_ENABLED else HTTPClient
+    )
     try:
-        response = HTTPClient.send_request(
+        response = http_client.send_request(
             "POST",
             target_url,
             data=message,
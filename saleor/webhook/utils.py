@@ -7,12 +7,25 @@ from django.db.models import Q
 from django.db.models.expressions import Exists, OuterRef
 
 from ..app.models import App
+from ..core.db.connection import allow_writer
+from ..core.utils.cache import CacheDict, bump_cache_version, get_cache_version
 from .event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .models import Webhook, WebhookEvent
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
+WEBHOOK_EVENT_MAP_VERSION_KEY = "webhook-event-map-version"
+
+# Process-local cache of the webhooks active for the given set of events. Entries are
+# keyed by the version stored in the cache backend, so bumping the version in one
+# process invalidates the entries in all of them.
+_webhook_event_map_cache = CacheDict(
+    256,
+    timeout=settings.WEBHOOK_EVENT_MAP_CACHE_TIMEOUT,
+    name="webhook_event_map",
+)
+
 
 def get_filter_for_single_webhook_event(
     event_type: str,
@@ -81,6 +94,22 @@ def get_webhooks_for_event(
     )
 
 
+def get_webhook_event_map_version() -> int:
+    return get_cache_version(WEBHOOK_EVENT_MAP_VERSION_KEY)
+
+
+def invalidate_webhook_event_map():
+    """Invalidate cached webhooks of events in all processes.
+
+    Should be called after the transaction that changes webhooks, their events,
+    apps or app permissions is committed.
+    """
+    if not settings.WEBHOOK_EVENT_MAP_CACHE_ENABLED:
+        return
+    bump_cache_version(WEBHOOK_EVENT_MAP_VERSION_KEY)
+    _webhook_event_map_cache.clear()
+
+
 def get_webhooks_for_multiple_events(
     event_types: Iterable[str],
 ) -> dict[str, set[Webhook]]:
@@ -88,8 +117,34 @@ def get_webhooks_for_multiple_events(
     if set_event_types.intersection(WebhookEventAsyncType.ALL):
         set_event_types.add(WebhookEventAsyncType.ANY)
 
+    if not settings.WEBHOOK_EVENT_MAP_CACHE_ENABLED:
+        return _fetch_webhooks_for_multiple_events(
+            set_event_types, settings.DATABASE_CONNECTION_REPLICA_NAME
+        )
+
+    key = (get_webhook_event_map_version(), frozenset(set_event_types))
+    event_map = _webhook_event_map_cache.get(key)
+    if event_map is None:
+        # The map is read from the writer, as the replica could still return the
+        # data from before the change that invalidated the cache.
+        with allow_writer():
+            event_map = _fetch_webhooks_for_multiple_events(
+                set_event_types, settings.DATABASE_CONNECTION_DEFAULT_NAME
+            )
+        _webhook_event_map_cache[key] = event_map
+    # Return new sets, so the callers can't modify the cached map. The `Webhook`
+    # instances and their apps are shared with other callers and must not be
+    # modified.
+    return defaultdict(
+        set, {event: set(webhooks) for event, webhooks in event_map.items()}
+    )
+
+
+def _fetch_webhooks_for_multiple_events(
+    set_event_types: set[str], database_connection_name: str
+) -> dict[str, set[Webhook]]:
     webhook_id_to_event_type = (
-        WebhookEvent.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        WebhookEvent.objects.using(database_connection_name)
         .filter(event_type__in=set_event_types)
         .values_list("webhook_id", "event_type")
     )
@@ -97,14 +152,14 @@ def get_webhooks_for_multiple_events(
     for webhook_id, event_type in webhook_id_to_event_type:
         webhook_id_to_event_types_map[webhook_id].add(event_type)
 
-    webhooks = Webhook.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).filter(
+    webhooks = Webhook.objects.using(database_connection_name).filter(
         id__in={webhook_id for webhook_id, _ in webhook_id_to_event_type},
         is_active=True,
     )
     app_ids = {webhook.app_id for webhook in webhooks}
 
     apps = (
-        App.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        App.objects.using(database_connection_name)
         .filter(id__in=app_ids, is_active=True, removed_at__isnull=True)
         .prefetch_related("permissions__content_type")
         .in_bulk()